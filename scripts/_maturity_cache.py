@@ -0,0 +1,94 @@
+"""
+Shared maturity reader for the pre-commit hook scripts.
+
+Both hooks only need two scalars from pyproject.toml
+(tool.project.maturity and tool.project.test_strategy_generated).
+The parsed values are cached in a small JSON sidecar keyed by the
+mtime and size of pyproject.toml, so unchanged projects skip the
+TOML parse entirely.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import tomllib  # Python 3.11+ (stdlib, C-accelerated)
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+PYPROJECT_PATH = Path("pyproject.toml")
+CACHE_PATH = Path(".pyproject_maturity.cache.json")
+
+DEFAULT_MATURITY = "EXPLORATION"
+
+
+def _read_cache(st: os.stat_result) -> Optional[Tuple[str, bool]]:
+    """Return cached values if the sidecar matches the current pyproject stat."""
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("mtime_ns") != st.st_mtime_ns or cached.get("size") != st.st_size:
+        return None
+    return cached["maturity"], cached["test_strategy_generated"]
+
+
+def _write_cache(st: os.stat_result, maturity: str, test_strategy: bool) -> None:
+    """Atomically write the sidecar (best effort, failures are ignored)."""
+    payload = {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "maturity": maturity,
+        "test_strategy_generated": test_strategy,
+    }
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=CACHE_PATH.name, dir=CACHE_PATH.parent or "."
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+
+def load_maturity() -> Tuple[str, bool]:
+    """
+    Read maturity level and test strategy status.
+
+    Returns:
+        Tuple of (maturity_level, test_strategy_generated)
+
+    Raises:
+        ImportError: If no TOML parser is available and the cache is stale
+        Exception: Any error raised while parsing pyproject.toml
+    """
+    try:
+        st = PYPROJECT_PATH.stat()
+    except FileNotFoundError:
+        return DEFAULT_MATURITY, False
+
+    cached = _read_cache(st)
+    if cached is not None:
+        return cached
+
+    if tomllib is None:
+        raise ImportError("'tomli' not installed")
+
+    with open(PYPROJECT_PATH, "rb") as f:
+        data = tomllib.load(f)
+
+    project = data.get("tool", {}).get("project", {})
+    maturity = project.get("maturity", DEFAULT_MATURITY)
+    test_strategy = project.get("test_strategy_generated", False)
+
+    _write_cache(st, maturity, test_strategy)
+    return maturity, test_strategy
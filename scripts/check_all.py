@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Run all maturity-dependent pre-commit checks in a single process.
+
+Reads the maturity level once and then runs:
+    1. check_maturity: informational maturity summary (never fails)
+    2. check_test_aspects: test aspect documentation (fails only in PRODUCTION)
+
+Exit codes:
+    0: All checks passed OR maturity < PRODUCTION
+    1: Test aspect documentation incomplete AND maturity = PRODUCTION
+"""
+
+import sys
+
+import check_maturity
+import check_test_aspects
+
+
+def main():
+    """Main entry point for the combined hook."""
+    maturity, test_strategy_done = check_maturity.read_maturity()
+
+    check_maturity.report(maturity, test_strategy_done)
+    sys.stdout.flush()
+
+    sys.exit(check_test_aspects.run(maturity))
+
+
+if __name__ == "__main__":
+    main()
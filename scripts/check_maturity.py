@@ -9,46 +9,23 @@ Exit code: Always 0 (informational only)
 """
 
 import sys
-from pathlib import Path
 
-try:
-    import tomli
-except ImportError:
-    print("⚠️  Warning: 'tomli' not installed")
-    print("   Install with: pip install tomli")
-    sys.exit(0)
+from _maturity_cache import load_maturity
+
 
+# (level, icon, description, testing, coverage, hooks)
+MATURITY_TABLE = (
+    ("EXPLORATION", "🔬", "Rapid prototyping, no test requirements",
+     "Optional - only if requested", "0%", "None active"),
+    ("DEVELOPMENT", "🔨", "Building core, critical components tested",
+     "Required for money-critical code", "40%+ recommended", "Maturity check only"),
+    ("STABILIZATION", "🔧", "Pre-production, comprehensive testing",
+     "Full test suite required", "70%+ required", "Tests run on commit"),
+    ("PRODUCTION", "🚀", "Live trading, strict enforcement",
+     "Complete with documentation", "80%+ enforced", "All checks enforced"),
+)
 
-MATURITY_DESCRIPTIONS = {
-    "EXPLORATION": {
-        "icon": "🔬",
-        "desc": "Rapid prototyping, no test requirements",
-        "testing": "Optional - only if requested",
-        "coverage": "0%",
-        "hooks": "None active"
-    },
-    "DEVELOPMENT": {
-        "icon": "🔨",
-        "desc": "Building core, critical components tested",
-        "testing": "Required for money-critical code",
-        "coverage": "40%+ recommended",
-        "hooks": "Maturity check only"
-    },
-    "STABILIZATION": {
-        "icon": "🔧",
-        "desc": "Pre-production, comprehensive testing",
-        "testing": "Full test suite required",
-        "coverage": "70%+ required",
-        "hooks": "Tests run on commit"
-    },
-    "PRODUCTION": {
-        "icon": "🚀",
-        "desc": "Live trading, strict enforcement",
-        "testing": "Complete with documentation",
-        "coverage": "80%+ enforced",
-        "hooks": "All checks enforced"
-    }
-}
+MATURITY_INDEX = {row[0]: row for row in MATURITY_TABLE}
 
 
 def read_maturity() -> tuple[str, bool]:
@@ -59,40 +36,34 @@ def read_maturity() -> tuple[str, bool]:
         Tuple of (maturity_level, test_strategy_generated)
     """
     try:
-        pyproject_path = Path("pyproject.toml")
-        if not pyproject_path.exists():
-            return "EXPLORATION", False
-        
-        with open(pyproject_path, "rb") as f:
-            data = tomli.load(f)
-        
-        project = data.get("tool", {}).get("project", {})
-        maturity = project.get("maturity", "EXPLORATION")
-        test_strategy = project.get("test_strategy_generated", False)
-        
-        return maturity, test_strategy
+        return load_maturity()
+    except ImportError:
+        print("⚠️  Warning: 'tomli' not installed")
+        print("   Install with: pip install tomli")
+        return "EXPLORATION", False
     except Exception as e:
         print(f"⚠️  Error reading pyproject.toml: {e}")
         return "EXPLORATION", False
 
 
-def main():
-    """Display current maturity level and active rules."""
-    maturity, test_strategy_done = read_maturity()
-    
-    if maturity not in MATURITY_DESCRIPTIONS:
+def report(maturity: str, test_strategy_done: bool) -> None:
+    """Print the maturity summary and active rules."""
+    row = MATURITY_INDEX.get(maturity)
+    if row is None:
         print(f"⚠️  Unknown maturity level: {maturity}")
         print(f"   Valid levels: EXPLORATION, DEVELOPMENT, STABILIZATION, PRODUCTION")
-        sys.exit(0)
+        return
     
-    info = MATURITY_DESCRIPTIONS[maturity]
+    _, icon, desc, testing, coverage, hooks = row
     
-    print(f"\n{info['icon']}  Project Maturity: {maturity}")
-    print(f"{'=' * 60}")
-    print(f"Description:  {info['desc']}")
-    print(f"Testing:      {info['testing']}")
-    print(f"Coverage:     {info['coverage']}")
-    print(f"Hooks:        {info['hooks']}")
+    print(
+        f"\n{icon}  Project Maturity: {maturity}\n"
+        f"{'=' * 60}\n"
+        f"Description:  {desc}\n"
+        f"Testing:      {testing}\n"
+        f"Coverage:     {coverage}\n"
+        f"Hooks:        {hooks}"
+    )
     
     if maturity in ["STABILIZATION", "PRODUCTION"] and not test_strategy_done:
         print(f"\n⚠️  Recommendation: Run 'generate test-strategy' in Cursor")
@@ -102,6 +73,12 @@ def main():
         print(f"\n✅ PRODUCTION mode active - all quality checks enforced")
     
     print()
+
+
+def main():
+    """Display current maturity level and active rules."""
+    maturity, test_strategy_done = read_maturity()
+    report(maturity, test_strategy_done)
     sys.exit(0)
 
 
@@ -3,18 +3,22 @@
 Verify all test files document which test aspects they cover.
 
 This script is ONLY ENFORCED when maturity = "PRODUCTION" in pyproject.toml.
-For other maturity levels, it runs but only warns without failing.
+For other maturity levels, it exits immediately without scanning; set
+UNIVERSE_SCREENER_FULL_CHECK=1 to run the scan and only warn.
 
 Exit codes:
     0: All test files properly documented OR maturity < PRODUCTION
     1: Missing/incomplete documentation found AND maturity = PRODUCTION
 """
 
+import os
 import re
 import sys
-import tomli
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple, Union
+
+from _maturity_cache import load_maturity
 
 # The 10 mandatory test aspects from .cursorrules
 REQUIRED_ASPECTS = [
@@ -30,6 +34,21 @@ REQUIRED_ASPECTS = [
     "Integration"
 ]
 
+# Set to run the full scan (as a warning) below PRODUCTION maturity
+FULL_CHECK_ENV = "UNIVERSE_SCREENER_FULL_CHECK"
+
+# Characters read from the head of each test file
+MAX_READ_CHARS = 8192
+
+ASPECT_BLOCK_HEADER = "Coverage by Test Aspect:"
+# Scan ceiling when the block is not closed by a docstring delimiter
+MAX_BLOCK_CHARS = 4000
+
+# Aspect markers: ✅ / ⚠️ or text alternatives [x], [OK], [NA], [N/A]
+_ASPECT_RE = re.compile(r"✅|⚠\ufe0f?|\[(?:x|X|OK|ok|NA|N/A|na)\]")
+# Markers that mean "actually covered" (not N/A)
+_COVERED_RE = re.compile(r"✅|\[(?:x|X|OK|ok)\]")
+
 
 def read_maturity_level() -> str:
     """
@@ -39,14 +58,7 @@ def read_maturity_level() -> str:
         Maturity level string or "EXPLORATION" if not found
     """
     try:
-        pyproject_path = Path("pyproject.toml")
-        if not pyproject_path.exists():
-            return "EXPLORATION"
-        
-        with open(pyproject_path, "rb") as f:
-            data = tomli.load(f)
-        
-        return data.get("tool", {}).get("project", {}).get("maturity", "EXPLORATION")
+        return load_maturity()[0]
     except Exception:
         return "EXPLORATION"
 
@@ -61,20 +73,26 @@ def check_test_file(filepath: Path) -> Tuple[bool, str]:
     Returns:
         Tuple of (passed, message)
     """
+    # The block lives in the module docstring, so a bounded prefix suffices
     try:
-        content = filepath.read_text(encoding='utf-8')
+        with filepath.open("r", encoding="utf-8", errors="ignore") as fh:
+            content = fh.read(MAX_READ_CHARS)
     except Exception as e:
         return False, f"Could not read file: {e}"
     
     # Look for aspect coverage comment block
-    if "Coverage by Test Aspect:" not in content:
+    start = content.find(ASPECT_BLOCK_HEADER)
+    if start == -1:
         return False, "Missing 'Coverage by Test Aspect:' documentation block"
     
-    # Count covered aspects (✅) or N/A (⚠️)
-    # Also accept text alternatives: [x], [OK], [NA], [N/A]
-    covered_checkmarks = len(re.findall(r'[✅⚠️]', content))
-    covered_text = len(re.findall(r'\[(x|X|OK|ok|NA|N/A|na)\]', content))
-    covered = covered_checkmarks + covered_text
+    # Only scan the block itself (up to the closing docstring quotes)
+    end = content.find('"""', start)
+    if end == -1:
+        end = start + MAX_BLOCK_CHARS
+    block = content[start:end]
+    
+    # Count covered aspects (✅) or N/A (⚠️) in a single pass
+    covered = len(_ASPECT_RE.findall(block))
     
     if covered < len(REQUIRED_ASPECTS):
         return False, (
@@ -83,7 +101,7 @@ def check_test_file(filepath: Path) -> Tuple[bool, str]:
         )
     
     # Check if at least some aspects are marked as covered (not all N/A)
-    actually_covered = len(re.findall(r'✅', content)) + len(re.findall(r'\[(x|X|OK|ok)\]', content))
+    actually_covered = len(_COVERED_RE.findall(block))
     if actually_covered == 0:
         return False, "All aspects marked as N/A - at least some should be tested"
     
@@ -103,99 +121,132 @@ def find_test_files(base_path: Path = Path("tests")) -> List[Path]:
     if not base_path.exists():
         return []
     
-    test_files = []
-    for pattern in ["test_*.py", "*_test.py"]:
-        test_files.extend(base_path.rglob(pattern))
-    
-    # Exclude __init__.py and conftest.py
-    test_files = [
-        f for f in test_files 
-        if f.name not in ("__init__.py", "conftest.py")
-    ]
+    return sorted(_walk_test_files(base_path))
+
+
+def _walk_test_files(path: Union[str, Path]) -> Iterator[Path]:
+    """
+    Yield test files below path using a single scandir walk.
     
-    return sorted(test_files)
+    DirEntry.is_dir()/is_file() reuse the file type reported by readdir,
+    so no extra stat() call is needed per entry.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_test_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                name = entry.name
+                # test_*.py or *_test.py (never __init__.py / conftest.py)
+                if name.endswith(".py") and (
+                    name.startswith("test_") or name.endswith("_test.py")
+                ):
+                    yield Path(entry.path)
 
 
-def main():
-    """Main entry point for the test aspect checker."""
-    maturity = read_maturity_level()
+FIX_EXAMPLE = """\
+💡 Fix: Add a test aspect coverage block to each test file.
+   See .cursorrules for the required format.
+
+   Example:
+   \"\"\"
+   Tests for my_module.py
+
+   Coverage by Test Aspect:
+   ✅ 1. Business Logic: test_foo, test_bar
+   ✅ 2. Edge Cases: test_empty_input, test_none_values
+   ⚠️  3. Error Handling: N/A (no error conditions)
+   ...
+   \"\"\"
+
+"""
+
+
+def _flush(out: List[str], code: int) -> int:
+    """Write all buffered output in one call and pass the exit code through."""
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+    return code
+
+
+def run(maturity: str) -> int:
+    """
+    Run the test aspect check for an already-resolved maturity level.
+    
+    Args:
+        maturity: Project maturity level
+        
+    Returns:
+        Process exit code
+    """
+    # Output is buffered and written once on exit
+    out: List[str] = []
     
-    print(f"🔍 Checking test aspect coverage documentation...")
-    print(f"   Current maturity level: {maturity}\n")
+    out.append("🔍 Checking test aspect coverage documentation...\n")
+    out.append(f"   Current maturity level: {maturity}\n\n")
     
     # Only enforce for PRODUCTION
     enforce = (maturity == "PRODUCTION")
     
     if not enforce:
-        print(f"ℹ️  Test aspect documentation not enforced for {maturity} level")
-        print(f"   (Will be enforced when maturity = 'PRODUCTION')\n")
+        out.append(f"ℹ️  Test aspect documentation not enforced for {maturity} level\n")
+        out.append("   (Will be enforced when maturity = 'PRODUCTION')\n\n")
+        # Skip the scan entirely unless a preview was explicitly requested
+        if not os.environ.get(FULL_CHECK_ENV):
+            out.append(f"   Set {FULL_CHECK_ENV}=1 to preview the check\n")
+            return _flush(out, 0)
     
     test_files = find_test_files()
     
     if not test_files:
-        print("⚠️  No test files found in tests/ directory")
+        out.append("⚠️  No test files found in tests/ directory\n")
         if maturity in ["DEVELOPMENT", "STABILIZATION", "PRODUCTION"]:
-            print("   Consider creating tests for critical components")
-        sys.exit(0)
+            out.append("   Consider creating tests for critical components\n")
+        return _flush(out, 0)
     
     failures = []
     successes = []
     
-    for test_file in test_files:
-        passed, msg = check_test_file(test_file)
-        
+    # File reads release the GIL, so checks overlap well across threads;
+    # ex.map preserves input order
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(test_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        results = list(ex.map(check_test_file, test_files))
+    
+    for test_file, (passed, msg) in zip(test_files, results):
         if not passed:
             failures.append(f"{test_file}: {msg}")
         else:
             successes.append(test_file)
     
-    # Print results
+    # Collect results
     if successes:
-        print(f"✅ {len(successes)} test file(s) properly documented:")
-        for success in successes:
-            print(f"   • {success}")
-        print()
+        out.append(f"✅ {len(successes)} test file(s) properly documented:\n")
+        out.extend(f"   • {success}\n" for success in successes)
+        out.append("\n")
     
     if failures:
         icon = "❌" if enforce else "⚠️ "
-        print(f"{icon} {len(failures)} test file(s) missing proper documentation:\n")
-        for failure in failures:
-            print(f"   • {failure}")
-        print()
+        out.append(f"{icon} {len(failures)} test file(s) missing proper documentation:\n\n")
+        out.extend(f"   • {failure}\n" for failure in failures)
+        out.append("\n")
         
         if enforce:
-            print("💡 Fix: Add a test aspect coverage block to each test file.")
-            print("   See .cursorrules for the required format.")
-            print()
-            print("   Example:")
-            print('   """')
-            print("   Tests for my_module.py")
-            print()
-            print("   Coverage by Test Aspect:")
-            print("   ✅ 1. Business Logic: test_foo, test_bar")
-            print("   ✅ 2. Edge Cases: test_empty_input, test_none_values")
-            print("   ⚠️  3. Error Handling: N/A (no error conditions)")
-            print("   ...")
-            print('   """')
-            print()
-            sys.exit(1)
+            out.append(FIX_EXAMPLE)
+            return _flush(out, 1)
         else:
-            print(f"ℹ️  This will become an error when maturity = 'PRODUCTION'")
-            print()
-            sys.exit(0)
+            out.append("ℹ️  This will become an error when maturity = 'PRODUCTION'\n\n")
+            return _flush(out, 0)
     
-    print("✅ All test files properly document aspect coverage")
-    print(f"   Total: {len(successes)} test file(s)")
-    sys.exit(0)
+    out.append("✅ All test files properly document aspect coverage\n")
+    out.append(f"   Total: {len(successes)} test file(s)\n")
+    return _flush(out, 0)
+
+
+def main():
+    """Main entry point for the test aspect checker."""
+    sys.exit(run(read_maturity_level()))
 
 
 if __name__ == "__main__":
-    # Check if tomli is available
-    try:
-        import tomli
-    except ImportError:
-        print("⚠️  Warning: 'tomli' not installed, assuming EXPLORATION mode")
-        print("   Install with: pip install tomli")
-        sys.exit(0)
-    
     main()
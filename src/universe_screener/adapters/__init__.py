@@ -24,13 +24,32 @@ Design Principles:
     - No business logic in adapters
 """
 
-from universe_screener.adapters.mock_provider import MockUniverseProvider
-from universe_screener.adapters.cached_provider import CachedUniverseProvider
-from universe_screener.adapters.console_logger import ConsoleAuditLogger
-from universe_screener.adapters.metrics_collector import InMemoryMetricsCollector
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from universe_screener.adapters.mock_provider import MockUniverseProvider
+    from universe_screener.adapters.cached_provider import CachedUniverseProvider
+    from universe_screener.adapters.console_logger import ConsoleAuditLogger
+    from universe_screener.adapters.metrics_collector import InMemoryMetricsCollector
+
+    SimpleMetricsCollector = InMemoryMetricsCollector
+
+# Adapters are imported lazily (PEP 562) so importing one adapter does not
+# pull in the dependencies of all the others.
+_LAZY_IMPORTS = {
+    "MockUniverseProvider": "universe_screener.adapters.mock_provider",
+    "CachedUniverseProvider": "universe_screener.adapters.cached_provider",
+    "ConsoleAuditLogger": "universe_screener.adapters.console_logger",
+    "InMemoryMetricsCollector": "universe_screener.adapters.metrics_collector",
+}
 
 # Alias for backward compatibility
-SimpleMetricsCollector = InMemoryMetricsCollector
+_ALIASES = {
+    "SimpleMetricsCollector": "InMemoryMetricsCollector",
+}
 
 __all__ = [
     "MockUniverseProvider",
@@ -40,3 +59,18 @@ __all__ = [
     "SimpleMetricsCollector",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import adapter classes on first access."""
+    attr = _ALIASES.get(name, name)
+    module_name = _LAZY_IMPORTS.get(attr)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
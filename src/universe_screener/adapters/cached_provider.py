@@ -13,8 +13,9 @@ Design Notes:
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict, defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, DefaultDict, Dict, List, Optional, Protocol, Tuple
 
 from universe_screener.caching.cache_manager import CacheManager, CacheConfig
 from universe_screener.domain.entities import Asset, AssetClass
@@ -28,6 +29,9 @@ from universe_screener.domain.value_objects import (
 
 logger = logging.getLogger(__name__)
 
+# Max number of asset lists whose symbol digest is memoized
+_DIGEST_CACHE_SIZE = 64
+
 
 class UniverseProviderProtocol(Protocol):
     """Protocol for universe data providers."""
@@ -115,8 +119,13 @@ class CachedUniverseProvider:
         self.metrics = metrics_collector
         
         # Track cache statistics per operation
-        self._cache_hits: Dict[str, int] = {}
-        self._cache_misses: Dict[str, int] = {}
+        self._cache_hits: DefaultDict[str, int] = defaultdict(int)
+        self._cache_misses: DefaultDict[str, int] = defaultdict(int)
+        
+        # Symbol digests by id() of the asset list (pipeline stages reuse
+        # the same list object). Entries keep a reference to the list so
+        # the id cannot be recycled while cached.
+        self._digest_cache: OrderedDict[int, Tuple[List[Asset], int, str]] = OrderedDict()
 
     def get_assets(self, date: datetime, asset_class: AssetClass) -> List[Asset]:
         """
@@ -154,24 +163,23 @@ class CachedUniverseProvider:
         operation = "bulk_load_market_data"
         
         # Create cache key from parameters
-        asset_symbols = sorted([a.symbol for a in assets])
         cache_key = CacheManager.make_key(
             operation,
-            symbols=tuple(asset_symbols),
-            start=start_date.isoformat(),
-            end=end_date.isoformat(),
+            symbols=self._get_symbols_digest(assets),
+            start=int(start_date.timestamp()),
+            end=int(end_date.timestamp()),
         )
         
         # Try cache first
         cached = self.cache.get(cache_key)
         if cached is not None:
             self._record_hit(operation)
-            logger.debug(f"Cache HIT for {operation}: {len(assets)} assets")
+            logger.debug("Cache HIT for %s: %d assets", operation, len(assets))
             return cached
         
         # Cache miss: fetch from provider
         self._record_miss(operation)
-        logger.debug(f"Cache MISS for {operation}: {len(assets)} assets")
+        logger.debug("Cache MISS for %s: %d assets", operation, len(assets))
         
         result = self.provider.bulk_load_market_data(assets, start_date, end_date)
         
@@ -198,23 +206,22 @@ class CachedUniverseProvider:
         operation = "bulk_load_metadata"
         
         # Create cache key
-        asset_symbols = sorted([a.symbol for a in assets])
         cache_key = CacheManager.make_key(
             operation,
-            symbols=tuple(asset_symbols),
-            date=date.isoformat(),
+            symbols=self._get_symbols_digest(assets),
+            date=int(date.timestamp()),
         )
         
         # Try cache first
         cached = self.cache.get(cache_key)
         if cached is not None:
             self._record_hit(operation)
-            logger.debug(f"Cache HIT for {operation}: {len(assets)} assets")
+            logger.debug("Cache HIT for %s: %d assets", operation, len(assets))
             return cached
         
         # Cache miss: fetch from provider
         self._record_miss(operation)
-        logger.debug(f"Cache MISS for {operation}: {len(assets)} assets")
+        logger.debug("Cache MISS for %s: %d assets", operation, len(assets))
         
         result = self.provider.bulk_load_metadata(assets, date)
         
@@ -283,6 +290,8 @@ class CachedUniverseProvider:
             Dict with cache stats and operation-specific hit/miss counts
         """
         cache_stats = self.cache.get_stats()
+        hits = self._cache_hits
+        misses = self._cache_misses
         
         return {
             "cache": {
@@ -295,17 +304,39 @@ class CachedUniverseProvider:
                 "entries": cache_stats.current_entries,
             },
             "operations": {
-                op: {
-                    "hits": self._cache_hits.get(op, 0),
-                    "misses": self._cache_misses.get(op, 0),
-                }
-                for op in ["bulk_load_market_data", "bulk_load_metadata"]
+                "bulk_load_market_data": {
+                    "hits": hits.get("bulk_load_market_data", 0),
+                    "misses": misses.get("bulk_load_market_data", 0),
+                },
+                "bulk_load_metadata": {
+                    "hits": hits.get("bulk_load_metadata", 0),
+                    "misses": misses.get("bulk_load_metadata", 0),
+                },
             },
         }
 
+    def _get_symbols_digest(self, assets: List[Asset]) -> str:
+        """
+        Get the symbol digest, reusing it for repeated calls with the same list.
+
+        Assumes asset lists are not mutated in place between calls; a
+        length change is detected and forces recomputation.
+        """
+        list_id = id(assets)
+        entry = self._digest_cache.get(list_id)
+        if entry is not None and entry[0] is assets and entry[1] == len(assets):
+            self._digest_cache.move_to_end(list_id)
+            return entry[2]
+
+        digest = CacheManager.digest_symbols(a.symbol for a in assets)
+        self._digest_cache[list_id] = (assets, len(assets), digest)
+        if len(self._digest_cache) > _DIGEST_CACHE_SIZE:
+            self._digest_cache.popitem(last=False)
+        return digest
+
     def _record_hit(self, operation: str) -> None:
         """Record a cache hit."""
-        self._cache_hits[operation] = self._cache_hits.get(operation, 0) + 1
+        self._cache_hits[operation] += 1
         
         if self.metrics:
             self.metrics.record_metric(
@@ -316,7 +347,7 @@ class CachedUniverseProvider:
 
     def _record_miss(self, operation: str) -> None:
         """Record a cache miss."""
-        self._cache_misses[operation] = self._cache_misses.get(operation, 0) + 1
+        self._cache_misses[operation] += 1
         
         if self.metrics:
             self.metrics.record_metric(
@@ -6,7 +6,8 @@ A simple audit logger that outputs to the console.
 
 from __future__ import annotations
 
-from datetime import datetime
+import sys
+import time
 from typing import Any, Dict, Optional
 
 from universe_screener.domain.entities import Asset
@@ -24,10 +25,21 @@ class ConsoleAuditLogger:
         """
         self._verbose = verbose
         self._correlation_id: Optional[str] = None
+        self._corr_short = "--------"
+        
+        # Formatted timestamp cache (second resolution)
+        self._ts_second = -1
+        self._ts_str = ""
+
+    @property
+    def logs_filtered_assets(self) -> bool:
+        """Whether log_asset_filtered writes anything (verbose mode only)."""
+        return self._verbose
 
     def set_correlation_id(self, correlation_id: str) -> None:
         """Set correlation ID for subsequent log entries."""
         self._correlation_id = correlation_id
+        self._corr_short = correlation_id[:8] if correlation_id else "--------"
 
     def log_stage_start(
         self,
@@ -74,6 +86,9 @@ class ConsoleAuditLogger:
 
     def _log(self, level: str, message: str) -> None:
         """Internal logging method."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        corr_id = self._correlation_id[:8] if self._correlation_id else "--------"
-        print(f"[{timestamp}] [{corr_id}] [{level:5}] {message}")
+        # Re-format the timestamp only when the second changes
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        sys.stdout.write(f"[{self._ts_str}] [{self._corr_short}] [{level:5}] {message}\n")
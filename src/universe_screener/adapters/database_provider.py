@@ -5,9 +5,11 @@ This module provides a template for integrating with a real database.
 The actual schema and connection details are TBD (from colleague).
 
 Design Notes:
-    - Connection pooling prepared (placeholder)
+    - Connection pooling via psycopg2 ThreadedConnectionPool (optional dependency)
     - Batch query optimization prepared (placeholder)
     - Point-in-time data access via snapshot_id
+    - Snapshot-pinned results cached read-aside (in-process + optional
+      shared tier); they are immutable, so entries never expire
     - Implements UniverseProviderProtocol
 
 Schema Requirements (TBD):
@@ -44,21 +46,43 @@ Schema Requirements (TBD):
         - ...
 
 Query Optimization Hints:
-    - Use batch queries (IN clause) instead of individual queries
+    - Pass symbol sets as one array parameter (= ANY(%s)) instead of an
+      IN list: one plan regardless of list length, no per-batch re-parse
     - Consider partitioning market_data by date
     - Index on (symbol, date) for market_data
-    - Consider materialized views for common aggregations
+    - Materialized view (mv_availability) for rolling data completeness
 """
 
 from __future__ import annotations
 
 import logging
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Protocol
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
+from universe_screener.caching.cache_manager import CacheManager, CacheManagerProtocol
 from universe_screener.domain.entities import Asset, AssetClass
 from universe_screener.domain.value_objects import (
     MarketData,
+    MarketDataColumns,
+    MarketDataColumnsDict,
     MarketDataDict,
     MetadataDict,
     QualityMetrics,
@@ -67,6 +91,32 @@ from universe_screener.domain.value_objects import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Symbols per query: = ANY(array) plans once regardless of length, so
+# batching is only needed to bound the size of a single result set
+MAX_SYMBOLS_PER_QUERY = 10_000
+
+# Rows fetched per round trip when streaming large results
+STREAM_PREFETCH_ROWS = 10_000
+
+# Lookbacks (days) precomputed in the mv_availability materialized view
+AVAILABILITY_WINDOWS = (30, 60, 90, 252)
+
+# Try to import psycopg2 for PostgreSQL connection pooling
+try:
+    from psycopg2.pool import ThreadedConnectionPool
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+
+def _as_datetime(value: Any) -> datetime:
+    """Convert a DATE column value to the datetime used by value objects."""
+    if isinstance(value, datetime):
+        return value
+    return datetime(value.year, value.month, value.day)
+
 
 class ConnectionPoolProtocol(Protocol):
     """Protocol for database connection pool."""
@@ -97,7 +147,6 @@ class DatabaseUniverseProvider:
         provider = DatabaseUniverseProvider(
             connection_pool=pool,
             schema="screener",
-            batch_size=500,
         )
     """
 
@@ -105,8 +154,11 @@ class DatabaseUniverseProvider:
         self,
         connection_pool: Optional[ConnectionPoolProtocol] = None,
         schema: str = "public",
-        batch_size: int = 500,
+        batch_size: int = MAX_SYMBOLS_PER_QUERY,
         query_timeout_seconds: float = 30.0,
+        snapshot_cache: Optional[CacheManagerProtocol] = None,
+        shared_cache: Optional[CacheManagerProtocol] = None,
+        stream_prefetch_rows: int = STREAM_PREFETCH_ROWS,
     ) -> None:
         """
         Initialize database provider.
@@ -116,11 +168,23 @@ class DatabaseUniverseProvider:
             schema: Database schema name
             batch_size: Max symbols per batch query
             query_timeout_seconds: Query timeout
+            snapshot_cache: In-process cache for snapshot-pinned results
+                (creates a CacheManager if None)
+            shared_cache: Optional second tier shared between processes
+                (e.g. Redis-backed); must treat ttl_seconds=0 as no expiry
+            stream_prefetch_rows: Rows per round trip for market data
         """
         self.pool = connection_pool
         self.schema = schema
         self.batch_size = batch_size
         self.query_timeout = query_timeout_seconds
+        self.stream_prefetch_rows = stream_prefetch_rows
+        self._snapshot_cache = snapshot_cache if snapshot_cache is not None else CacheManager()
+        self._shared_cache = shared_cache
+        # Per-run memo, active only inside request_scope()
+        self._request_memo: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+            f"db_request_memo_{id(self)}", default=None
+        )
         
         # TODO: Validate connection on init
         logger.info(
@@ -167,7 +231,8 @@ class DatabaseUniverseProvider:
         """
         Bulk load market data for all assets.
         
-        Uses batch queries to minimize round trips.
+        Uses batch queries to minimize round trips. Results pinned to a
+        snapshot_id are served from the snapshot caches when available.
         
         Args:
             assets: Assets to load data for
@@ -178,30 +243,123 @@ class DatabaseUniverseProvider:
         Returns:
             Market data by symbol
             
-        SQL Template (TBD):
-            SELECT symbol, date, open, high, low, close, volume, adjusted_close
+        SQL:
+            SELECT symbol, date, open, high, low, close, volume
             FROM {schema}.market_data
-            WHERE symbol IN (:symbols)
-              AND date BETWEEN :start_date AND :end_date
+            WHERE symbol = ANY(%s)
+              AND date BETWEEN %s AND %s
             ORDER BY symbol, date
         """
-        # TODO: Implement when schema is defined
-        # Batch query optimization: split symbols into chunks
-        result: MarketDataDict = {}
+        return self._cached_call(
+            "bulk_load_market_data",
+            snapshot_id,
+            assets,
+            lambda: self._query_market_data(assets, start_date, end_date),
+            start=start_date.isoformat(),
+            end=end_date.isoformat(),
+        )
+
+    def _query_market_data(
+        self,
+        assets: List[Asset],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> MarketDataDict:
+        """Run the batched market data query (see bulk_load_market_data)."""
+        result: MarketDataDict = {a.symbol: [] for a in assets}
+        query = self._market_data_query()
         
         symbol_batches = self._create_batches(
-            [a.symbol for a in assets],
+            (a.symbol for a in assets),
             self.batch_size,
         )
         
         for batch in symbol_batches:
-            # TODO: Execute batch query
-            # batch_data = self._execute_market_data_query(batch, start_date, end_date)
-            # result.update(batch_data)
-            pass
+            # The whole batch is bound as a single text[] parameter; rows
+            # are decoded as they stream in
+            rows = self._stream_rows(query, (batch, start_date, end_date))
+            for symbol, bar_date, open_, high, low, close, volume in rows:
+                result[symbol].append(
+                    MarketData(
+                        date=_as_datetime(bar_date),
+                        open=float(open_),
+                        high=float(high),
+                        low=float(low),
+                        close=float(close),
+                        volume=int(volume),
+                    )
+                )
         
-        raise NotImplementedError(
-            "DatabaseUniverseProvider.bulk_load_market_data() - Schema TBD from colleague"
+        return result
+
+    def bulk_load_market_columns(
+        self,
+        assets: List[Asset],
+        start_date: datetime,
+        end_date: datetime,
+        snapshot_id: Optional[str] = None,
+    ) -> MarketDataColumnsDict:
+        """
+        Bulk load market data in columnar form.
+        
+        Same query as bulk_load_market_data, but result tuples are
+        transposed straight into packed arrays: no dict or MarketData
+        object is created per row.
+        
+        Args:
+            assets: Assets to load data for
+            start_date: Start of date range
+            end_date: End of date range
+            snapshot_id: Optional snapshot ID
+            
+        Returns:
+            Columnar market data by symbol
+        """
+        return self._cached_call(
+            "bulk_load_market_columns",
+            snapshot_id,
+            assets,
+            lambda: self._query_market_columns(assets, start_date, end_date),
+            start=start_date.isoformat(),
+            end=end_date.isoformat(),
+        )
+
+    def _query_market_columns(
+        self,
+        assets: List[Asset],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> MarketDataColumnsDict:
+        """Run the batched market data query into columns."""
+        empty = MarketDataColumns.from_rows(())
+        result: MarketDataColumnsDict = {a.symbol: empty for a in assets}
+        query = self._market_data_query()
+        
+        for batch in self._create_batches((a.symbol for a in assets), self.batch_size):
+            rows = self._stream_rows(query, (batch, start_date, end_date))
+            # Rows are ordered by symbol, date: each group is one series,
+            # so only one symbol's rows are held at a time
+            for symbol, group in groupby(rows, key=itemgetter(0)):
+                _, dates, opens, highs, lows, closes, volumes = zip(*group)
+                result[symbol] = MarketDataColumns(
+                    dates=tuple(map(_as_datetime, dates)),
+                    open=array("d", opens),
+                    high=array("d", highs),
+                    low=array("d", lows),
+                    close=array("d", closes),
+                    volume=array("q", volumes),
+                )
+        
+        return result
+
+    def _market_data_query(self) -> str:
+        """Market data SQL shared by the row and column loaders."""
+        # TODO: Apply snapshot_id once the schema defines it
+        return (
+            "SELECT symbol, date, open, high, low, close, volume "
+            f"FROM {self.schema}.market_data "
+            "WHERE symbol = ANY(%s) AND date BETWEEN %s AND %s "
+            "ORDER BY symbol, date"
         )
 
     def bulk_load_metadata(
@@ -224,10 +382,20 @@ class DatabaseUniverseProvider:
         SQL Template (TBD):
             SELECT symbol, sector, industry, market_cap, ...
             FROM {schema}.asset_metadata
-            WHERE symbol IN (:symbols)
+            WHERE symbol = ANY(:symbols)
               AND date <= :date
             ORDER BY symbol, date DESC  -- Get latest before date
         """
+        return self._cached_call(
+            "bulk_load_metadata",
+            snapshot_id,
+            assets,
+            lambda: self._query_metadata(assets, date),
+            date=date.isoformat(),
+        )
+
+    def _query_metadata(self, assets: List[Asset], date: datetime) -> MetadataDict:
+        """Run the metadata query (see bulk_load_metadata)."""
         # TODO: Implement when schema is defined
         raise NotImplementedError(
             "DatabaseUniverseProvider.bulk_load_metadata() - Schema TBD from colleague"
@@ -250,60 +418,324 @@ class DatabaseUniverseProvider:
         Returns:
             Quality metrics by symbol
             
-        SQL Template (TBD):
-            SELECT symbol,
-                   COUNT(*) as available_days,
-                   :expected_days as expected_days,
-                   COUNT(*) / :expected_days as completeness
-            FROM {schema}.market_data
-            WHERE symbol IN (:symbols)
-              AND date BETWEEN :start_date AND :end_date
-            GROUP BY symbol
+        Lookbacks in AVAILABILITY_WINDOWS are answered from the
+        mv_availability materialized view (see availability_view_sql),
+        one index lookup per symbol; any other lookback aggregates
+        market_data directly. Both count bars in (date - lookback, date]:
+        the view row at a symbol's latest bar counts the window ending at
+        that bar, so bars the two windows do not share are subtracted
+        (none for symbols with data at date). Symbols without data in the
+        window are omitted.
+        
+        Expected days count weekdays (every day for crypto); exchange
+        holidays are not subtracted.
+            
+        SQL (materialized view):
+            SELECT v.symbol,
+                   v.days_{lookback} - (
+                       SELECT COUNT(*) FROM {schema}.market_data m
+                       WHERE m.symbol = v.symbol
+                         AND m.date > v.date - INTERVAL '{lookback} days'
+                         AND m.date <= %s  -- window start
+                   ) AS available_days,
+                   v.date AS last_date
+            FROM (
+                SELECT DISTINCT ON (symbol) symbol, date, days_{lookback}
+                FROM {schema}.mv_availability
+                WHERE symbol = ANY(%s) AND date > %s AND date <= %s
+                ORDER BY symbol, date DESC
+            ) v
         """
-        # TODO: Implement when schema is defined
-        raise NotImplementedError(
-            "DatabaseUniverseProvider.check_data_availability() - Schema TBD from colleague"
+        return self._cached_call(
+            "check_data_availability",
+            None,
+            assets,
+            lambda: self._query_availability(assets, date, lookback_days),
+            date=date.isoformat(),
+            lookback=lookback_days,
         )
 
-    def _create_batches(
+    def _query_availability(
         self,
-        items: List[str],
-        batch_size: int,
-    ) -> List[List[str]]:
-        """Split items into batches."""
+        assets: List[Asset],
+        date: datetime,
+        lookback_days: int,
+    ) -> QualityMetricsDict:
+        """Run the availability query (see check_data_availability)."""
+        window_start = date - timedelta(days=lookback_days)
+        if lookback_days in AVAILABILITY_WINDOWS:
+            # The view row at last_date counts (last_date - lookback, last_date];
+            # drop its bars in (last_date - lookback, window_start] so the
+            # count covers (window_start, date] like the fallback below
+            query = (
+                f"SELECT v.symbol, v.days_{lookback_days} - ("
+                f"SELECT COUNT(*) FROM {self.schema}.market_data m "
+                "WHERE m.symbol = v.symbol "
+                f"AND m.date > v.date - INTERVAL '{lookback_days} days' "
+                "AND m.date <= %s"
+                ") AS available_days, v.date AS last_date "
+                "FROM ("
+                f"SELECT DISTINCT ON (symbol) symbol, date, days_{lookback_days} "
+                f"FROM {self.schema}.mv_availability "
+                "WHERE symbol = ANY(%s) AND date > %s AND date <= %s "
+                "ORDER BY symbol, date DESC"
+                ") v"
+            )
+            lead_params: Tuple[Any, ...] = (window_start,)
+        else:
+            query = (
+                "SELECT symbol, COUNT(*) AS available_days, MAX(date) AS last_date "
+                f"FROM {self.schema}.market_data "
+                "WHERE symbol = ANY(%s) AND date > %s AND date <= %s "
+                "GROUP BY symbol"
+            )
+            lead_params = ()
+        
+        asset_classes = {a.symbol: a.asset_class for a in assets}
+        # Expected days depend only on the asset class: compute once per class
+        expected = {
+            asset_class: self._expected_days(asset_class, date, lookback_days)
+            for asset_class in set(asset_classes.values())
+        }
+        
+        result: QualityMetricsDict = {}
+        for batch in self._create_batches(asset_classes, self.batch_size):
+            params = lead_params + (batch, window_start, date)
+            for row in self._execute_query(query, params):
+                symbol = row["symbol"]
+                result[symbol] = QualityMetrics(
+                    missing_days=max(
+                        expected[asset_classes[symbol]] - row["available_days"], 0
+                    ),
+                    last_available_date=_as_datetime(row["last_date"]),
+                )
+        return result
+
+    def availability_view_sql(self) -> List[str]:
+        """
+        Statements creating the availability materialized view.
+        
+        Refresh nightly (after market data loads) with:
+            REFRESH MATERIALIZED VIEW CONCURRENTLY {schema}.mv_availability
+        
+        Returns:
+            DDL statements, in execution order
+        """
+        columns = ",\n".join(
+            f"    COUNT(*) OVER (PARTITION BY symbol ORDER BY date "
+            f"RANGE BETWEEN INTERVAL '{days - 1} days' PRECEDING AND CURRENT ROW) "
+            f"AS days_{days}"
+            for days in AVAILABILITY_WINDOWS
+        )
         return [
-            items[i : i + batch_size]
-            for i in range(0, len(items), batch_size)
+            f"CREATE MATERIALIZED VIEW {self.schema}.mv_availability AS\n"
+            f"SELECT symbol, date,\n{columns}\n"
+            f"FROM {self.schema}.market_data",
+            # Unique index is required for REFRESH ... CONCURRENTLY
+            f"CREATE UNIQUE INDEX mv_availability_symbol_date "
+            f"ON {self.schema}.mv_availability (symbol, date)",
         ]
 
+    @staticmethod
+    def _expected_days(asset_class: AssetClass, date: datetime, lookback_days: int) -> int:
+        """Days with expected data in the lookback window ending at date."""
+        if asset_class == AssetClass.CRYPTO:
+            return lookback_days
+        
+        # Whole weeks hold 5 weekdays; count the leftover days directly
+        weeks, rest = divmod(lookback_days, 7)
+        first_day = date - timedelta(days=lookback_days - 1)
+        extra = sum(
+            1 for i in range(rest) if (first_day + timedelta(days=i)).weekday() < 5
+        )
+        return weeks * 5 + extra
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        """
+        Memoize identical calls for the duration of one screening run.
+        
+        Inside the scope, repeated calls with the same arguments (live or
+        snapshot-pinned) are answered from a per-run memo instead of the
+        database. Scopes are per context (thread / task); nested scopes
+        share the outer memo.
+        
+        Usage:
+            with provider.request_scope():
+                pipeline.screen(request)
+        """
+        if self._request_memo.get() is not None:
+            yield
+            return
+        token = self._request_memo.set({})
+        try:
+            yield
+        finally:
+            self._request_memo.reset(token)
+
+    def _cached_call(
+        self,
+        operation: str,
+        snapshot_id: Optional[str],
+        assets: List[Asset],
+        load: Callable[[], T],
+        **params: Any,
+    ) -> T:
+        """
+        Run a bulk query through the request memo and snapshot caches.
+        
+        Live results (no snapshot_id) may change between runs, so they
+        are only memoized within a request_scope; snapshot-pinned results
+        also go through the read-aside tiers (see CachedUniverseProvider
+        for TTL-based caching of live data).
+        
+        Args:
+            operation: Public method name (key prefix)
+            snapshot_id: Snapshot the query is pinned to, if any
+            assets: Assets queried
+            load: Runs the query on a miss
+            **params: Remaining query arguments
+            
+        Returns:
+            Cached or freshly loaded result
+        """
+        key = CacheManager.make_key(
+            operation,
+            schema=self.schema,
+            snapshot=snapshot_id,
+            symbols=CacheManager.digest_symbols(a.symbol for a in assets),
+            **params,
+        )
+        memo = self._request_memo.get()
+        if memo is not None and key in memo:
+            return cast(T, memo[key])
+        
+        if snapshot_id is None:
+            value = load()
+        else:
+            value = self._read_aside(key, load)
+        
+        if memo is not None:
+            memo[key] = value
+        return value
+
+    def _read_aside(self, key: str, load: Callable[[], T]) -> T:
+        """
+        Look up key in the in-process then shared tier, loading on miss.
+        
+        A shared-tier hit is promoted to the in-process tier; a load fills
+        both. ttl_seconds=0 stores without expiry.
+        
+        Args:
+            key: Cache key
+            load: Runs the query on a miss
+            
+        Returns:
+            Cached or freshly loaded result
+        """
+        value = self._snapshot_cache.get(key)
+        if value is not None:
+            return cast(T, value)
+        
+        if self._shared_cache is not None:
+            value = self._shared_cache.get(key)
+            if value is not None:
+                self._snapshot_cache.set(key, value, ttl_seconds=0)
+                return cast(T, value)
+        
+        value = load()
+        self._snapshot_cache.set(key, value, ttl_seconds=0)
+        if self._shared_cache is not None:
+            self._shared_cache.set(key, value, ttl_seconds=0)
+        return value
+
+    def _create_batches(
+        self,
+        items: Iterable[str],
+        batch_size: int,
+    ) -> Iterator[List[str]]:
+        """Split items into batches, lazily: one batch is alive at a time."""
+        it = iter(items)
+        while batch := list(islice(it, batch_size)):
+            yield batch
+
     def _execute_query(
         self,
         query: str,
-        params: Dict[str, Any],
+        params: Sequence[Any] = (),
     ) -> List[Dict[str, Any]]:
         """
-        Execute a database query.
-        
-        Template - to be implemented.
+        Execute a database query on a pooled connection.
         
         Args:
-            query: SQL query
-            params: Query parameters
+            query: SQL query with positional (%s) placeholders
+            params: Query parameters in placeholder order
             
         Returns:
             Query results as list of dicts
+            
+        Raises:
+            RuntimeError: If no connection pool is configured
         """
-        # TODO: Implement with actual database driver
-        # Example with psycopg2/asyncpg:
-        #
-        # conn = self.pool.get_connection()
-        # try:
-        #     cursor = conn.cursor(cursor_factory=RealDictCursor)
-        #     cursor.execute(query, params)
-        #     return cursor.fetchall()
-        # finally:
-        #     self.pool.release_connection(conn)
-        raise NotImplementedError("_execute_query - TBD")
+        columns, rows = self._fetch_rows(query, params)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def _stream_rows(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Execute a query on a server-side cursor and yield row tuples.
+        
+        Rows arrive in chunks of stream_prefetch_rows, so client memory
+        stays bounded by the chunk size rather than the result size.
+        The named cursor needs a transaction; it is rolled back (reads
+        only) before the connection returns to the pool.
+        
+        Raises:
+            RuntimeError: If no connection pool is configured
+        """
+        if self.pool is None:
+            raise RuntimeError("DatabaseUniverseProvider has no connection pool")
+        
+        conn = self.pool.get_connection()
+        try:
+            conn.autocommit = False
+            try:
+                with conn.cursor(name="universe_screener_stream") as cursor:
+                    cursor.itersize = self.stream_prefetch_rows
+                    cursor.execute(query, params)
+                    yield from cursor
+            finally:
+                conn.rollback()
+                conn.autocommit = True
+        finally:
+            self.pool.release_connection(conn)
+
+    def _fetch_rows(
+        self,
+        query: str,
+        params: Sequence[Any] = (),
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Execute a query and return column names and raw row tuples.
+        
+        Raises:
+            RuntimeError: If no connection pool is configured
+        """
+        if self.pool is None:
+            raise RuntimeError("DatabaseUniverseProvider has no connection pool")
+        
+        conn = self.pool.get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                # Column names once per query, not per row
+                columns = [col[0] for col in cursor.description]
+                return columns, cursor.fetchall()
+        finally:
+            self.pool.release_connection(conn)
 
     def health_check(self) -> bool:
         """
@@ -318,34 +750,78 @@ class DatabaseUniverseProvider:
 
 
 # =============================================================================
-# Connection Pool Factory (Placeholder)
+# Connection Pool Factory
 # =============================================================================
 
+class PostgresConnectionPool:
+    """
+    ConnectionPoolProtocol adapter over psycopg2's ThreadedConnectionPool.
+    
+    Connections are handed out in autocommit mode: the provider only
+    issues reads, so no transaction is left open when a connection is
+    returned to the pool.
+    """
+
+    def __init__(self, pool: Any) -> None:
+        """
+        Initialize adapter.
+        
+        Args:
+            pool: psycopg2 ThreadedConnectionPool
+        """
+        self._pool = pool
+
+    def get_connection(self) -> Any:
+        """Get a connection from the pool."""
+        conn = self._pool.getconn()
+        if not conn.autocommit:
+            conn.autocommit = True
+        return conn
+
+    def release_connection(self, conn: Any) -> None:
+        """Release connection back to pool."""
+        self._pool.putconn(conn)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.closeall()
+
+
 def create_connection_pool(
     database_url: str,
     min_connections: int = 5,
     max_connections: int = 20,
+    query_timeout_seconds: float = 30.0,
 ) -> ConnectionPoolProtocol:
     """
-    Create a database connection pool.
+    Create a PostgreSQL connection pool.
     
-    Placeholder - implement based on actual database driver.
+    Connections are opened once and reused across queries; the query
+    timeout is enforced server-side via statement_timeout.
     
     Args:
-        database_url: Database connection URL
+        database_url: Database connection URL (libpq DSN or URI)
         min_connections: Minimum pool size
         max_connections: Maximum pool size
+        query_timeout_seconds: Per-statement timeout
         
     Returns:
         Connection pool
         
-    Example implementations:
-        - PostgreSQL: psycopg2.pool.ThreadedConnectionPool
-        - PostgreSQL (async): asyncpg.create_pool()
-        - SQLAlchemy: sqlalchemy.create_engine().pool
+    Raises:
+        ImportError: If psycopg2 is not installed
     """
-    raise NotImplementedError(
-        "create_connection_pool - Implement based on database choice. "
-        "Schema TBD from colleague."
+    if not PSYCOPG2_AVAILABLE:
+        raise ImportError(
+            "create_connection_pool requires psycopg2. "
+            "Install with: pip install psycopg2-binary"
+        )
+    
+    pool = ThreadedConnectionPool(
+        min_connections,
+        max_connections,
+        dsn=database_url,
+        options=f"-c statement_timeout={int(query_timeout_seconds * 1000)}",
     )
+    return PostgresConnectionPool(pool)
 
@@ -2,22 +2,44 @@
 In-Memory Metrics Collector.
 
 A simple metrics collector that stores metrics in memory.
+
+Design Notes:
+    - Each thread records into its own bucket, so record_* never takes
+      a lock; get_metrics merges the buckets on read
+    - Buckets of finished threads are kept so their metrics survive
+    - The merged summary is cached until some bucket records again
 """
 
 from __future__ import annotations
 
-from datetime import datetime
-from threading import Lock
+import threading
+import time
 from typing import Any, Dict, List, Optional
 
 
+class _Bucket:
+    """One thread's running aggregates, keyed by metric name."""
+
+    __slots__ = ("metrics", "version")
+
+    def __init__(self) -> None:
+        # Raw events are not retained
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        # Bumped by the owning thread only, after each record completes
+        self.version = 0
+
+
 class InMemoryMetricsCollector:
     """Simple in-memory metrics collector."""
 
     def __init__(self) -> None:
         """Initialize the metrics collector."""
-        self._metrics: Dict[str, List[Dict[str, Any]]] = {}
-        self._lock = Lock()
+        self._local = threading.local()
+        self._buckets: List[_Bucket] = []
+        # Guards bucket registration and merging, not recording
+        self._lock = threading.Lock()
+        self._summary: Dict[str, Dict[str, Any]] = {}
+        self._summary_version = -1
 
     def record_timing(
         self,
@@ -26,8 +48,7 @@ class InMemoryMetricsCollector:
         tags: Optional[Dict[str, str]] = None,
     ) -> None:
         """Record a timing metric."""
-        with self._lock:
-            self._record(name, "timing", duration_seconds, tags)
+        self._record(name, "timing", duration_seconds, tags)
 
     def record_count(
         self,
@@ -36,8 +57,7 @@ class InMemoryMetricsCollector:
         tags: Optional[Dict[str, str]] = None,
     ) -> None:
         """Record a count metric."""
-        with self._lock:
-            self._record(name, "count", value, tags)
+        self._record(name, "count", value, tags)
 
     def record_gauge(
         self,
@@ -46,28 +66,61 @@ class InMemoryMetricsCollector:
         tags: Optional[Dict[str, str]] = None,
     ) -> None:
         """Record a gauge metric."""
-        with self._lock:
-            self._record(name, "gauge", value, tags)
+        self._record(name, "gauge", value, tags)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get all collected metrics."""
         with self._lock:
-            # Return a summary instead of raw data
-            summary = {}
-            for name, entries in self._metrics.items():
-                if entries:
-                    values = [e["value"] for e in entries]
-                    summary[name] = {
-                        "count": len(values),
-                        "total": sum(values) if isinstance(values[0], (int, float)) else None,
-                        "last": values[-1],
-                    }
-            return summary
+            # Versions only grow, so an unchanged sum means no new records;
+            # read them before merging so a concurrent record is not missed
+            version = sum(bucket.version for bucket in self._buckets)
+            if version != self._summary_version:
+                self._summary = self._merge_buckets()
+                self._summary_version = version
+            return {name: dict(values) for name, values in self._summary.items()}
 
     def clear(self) -> None:
         """Clear all metrics."""
         with self._lock:
-            self._metrics.clear()
+            for bucket in self._buckets:
+                bucket.metrics.clear()
+            self._summary_version = -1
+
+    def _merge_buckets(self) -> Dict[str, Dict[str, Any]]:
+        """Combine all thread buckets into one summary (caller holds the lock)."""
+        summary: Dict[str, Dict[str, Any]] = {}
+        last_ns: Dict[str, int] = {}
+        for bucket in self._buckets:
+            # Snapshot: the owning thread may add names concurrently
+            for name, entry in list(bucket.metrics.items()):
+                merged = summary.get(name)
+                if merged is None:
+                    summary[name] = {
+                        "count": entry["count"],
+                        "total": entry["total"],
+                        "last": entry["last"],
+                    }
+                    last_ns[name] = entry["last_timestamp_ns"]
+                    continue
+
+                merged["count"] += entry["count"]
+                if merged["total"] is None or entry["total"] is None:
+                    merged["total"] = None
+                else:
+                    merged["total"] += entry["total"]
+                if entry["last_timestamp_ns"] > last_ns[name]:
+                    merged["last"] = entry["last"]
+                    last_ns[name] = entry["last_timestamp_ns"]
+        return summary
+
+    def _get_bucket(self) -> _Bucket:
+        """Get the calling thread's bucket, registering it on first use."""
+        bucket = getattr(self._local, "bucket", None)
+        if bucket is None:
+            bucket = self._local.bucket = _Bucket()
+            with self._lock:
+                self._buckets.append(bucket)
+        return bucket
 
     def _record(
         self,
@@ -76,15 +129,28 @@ class InMemoryMetricsCollector:
         value: Any,
         tags: Optional[Dict[str, str]],
     ) -> None:
-        """Internal recording method."""
-        if name not in self._metrics:
-            self._metrics[name] = []
-
-        self._metrics[name].append(
-            {
+        """Internal recording method (thread-local, lock-free)."""
+        bucket = self._get_bucket()
+        entry = bucket.metrics.get(name)
+        if entry is None:
+            # Insert fully populated so a concurrent get_metrics never sees
+            # a partial entry; totals are only tracked for numeric metrics
+            bucket.metrics[name] = {
+                "count": 1,
+                "total": value if isinstance(value, (int, float)) else None,
+                "last": value,
                 "type": metric_type,
-                "value": value,
                 "tags": tags or {},
-                "timestamp": datetime.now().isoformat(),
+                "last_timestamp_ns": time.monotonic_ns(),
             }
-        )
+            bucket.version += 1
+            return
+
+        entry["count"] += 1
+        if entry["total"] is not None:
+            entry["total"] += value
+        entry["last"] = value
+        entry["type"] = metric_type
+        entry["tags"] = tags or {}
+        entry["last_timestamp_ns"] = time.monotonic_ns()
+        bucket.version += 1
@@ -7,12 +7,22 @@ deterministic mock data for assets, market data, and quality metrics.
 
 from __future__ import annotations
 
+import bisect
+import functools
 import random
+from array import array
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
 from universe_screener.domain.entities import Asset, AssetClass, AssetType
-from universe_screener.domain.value_objects import MarketData, QualityMetrics
+from universe_screener.domain.value_objects import (
+    MarketData,
+    MarketDataColumns,
+    MarketDataColumnsDict,
+    QualityMetrics,
+)
 
 
 class MockUniverseProvider:
@@ -70,9 +80,23 @@ class MockUniverseProvider:
             seed: Random seed for reproducibility
         """
         self._seed = seed
-        self._rng = random.Random(seed)
-        self._assets = self._generate_assets()
-        self._market_data = self._generate_market_data()
+        # Generated data is a pure function of the seed and shared between
+        # instances; the RNG resumes where generation left off
+        self._assets, self._columns, rng_state = self._build_universe(seed)
+        self._rng = random.Random()
+        self._rng.setstate(rng_state)
+
+        # Per asset class: assets sorted by listing date (with their
+        # position in self._assets) and the matching listing dates
+        buckets: Dict[AssetClass, List[Tuple[date, int, Asset]]] = defaultdict(list)
+        for pos, asset in enumerate(self._assets):
+            buckets[asset.asset_class].append((asset.listing_date, pos, asset))
+        self._listings: Dict[AssetClass, List[Tuple[int, Asset]]] = {}
+        self._listing_dates: Dict[AssetClass, List[date]] = {}
+        for asset_class, bucket in buckets.items():
+            bucket.sort(key=lambda entry: entry[:2])
+            self._listings[asset_class] = [(pos, asset) for _, pos, asset in bucket]
+            self._listing_dates[asset_class] = [listed for listed, _, _ in bucket]
 
     def get_assets(
         self,
@@ -82,13 +106,21 @@ class MockUniverseProvider:
         """Get mock assets for a date and asset class."""
         # Convert datetime to date for comparison with Asset.listing_date
         ref_date = date.date()
-        return [
-            a
-            for a in self._assets
-            if a.asset_class == asset_class
-            and a.listing_date <= ref_date
-            and (a.delisting_date is None or a.delisting_date > ref_date)
+        listing_dates = self._listing_dates.get(asset_class)
+        if not listing_dates:
+            return []
+
+        # Listed on or before ref_date is a prefix of the sorted bucket;
+        # only that prefix needs the delisting check
+        listed = self._listings[asset_class][: bisect.bisect_right(listing_dates, ref_date)]
+        active = [
+            (pos, a)
+            for pos, a in listed
+            if a.delisting_date is None or a.delisting_date > ref_date
         ]
+        # Restore universe order
+        active.sort(key=lambda entry: entry[0])
+        return [a for _, a in active]
 
     def bulk_load_market_data(
         self,
@@ -99,17 +131,32 @@ class MockUniverseProvider:
         """Get mock market data for assets."""
         result = {}
         for asset in assets:
-            if asset.symbol in self._market_data:
-                data = [
-                    d
-                    for d in self._market_data[asset.symbol]
-                    if start_date <= d.date <= end_date
-                ]
-                result[asset.symbol] = data
+            columns = self._columns.get(asset.symbol)
+            if columns is not None:
+                # Series are sorted by date: slice the range by binary search
+                # and build rows for that slice only
+                result[asset.symbol] = list(columns.between(start_date, end_date).iter_rows())
             else:
                 result[asset.symbol] = []
         return result
 
+    def bulk_load_market_columns(
+        self,
+        assets: List[Asset],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> MarketDataColumnsDict:
+        """Get mock market data for assets in columnar form."""
+        empty = MarketDataColumns.from_rows(())
+        return {
+            asset.symbol: (
+                self._columns[asset.symbol].between(start_date, end_date)
+                if asset.symbol in self._columns
+                else empty
+            )
+            for asset in assets
+        }
+
     def bulk_load_metadata(
         self,
         assets: List[Asset],
@@ -134,36 +181,62 @@ class MockUniverseProvider:
         lookback_days: int,
     ) -> Dict[str, QualityMetrics]:
         """Get mock quality metrics."""
-        result = {}
-        for asset in assets:
-            # SPARSE stock has many missing days
-            if asset.symbol == "SPARSE":
-                missing = 20
-            # Most stocks have 0-2 missing days
-            else:
-                missing = self._rng.randint(0, 2)
-
-            result[asset.symbol] = QualityMetrics(
-                missing_days=missing,
+        # Draw all values in two batched calls instead of two per asset:
+        # most stocks have 0-2 missing days and 5-50 news articles
+        missing = self._rng.choices(range(0, 3), k=len(assets))
+        news = self._rng.choices(range(5, 51), k=len(assets))
+        return {
+            asset.symbol: QualityMetrics(
+                # SPARSE stock has many missing days
+                missing_days=20 if asset.symbol == "SPARSE" else missing_days,
                 last_available_date=date,
-                news_article_count=self._rng.randint(5, 50),
+                news_article_count=news_count,
             )
-        return result
+            for asset, missing_days, news_count in zip(assets, missing, news)
+        }
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_universe(cls, seed: int) -> Tuple[
+        Tuple[Asset, ...],
+        Mapping[str, MarketDataColumns],
+        Any,
+    ]:
+        """
+        Generate the mock universe for a seed, memoized across instances.
+
+        Keyed on the (sub)class supplying the symbols and the seed.
+        Returns read-only containers so no instance can modify the shared
+        copy. Only packed columns are kept; MarketData rows are built per
+        query for the requested date range.
+
+        Args:
+            seed: Random seed for reproducibility
+
+        Returns:
+            Tuple of (assets, market data columns by symbol, RNG state after
+            generation)
+        """
+        rng = random.Random(seed)
+        assets = cls._generate_assets(rng)
+        columns = cls._generate_market_data(rng, assets)
+        return tuple(assets), MappingProxyType(columns), rng.getstate()
 
-    def _generate_assets(self) -> List[Asset]:
+    @classmethod
+    def _generate_assets(cls, rng: random.Random) -> List[Asset]:
         """Generate mock assets."""
         assets = []
         base_date = date(2020, 1, 1)
 
         # Generate stocks
-        for i, (symbol, name, exchange, sector) in enumerate(self.MOCK_STOCKS):
+        for i, (symbol, name, exchange, sector) in enumerate(cls.MOCK_STOCKS):
             # Most stocks have old listing dates
             if symbol == "NEW1":
                 listing_date = date(2024, 6, 1)  # Recent listing
             elif symbol == "DEAD":
                 listing_date = date(2010, 1, 1)
             else:
-                listing_date = base_date - timedelta(days=self._rng.randint(500, 5000))
+                listing_date = base_date - timedelta(days=rng.randint(500, 5000))
 
             delisting_date = None
             if symbol == "DEAD":
@@ -184,7 +257,7 @@ class MockUniverseProvider:
             )
 
         # Generate crypto
-        for symbol, name, exchange, _ in self.MOCK_CRYPTO:
+        for symbol, name, exchange, _ in cls.MOCK_CRYPTO:
             assets.append(
                 Asset(
                     symbol=symbol,
@@ -192,12 +265,12 @@ class MockUniverseProvider:
                     asset_class=AssetClass.CRYPTO,
                     asset_type=AssetType.COMMON_STOCK,  # Placeholder
                     exchange=exchange,
-                    listing_date=base_date - timedelta(days=self._rng.randint(365, 2000)),
+                    listing_date=base_date - timedelta(days=rng.randint(365, 2000)),
                 )
             )
 
         # Generate forex
-        for symbol, name, exchange, _ in self.MOCK_FOREX:
+        for symbol, name, exchange, _ in cls.MOCK_FOREX:
             assets.append(
                 Asset(
                     symbol=symbol,
@@ -211,69 +284,92 @@ class MockUniverseProvider:
 
         return assets
 
-    def _generate_market_data(self) -> Dict[str, List[MarketData]]:
-        """Generate mock market data for 2 years."""
+    @staticmethod
+    def _generate_market_data(
+        rng: random.Random, assets: List[Asset]
+    ) -> MarketDataColumnsDict:
+        """Generate mock market data for 2 years, straight into columns."""
         result = {}
-        end_date = datetime(2024, 12, 31)
-        start_date = end_date - timedelta(days=730)  # 2 years
+        all_days, weekdays = _mock_calendar()
+
+        # Bind RNG methods once; the draw order matches the per-day loop,
+        # so the generated series are unchanged for a given seed
+        rng_random = rng.random
+        gauss = rng.gauss
 
-        for asset in self._assets:
-            data = []
-            current_date = start_date
+        for asset in assets:
+            dates: List[datetime] = []
+            opens = array("d")
+            highs = array("d")
+            lows = array("d")
+            closes = array("d")
+            volumes = array("q")
 
             # Set base price and volume based on asset
             if asset.symbol in ["AAPL", "MSFT", "GOOGL", "AMZN", "META"]:
-                base_price = self._rng.uniform(100, 500)
-                base_volume = self._rng.randint(10_000_000, 50_000_000)
+                base_price = rng.uniform(100, 500)
+                base_volume = rng.randint(10_000_000, 50_000_000)
             elif asset.symbol in ["TINY", "SMALL"]:
-                base_price = self._rng.uniform(5, 20)
-                base_volume = self._rng.randint(10_000, 100_000)  # Low volume
+                base_price = rng.uniform(5, 20)
+                base_volume = rng.randint(10_000, 100_000)  # Low volume
             elif asset.symbol == "SPARSE":
-                base_price = self._rng.uniform(30, 60)
-                base_volume = self._rng.randint(500_000, 2_000_000)
+                base_price = rng.uniform(30, 60)
+                base_volume = rng.randint(500_000, 2_000_000)
             else:
-                base_price = self._rng.uniform(50, 300)
-                base_volume = self._rng.randint(1_000_000, 20_000_000)
+                base_price = rng.uniform(50, 300)
+                base_volume = rng.randint(1_000_000, 20_000_000)
 
+            # Skip weekends for stocks
+            days = weekdays if asset.asset_class == AssetClass.STOCK else all_days
+            sparse = asset.symbol == "SPARSE"
             price = base_price
 
-            while current_date <= end_date:
-                # Skip weekends for stocks
-                if asset.asset_class == AssetClass.STOCK and current_date.weekday() >= 5:
-                    current_date += timedelta(days=1)
-                    continue
-
+            for current_date in days:
                 # Skip some days for SPARSE stock
-                if asset.symbol == "SPARSE" and self._rng.random() < 0.3:
-                    current_date += timedelta(days=1)
+                if sparse and rng_random() < 0.3:
                     continue
 
                 # Random walk for price
-                change = self._rng.gauss(0, 0.02)
-                price = price * (1 + change)
-                price = max(price, 1.0)  # No negative prices
+                price = price * (1 + gauss(0, 0.02))
+                if price < 1.0:
+                    price = 1.0  # No negative prices
 
                 # OHLCV generation
-                open_price = price * (1 + self._rng.gauss(0, 0.005))
-                high_price = max(open_price, price) * (1 + abs(self._rng.gauss(0, 0.01)))
-                low_price = min(open_price, price) * (1 - abs(self._rng.gauss(0, 0.01)))
-                close_price = price
-                volume = int(base_volume * (1 + self._rng.gauss(0, 0.3)))
-                volume = max(volume, 1000)
-
-                data.append(
-                    MarketData(
-                        date=current_date,
-                        open=round(open_price, 2),
-                        high=round(high_price, 2),
-                        low=round(low_price, 2),
-                        close=round(close_price, 2),
-                        volume=volume,
-                    )
-                )
+                open_price = price * (1 + gauss(0, 0.005))
+                high_price = max(open_price, price) * (1 + abs(gauss(0, 0.01)))
+                low_price = min(open_price, price) * (1 - abs(gauss(0, 0.01)))
+                volume = int(base_volume * (1 + gauss(0, 0.3)))
+                if volume < 1000:
+                    volume = 1000
+
+                dates.append(current_date)
+                opens.append(round(open_price, 2))
+                highs.append(round(high_price, 2))
+                lows.append(round(low_price, 2))
+                closes.append(round(price, 2))
+                volumes.append(volume)
+
+            result[asset.symbol] = MarketDataColumns(
+                dates=tuple(dates),
+                open=opens,
+                high=highs,
+                low=lows,
+                close=closes,
+                volume=volumes,
+            )
+
+        return result
 
-                current_date += timedelta(days=1)
 
-            result[asset.symbol] = data
+@functools.lru_cache(maxsize=1)
+def _mock_calendar() -> Tuple[Tuple[datetime, ...], Tuple[datetime, ...]]:
+    """
+    Calendar of the generated 2-year history, shared by all seeds.
 
-        return result
+    Returns:
+        Tuple of (all calendar days, weekdays only)
+    """
+    end_date = datetime(2024, 12, 31)
+    start_date = end_date - timedelta(days=730)  # 2 years
+    all_days = tuple(start_date + timedelta(days=i) for i in range(731))
+    return all_days, tuple(d for d in all_days if d.weekday() < 5)
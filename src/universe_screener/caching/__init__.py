@@ -2,7 +2,7 @@
 Caching Layer.
 
 Provides caching infrastructure for performance optimization:
-    - CacheManager: TTL-based caching with LRU eviction
+    - CacheManager: TTL-based caching with CLOCK (approximate LRU) eviction
     - CacheConfig: Configuration for cache behavior
     - CacheStats: Statistics tracking for cache operations
 """
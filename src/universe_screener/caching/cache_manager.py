@@ -1,25 +1,42 @@
 """
-Cache Manager - TTL-based Caching with LRU Eviction.
+Cache Manager - TTL-based Caching with CLOCK (approximate LRU) Eviction.
 
 Provides thread-safe caching for expensive data operations.
 
 Design Notes:
     - TTL-based expiration for freshness
-    - LRU eviction when max size exceeded
-    - Thread-safe with Lock
+    - CLOCK eviction when max size exceeded, after dropping expired entries
+    - Thread-safe: keys are spread over lock-striped shards, so callers
+      touching different shards never contend
+    - Cache hits are served without taking a lock
     - Memory size tracking
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import heapq
 import logging
 import sys
 import threading
 import time
 from collections import OrderedDict
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional, Protocol, TypeVar
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,24 +63,36 @@ class CacheManagerProtocol(Protocol):
         ...
 
 
-@dataclass
-class CacheEntry:
-    """A single cache entry with metadata."""
+class CacheEntry(NamedTuple):
+    """
+    A single cache entry with metadata.
+    
+    Shards store entries as plain (value, expires_at, size_bytes) tuples
+    with this layout; a tuple literal is far cheaper to build than any
+    class instance, and this type documents and names the fields.
+    """
     
     value: Any
-    created_at: float = field(default_factory=time.time)
-    expires_at: Optional[float] = None
+    # Monotonic deadline in nanoseconds (time.monotonic_ns), immune to
+    # wall-clock adjustments
+    expires_at: Optional[int] = None
     size_bytes: int = 0
 
-    @property
-    def is_expired(self) -> bool:
-        """Check if entry has expired."""
+    def is_expired(self, now_ns: Optional[int] = None) -> bool:
+        """
+        Check if entry has expired.
+        
+        Args:
+            now_ns: Current time.monotonic_ns(), if the caller already has it
+        """
         if self.expires_at is None:
             return False
-        return time.time() > self.expires_at
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns > self.expires_at
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Configuration for cache manager."""
     
@@ -78,9 +107,12 @@ class CacheConfig:
     
     # Log cache hits/misses
     log_access: bool = False
+    
+    # Number of independently locked shards (power of two)
+    num_shards: int = 16
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStats:
     """Cache statistics."""
     
@@ -98,15 +130,196 @@ class CacheStats:
         return self.hits / total if total > 0 else 0.0
 
 
+class _Shard:
+    """One lock-striped partition of the cache."""
+
+    __slots__ = (
+        "lock",
+        "entries",
+        "referenced",
+        "prefixes",
+        "expiry_heap",
+        "size_bytes",
+        "evictions",
+        "expirations",
+    )
+
+    def __init__(self) -> None:
+        # Plain Lock, not RLock: _Shard methods are called with it held and
+        # never take it themselves, and CacheManager holds at most one shard
+        # lock at a time and never calls a public method while holding one
+        self.lock = threading.Lock()
+        # Insertion order within the shard: the CLOCK hand starts at the front
+        self.entries: OrderedDict[str, Tuple[Any, Optional[int], int]] = OrderedDict()
+        # CLOCK reference bits: keys hit since the hand last passed them.
+        # set.add is atomic under the GIL, so hits mark without the lock; a
+        # hit racing a removal can leave a bit for a gone key, which add()
+        # clears
+        self.referenced: Set[str] = set()
+        # Keys by operation prefix (the part before the first ':')
+        self.prefixes: Dict[str, Set[str]] = {}
+        # (expires_at, key) min-heap; stale items are skipped when popped
+        self.expiry_heap: List[Tuple[int, str]] = []
+        self.size_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def remove(self, key: str) -> None:
+        """Remove an entry (caller holds the shard lock)."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[2]
+            self.referenced.discard(key)
+            self.unindex(key)
+
+    def add(self, key: str, entry: Tuple[Any, Optional[int], int]) -> None:
+        """Store a new entry (caller holds the shard lock)."""
+        self.entries[key] = entry
+        self.size_bytes += entry[2]
+        # A new entry starts unreferenced; once lock-free hits have left
+        # more bits than entries, drop the bits of keys no longer stored
+        referenced = self.referenced
+        referenced.discard(key)
+        if len(referenced) > len(self.entries):
+            referenced.intersection_update(self.entries)
+        prefix = key.partition(":")[0]
+        keys = self.prefixes.get(prefix)
+        if keys is None:
+            self.prefixes[prefix] = {key}
+        else:
+            keys.add(key)
+
+    def unindex(self, key: str) -> None:
+        """Drop a key from the prefix index (caller holds the shard lock)."""
+        prefix = key.partition(":")[0]
+        keys = self.prefixes.get(prefix)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.prefixes[prefix]
+
+    def keys_matching(self, pattern: str) -> List[str]:
+        """Keys starting with pattern (caller holds the shard lock)."""
+        head, colon, _ = pattern.partition(":")
+        if not colon:
+            # A key starts with a colon-free pattern iff its prefix does
+            return [
+                key
+                for prefix, keys in self.prefixes.items()
+                if prefix.startswith(pattern)
+                for key in keys
+            ]
+        keys = self.prefixes.get(head, ())
+        if pattern == head + ":":
+            return list(keys)
+        return [key for key in keys if key.startswith(pattern)]
+
+    def track_expiry(self, key: str, expires_at: int) -> None:
+        """Schedule an entry for expiry (caller holds the shard lock)."""
+        heap = self.expiry_heap
+        heapq.heappush(heap, (expires_at, key))
+        # Overwrites leave stale items behind; rebuild once they dominate
+        if len(heap) > 2 * len(self.entries) + 64:
+            heap[:] = [
+                (expires_at, k)
+                for k, (_, expires_at, _) in self.entries.items()
+                if expires_at is not None
+            ]
+            heapq.heapify(heap)
+
+    def purge_expired(self, now_ns: int) -> int:
+        """Drop entries expired by now_ns (caller holds the shard lock)."""
+        heap = self.expiry_heap
+        purged = 0
+        while heap and heap[0][0] < now_ns:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            # Skip items whose key was removed or overwritten since
+            if entry is not None and entry[1] == expires_at:
+                self.remove(key)
+                purged += 1
+        self.expirations += purged
+        return purged
+
+
+def _sequence_size(value: Any) -> int:
+    """List/tuple size, extrapolated from the first item."""
+    size = sys.getsizeof(value)
+    if value:
+        size += len(value) * _estimate_size(value[0])
+    return size
+
+
+def _mapping_size(value: Dict[Any, Any]) -> int:
+    """Dict size, extrapolated from the first key/value pair."""
+    size = sys.getsizeof(value)
+    if value:
+        key, item = next(iter(value.items()))
+        size += len(value) * (sys.getsizeof(key) + _estimate_size(item))
+    return size
+
+
+# Exact-type dispatch; anything else (str, bytes, arrays, objects defining
+# a deep __sizeof__) is measured by sys.getsizeof alone
+_SIZERS: Dict[type, Callable[[Any], int]] = {
+    dict: _mapping_size,
+    list: _sequence_size,
+    tuple: _sequence_size,
+}
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Estimate memory size of a value in bytes without walking it.
+    
+    Containers are assumed homogeneous: only the first element is
+    measured and scaled by the length, so sizing costs O(nesting depth)
+    rather than O(payload).
+    """
+    sizer = _SIZERS.get(type(value))
+    return sizer(value) if sizer is not None else sys.getsizeof(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_params(sorted_params: Tuple[Tuple[str, Any], ...]) -> str:
+    """64-bit BLAKE2b hex digest of sorted key parameters."""
+    # Per-value repr keeps 1 and "1" apart without repr-ing the whole list
+    preimage = b"\0".join(f"{k}={v!r}".encode() for k, v in sorted_params)
+    return hashlib.blake2b(preimage, digest_size=8).hexdigest()
+
+
+class _Flight:
+    """A get_or_compute computation that other callers can wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Counters:
+    """Hit/miss counts written by a single thread."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
 class CacheManager:
     """
-    TTL-based cache with LRU eviction policy.
+    TTL-based cache with CLOCK eviction policy.
     
     Features:
-        - Thread-safe with reentrant lock
+        - Thread-safe with one (non-reentrant) lock per shard
         - Configurable max size (in bytes)
         - TTL-based expiration
-        - LRU eviction when size exceeded
+        - CLOCK (second-chance) eviction when size exceeded: hits only set
+          a reference bit, so reads never reorder entries; shards are
+          evicted round-robin
         - Statistics tracking
     
     Cache Key Format:
@@ -123,10 +336,19 @@ class CacheManager:
             config: Cache configuration
         """
         self.config = config or CacheConfig()
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = threading.RLock()
-        self._stats = CacheStats()
-        self._current_size_bytes = 0
+        num_shards = self.config.num_shards
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError(f"num_shards must be a power of two, got {num_shards}")
+        self._shards = [_Shard() for _ in range(num_shards)]
+        self._shard_mask = num_shards - 1
+        # Computations running in get_or_compute, by key
+        self._in_flight: Dict[str, _Flight] = {}
+        self._in_flight_lock = threading.Lock()
+        # Each thread bumps its own hit/miss counters, so lock-free reads
+        # never lose an update; get_stats() sums them
+        self._local = threading.local()
+        self._counters: List[_Counters] = []
+        self._counters_lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -141,32 +363,38 @@ class CacheManager:
         if not self.config.enabled:
             return None
             
-        with self._lock:
-            entry = self._cache.get(key)
-            
-            if entry is None:
-                self._stats.misses += 1
-                if self.config.log_access:
-                    logger.debug(f"Cache MISS: {key}")
-                return None
-            
-            # Check expiration
-            if entry.is_expired:
-                self._remove_entry(key)
-                self._stats.expirations += 1
-                self._stats.misses += 1
-                if self.config.log_access:
-                    logger.debug(f"Cache EXPIRED: {key}")
-                return None
-            
-            # Move to end for LRU
-            self._cache.move_to_end(key)
-            
-            self._stats.hits += 1
+        shard = self._shard(key)
+        # Lock-free lookup: a single dict read is atomic under the GIL
+        entry = shard.entries.get(key)
+        
+        if entry is None:
+            self._thread_counters().misses += 1
             if self.config.log_access:
-                logger.debug(f"Cache HIT: {key}")
-            
-            return entry.value
+                logger.debug(f"Cache MISS: {key}")
+            return None
+        
+        # Check expiration
+        # Inlined is_expired: integer compare, no method call
+        value, expires_at, _ = entry
+        if expires_at is not None and time.monotonic_ns() > expires_at:
+            with shard.lock:
+                # Another thread may have replaced the entry meanwhile
+                if shard.entries.get(key) is entry:
+                    shard.remove(key)
+                    shard.expirations += 1
+            self._thread_counters().misses += 1
+            if self.config.log_access:
+                logger.debug(f"Cache EXPIRED: {key}")
+            return None
+        
+        # Mark for CLOCK; a single attribute write needs no lock
+        shard.referenced.add(key)
+        self._thread_counters().hits += 1
+        
+        if self.config.log_access:
+            logger.debug(f"Cache HIT: {key}")
+        
+        return value
 
     def set(
         self,
@@ -186,28 +414,28 @@ class CacheManager:
             return
             
         ttl = ttl_seconds if ttl_seconds is not None else self.config.default_ttl_seconds
-        expires_at = time.time() + ttl if ttl > 0 else None
+        expires_at = time.monotonic_ns() + int(ttl * 1e9) if ttl > 0 else None
         
         # Estimate size
         size_bytes = self._estimate_size(value)
         
-        with self._lock:
+        index = hash(key) & self._shard_mask
+        shard = self._shards[index]
+        with shard.lock:
             # Remove existing entry if present
-            if key in self._cache:
-                self._remove_entry(key)
-            
-            # Evict entries if needed
-            self._evict_if_needed(size_bytes)
-            
-            # Create and store entry
-            entry = CacheEntry(
-                value=value,
-                expires_at=expires_at,
-                size_bytes=size_bytes,
-            )
-            
-            self._cache[key] = entry
-            self._current_size_bytes += size_bytes
+            shard.remove(key)
+        
+        # Evict entries if needed; takes one shard lock at a time
+        self._evict_if_needed(size_bytes, first=index)
+        
+        # Create and store entry (CacheEntry layout, as a plain tuple)
+        entry = (value, expires_at, size_bytes)
+        
+        with shard.lock:
+            shard.remove(key)
+            shard.add(key, entry)
+            if expires_at is not None:
+                shard.track_expiry(key, expires_at)
             
             if self.config.log_access:
                 logger.debug(f"Cache SET: {key} ({size_bytes} bytes, TTL={ttl}s)")
@@ -222,9 +450,10 @@ class CacheManager:
         Returns:
             True if entry was removed, False if not found
         """
-        with self._lock:
-            if key in self._cache:
-                self._remove_entry(key)
+        shard = self._shard(key)
+        with shard.lock:
+            if key in shard.entries:
+                shard.remove(key)
                 logger.debug(f"Cache INVALIDATED: {key}")
                 return True
             return False
@@ -233,41 +462,54 @@ class CacheManager:
         """
         Invalidate all entries matching pattern.
         
+        Keys are indexed by operation prefix (see make_key), so only the
+        matching prefixes' keys are visited, not the whole cache.
+        
         Args:
             pattern: Pattern to match (startswith check)
             
         Returns:
             Number of entries invalidated
         """
-        with self._lock:
-            keys_to_remove = [k for k in self._cache if k.startswith(pattern)]
-            for key in keys_to_remove:
-                self._remove_entry(key)
-            
-            if keys_to_remove:
-                logger.debug(f"Cache INVALIDATED {len(keys_to_remove)} entries matching '{pattern}'")
-            
-            return len(keys_to_remove)
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys_to_remove = shard.keys_matching(pattern)
+                for key in keys_to_remove:
+                    shard.remove(key)
+            removed += len(keys_to_remove)
+        
+        if removed:
+            logger.debug(f"Cache INVALIDATED {removed} entries matching '{pattern}'")
+        
+        return removed
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
-            self._current_size_bytes = 0
-            logger.info("Cache CLEARED")
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.referenced.clear()
+                shard.prefixes.clear()
+                shard.expiry_heap.clear()
+                shard.size_bytes = 0
+        logger.info("Cache CLEARED")
 
     def get_stats(self) -> CacheStats:
         """Get cache statistics."""
-        with self._lock:
-            stats = CacheStats(
-                hits=self._stats.hits,
-                misses=self._stats.misses,
-                evictions=self._stats.evictions,
-                expirations=self._stats.expirations,
-                current_size_bytes=self._current_size_bytes,
-                current_entries=len(self._cache),
-            )
-            return stats
+        stats = CacheStats()
+        with self._counters_lock:
+            counters = list(self._counters)
+        for thread_counters in counters:
+            stats.hits += thread_counters.hits
+            stats.misses += thread_counters.misses
+        for shard in self._shards:
+            with shard.lock:
+                stats.evictions += shard.evictions
+                stats.expirations += shard.expirations
+                stats.current_size_bytes += shard.size_bytes
+                stats.current_entries += len(shard.entries)
+        return stats
 
     def get_or_compute(
         self,
@@ -279,6 +521,8 @@ class CacheManager:
         Get from cache or compute and store.
         
         This is a convenience method that combines get and set.
+        Concurrent misses on the same key are coalesced: one caller runs
+        compute_fn and the others wait for its result (or exception).
         
         Args:
             key: Cache key
@@ -290,51 +534,103 @@ class CacheManager:
         """
         cached = self.get(key)
         if cached is not None:
-            return cached
+            return cast(T, cached)
         
-        value = compute_fn()
-        self.set(key, value, ttl_seconds)
-        return value
-
-    def _remove_entry(self, key: str) -> None:
-        """Remove entry from cache (internal, must hold lock)."""
-        entry = self._cache.pop(key, None)
-        if entry:
-            self._current_size_bytes -= entry.size_bytes
-
-    def _evict_if_needed(self, new_entry_size: int) -> None:
-        """Evict entries if adding new entry would exceed max size."""
+        with self._in_flight_lock:
+            running = self._in_flight.get(key)
+            if running is None:
+                flight = self._in_flight[key] = _Flight()
+        
+        if running is not None:
+            running.done.wait()
+            if running.error is not None:
+                raise running.error
+            return cast(T, running.value)
+        
+        try:
+            # A flight that finished after our miss has already stored its value
+            cached = self.get(key)
+            if cached is not None:
+                flight.value = cached
+                return cast(T, cached)
+            value = compute_fn()
+            flight.value = value
+            self.set(key, value, ttl_seconds)
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def _thread_counters(self) -> _Counters:
+        """Hit/miss counters of the calling thread, registered on first use."""
+        try:
+            counters: _Counters = self._local.counters
+        except AttributeError:
+            counters = self._local.counters = _Counters()
+            with self._counters_lock:
+                self._counters.append(counters)
+        return counters
+
+    def _shard(self, key: str) -> _Shard:
+        """Get the shard owning a key."""
+        return self._shards[hash(key) & self._shard_mask]
+
+    def _current_size_bytes(self) -> int:
+        """Total size over all shards (lock-free, may be momentarily stale)."""
+        return sum(shard.size_bytes for shard in self._shards)
+
+    def _evict_if_needed(self, new_entry_size: int, first: int) -> None:
+        """
+        Evict entries if adding new entry would exceed max size.
+        
+        Expired entries are dropped first, so unread stale data does not
+        push live entries out. Then takes the CLOCK victim of each shard
+        in turn, beginning with the shard receiving the new entry. Only
+        one shard lock is held at a time, so concurrent writers cannot
+        deadlock.
+        """
         target_size = self.config.max_size_bytes - new_entry_size
+        if self._current_size_bytes() <= target_size:
+            return
+        
+        order = self._shards[first:] + self._shards[:first]
+        now_ns = time.monotonic_ns()
+        for shard in order:
+            with shard.lock:
+                shard.purge_expired(now_ns)
         
-        while self._current_size_bytes > target_size and self._cache:
-            # Remove oldest (first) entry (LRU)
-            key, entry = self._cache.popitem(last=False)
-            self._current_size_bytes -= entry.size_bytes
-            self._stats.evictions += 1
-            logger.debug(f"Cache EVICTED (LRU): {key}")
+        while self._current_size_bytes() > target_size:
+            evicted = False
+            for shard in order:
+                with shard.lock:
+                    if not shard.entries:
+                        continue
+                    referenced = shard.referenced
+                    key, entry = shard.entries.popitem(last=False)
+                    # Second chance: referenced entries go to the back with
+                    # the bit cleared; terminates once every bit is cleared
+                    while key in referenced:
+                        referenced.discard(key)
+                        shard.entries[key] = entry
+                        key, entry = shard.entries.popitem(last=False)
+                    shard.size_bytes -= entry[2]
+                    shard.unindex(key)
+                    shard.evictions += 1
+                evicted = True
+                logger.debug(f"Cache EVICTED (CLOCK): {key}")
+                if self._current_size_bytes() <= target_size:
+                    return
+            if not evicted:
+                return
 
     def _estimate_size(self, value: Any) -> int:
         """Estimate memory size of a value in bytes."""
         try:
-            # Basic size estimate
-            size = sys.getsizeof(value)
-            
-            # For dicts and lists, recursively estimate
-            if isinstance(value, dict):
-                for k, v in value.items():
-                    size += sys.getsizeof(k)
-                    if isinstance(v, (list, dict)):
-                        size += self._estimate_size(v)
-                    else:
-                        size += sys.getsizeof(v)
-            elif isinstance(value, (list, tuple)):
-                for item in value:
-                    if isinstance(item, (list, dict)):
-                        size += self._estimate_size(item)
-                    else:
-                        size += sys.getsizeof(item)
-            
-            return size
+            return _estimate_size(value)
         except Exception:
             # Fallback: assume 1KB per entry
             return 1024
@@ -352,11 +648,33 @@ class CacheManager:
             Cache key in format "operation:params_hash"
         """
         # Sort params for consistent ordering
-        sorted_params = sorted(params.items())
-        param_str = str(sorted_params)
+        sorted_params = tuple(sorted(params.items()))
         
-        # Hash the parameters
-        param_hash = hashlib.sha256(param_str.encode()).hexdigest()[:16]
+        # Hash the parameters (memoized unless a value is unhashable)
+        try:
+            param_hash = _hash_params(sorted_params)
+        except TypeError:
+            param_hash = _hash_params.__wrapped__(sorted_params)
         
         return f"{operation}:{param_hash}"
 
+    @staticmethod
+    def digest_symbols(symbols: Iterable[str]) -> str:
+        """
+        Order-independent digest of a symbol set, for use as a key parameter.
+        
+        Streams the sorted symbols into BLAKE2b instead of embedding the
+        full symbol tuple in the key, so make_key only has to format a
+        fixed-size string regardless of universe size.
+        
+        Args:
+            symbols: Asset symbols
+            
+        Returns:
+            Hex digest of the sorted symbols
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for symbol in sorted(symbols):
+            h.update(symbol.encode())
+            h.update(b"\0")
+        return h.hexdigest()
@@ -2,17 +2,30 @@
 Configuration Loader - YAML Loading with Validation.
 
 Loads configuration from YAML files and validates using Pydantic models.
+
+Parsed files and validated configs are cached per file version (path and
+mtime), so repeated loads of unchanged files skip parsing and validation.
 """
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from universe_screener.config.models import ScreeningConfig
 
+# (resolved path, st_mtime_ns) identifying one version of a file
+FileVersion = Tuple[str, int]
+
 
 class ConfigLoader:
     """Loads and validates configuration from YAML files."""
@@ -39,20 +52,16 @@ class ConfigLoader:
             profile: Optional profile name to merge
 
         Returns:
-            Validated ScreeningConfig object
+            Validated ScreeningConfig object, shared between loads of the
+            same unchanged files (do not mutate)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValidationError: If config is invalid
         """
-        path = self._resolve_path(config_path)
-        config_dict = self._load_yaml(path)
-
-        if profile:
-            profile_dict = self._load_profile(profile)
-            config_dict = self._merge_configs(config_dict, profile_dict)
-
-        return ScreeningConfig.model_validate(config_dict)
+        config_file = _file_version(self._resolve_path(config_path))
+        profile_file = _file_version(self._profile_path(profile)) if profile else None
+        return _build_config(config_file, profile_file)
 
     def load_from_dict(self, config_dict: Dict[str, Any]) -> ScreeningConfig:
         """
@@ -74,34 +83,71 @@ class ConfigLoader:
         return self._base_path / p
 
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
-        """Load YAML file."""
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        """
+        Load YAML file.
+
+        Parses are cached per file version, so the returned dict is shared
+        and must not be mutated.
+        """
+        return _parse_yaml(*_file_version(path))
 
     def _load_profile(self, profile: str) -> Dict[str, Any]:
         """Load profile configuration."""
+        return self._load_yaml(self._profile_path(profile))
+
+    def _profile_path(self, profile: str) -> Path:
+        """Path of a profile file, which must exist."""
         profile_path = self._base_path / "config" / "profiles" / f"{profile}.yaml"
         if not profile_path.exists():
             raise FileNotFoundError(f"Profile not found: {profile}")
-        return self._load_yaml(profile_path)
+        return profile_path
 
     def _merge_configs(
         self,
         base: Dict[str, Any],
         overlay: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Deep merge overlay into base config."""
-        result = dict(base)
-        for key, value in overlay.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self._merge_configs(result[key], value)
+        """Deep merge overlay into base config (inputs are not modified)."""
+        return _merge_configs(base, overlay)
+
+
+def _merge_configs(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep merge overlay into a copy of base, iteratively."""
+    result = copy.deepcopy(base)
+    stack = [(result, overlay)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
             else:
-                result[key] = value
-        return result
+                target[key] = value
+    return result
+
+
+def _file_version(path: Path) -> FileVersion:
+    """Identify the current version of a file (raises if missing)."""
+    return str(path.resolve()), path.stat().st_mtime_ns
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; mtime_ns keys the cache so edits are re-read."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+@functools.lru_cache(maxsize=32)
+def _build_config(
+    config_file: FileVersion,
+    profile_file: Optional[FileVersion],
+) -> ScreeningConfig:
+    """Parse, merge and validate one combination of file versions."""
+    config_dict = _parse_yaml(*config_file)
+    if profile_file is not None:
+        config_dict = _merge_configs(config_dict, _parse_yaml(*profile_file))
+    return ScreeningConfig.model_validate(config_dict)
 
 
 def load_config(
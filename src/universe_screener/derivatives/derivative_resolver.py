@@ -8,9 +8,24 @@ instruments for underlying assets.
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, TYPE_CHECKING
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from universe_screener.derivatives.entities import InstrumentType, TradableInstrument
 from universe_screener.derivatives.strategies import (
@@ -19,7 +34,7 @@ from universe_screener.derivatives.strategies import (
     FutureResolver,
     InstrumentResolverStrategy,
 )
-from universe_screener.domain.entities import Asset
+from universe_screener.domain.entities import Asset, AssetClass
 
 if TYPE_CHECKING:
     from universe_screener.config.models import DerivativeConfig
@@ -27,7 +42,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class InstrumentFilter:
     """Criteria for filtering tradable instruments."""
 
@@ -41,38 +56,82 @@ class InstrumentFilter:
 
     def matches(self, instrument: TradableInstrument) -> bool:
         """Check if instrument matches filter criteria."""
-        # Type filter
-        if self.instrument_types and instrument.instrument_type not in self.instrument_types:
-            return False
-
-        # Leverage filter
-        if instrument.leverage < self.min_leverage:
-            return False
-        if instrument.leverage > self.max_leverage:
-            return False
-
-        # Broker filter
-        if self.brokers and instrument.broker not in self.brokers:
-            return False
-
-        # Cost filter
-        if instrument.trading_costs > self.max_trading_costs:
-            return False
-
-        # Short selling filter
-        if self.require_short_selling:
-            short_allowed = instrument.metadata.get("short_selling", True)
-            if not short_allowed:
+        return self.compile()(instrument)
+
+    def expiry_cutoff(self) -> Optional[datetime]:
+        """Earliest acceptable expiry date, or None if expiry is not filtered."""
+        if self.exclude_expiring_within_days > 0:
+            return datetime.now() + timedelta(days=self.exclude_expiring_within_days)
+        return None
+
+    def compile(self) -> Callable[[TradableInstrument], bool]:
+        """
+        Build a predicate specialized for the current criteria.
+
+        Criteria are read once, and the expiry cutoff is computed once,
+        so filtering many instruments avoids per-instrument attribute
+        lookups and clock reads. Recompile after changing the filter.
+
+        Returns:
+            Function returning True if an instrument matches
+        """
+        types = frozenset(self.instrument_types) or None
+        brokers = frozenset(self.brokers) or None
+        min_leverage = self.min_leverage
+        max_leverage = self.max_leverage
+        max_trading_costs = self.max_trading_costs
+        require_short_selling = self.require_short_selling
+        cutoff = self.expiry_cutoff()
+
+        def predicate(instrument: TradableInstrument) -> bool:
+            # Type filter
+            if types is not None and instrument.instrument_type not in types:
+                return False
+
+            # Leverage filter
+            leverage = instrument.leverage
+            if leverage < min_leverage or leverage > max_leverage:
                 return False
 
-        # Expiry filter
-        if self.exclude_expiring_within_days > 0 and instrument.has_expiry:
-            from datetime import datetime, timedelta
-            cutoff = datetime.now() + timedelta(days=self.exclude_expiring_within_days)
-            if instrument.expiry_date and instrument.expiry_date < cutoff:
+            # Broker filter
+            if brokers is not None and instrument.broker not in brokers:
                 return False
 
-        return True
+            # Cost filter
+            if instrument.trading_costs > max_trading_costs:
+                return False
+
+            # Short selling filter
+            if require_short_selling and not instrument.metadata.get("short_selling", True):
+                return False
+
+            # Expiry filter
+            if cutoff is not None:
+                expiry_date = instrument.expiry_date
+                if expiry_date and expiry_date < cutoff:
+                    return False
+
+            return True
+
+        return predicate
+
+
+def _accepts_pruning(resolve: Callable[..., Any]) -> bool:
+    """Check whether a strategy's resolve() takes the pruning criteria."""
+    try:
+        params = inspect.signature(resolve).parameters
+    except (TypeError, ValueError):
+        return False
+    return "max_trading_costs" in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _supports(strategy: InstrumentResolverStrategy, asset_class: AssetClass) -> bool:
+    """Check a strategy's optional supported_asset_classes declaration."""
+    supported = getattr(strategy, "supported_asset_classes", None)
+    # Strategies without a declaration are tried for every asset class
+    return not isinstance(supported, frozenset) or asset_class in supported
 
 
 class DerivativeResolverProtocol(Protocol):
@@ -118,6 +177,7 @@ class DerivativeResolver:
         self,
         config: Optional["DerivativeConfig"] = None,
         strategies: Optional[List[InstrumentResolverStrategy]] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Initialize resolver with configuration.
@@ -125,8 +185,14 @@ class DerivativeResolver:
         Args:
             config: Derivative configuration
             strategies: Custom strategies (default: CFD, Turbo, Future)
+            max_workers: Resolve underlyings on this many threads; worth it
+                for strategies that call broker APIs. None resolves
+                sequentially (the built-in mock strategies are CPU-bound)
         """
         self.config = config
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         self._strategies: Dict[InstrumentType, InstrumentResolverStrategy] = {}
 
         # Initialize default strategies
@@ -140,12 +206,18 @@ class DerivativeResolver:
                 InstrumentType.FUTURE: FutureResolver(),
             }
 
+        # Config conversions done once, reused by every resolve call
+        self._config_types: Tuple[InstrumentType, ...] = (
+            tuple(InstrumentType(t) for t in config.instrument_types) if config else ()
+        )
+        self._default_brokers: Tuple[str, ...] = (
+            tuple(config.brokers) if config and config.brokers else ("Interactive Brokers",)
+        )
+
         # Get enabled types from config
         self._enabled_types: List[InstrumentType] = []
         if config:
-            self._enabled_types = [
-                InstrumentType(t) for t in config.instrument_types
-            ]
+            self._enabled_types = list(self._config_types)
         else:
             self._enabled_types = list(self._strategies.keys())
 
@@ -181,36 +253,39 @@ class DerivativeResolver:
 
         # Get brokers
         brokers = filter_criteria.brokers or self._get_default_brokers()
+        matches = filter_criteria.compile()
+        plan = self._build_plan(filter_criteria, brokers)
+        # Narrow the plan per asset class once, so each underlying only
+        # visits strategies that can serve it
+        plans = {
+            asset_class: [
+                step for step in plan if _supports(self._strategies[step[2]], asset_class)
+            ]
+            for asset_class in AssetClass
+        }
+
+        def resolve_one(underlying: Asset) -> List[TradableInstrument]:
+            filtered: List[TradableInstrument] = []
+
+            for resolve, broker, inst_type in plans[underlying.asset_class]:
+                try:
+                    # Stream through the filter; rejected instruments are never collected
+                    filtered.extend(filter(matches, resolve(underlying, broker, leverage_range)))
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to resolve {inst_type.value} for "
+                        f"{underlying.symbol} at {broker}: {e}"
+                    )
+
+            return filtered
+
+        if self._max_workers and len(underlyings) > 1:
+            # map keeps input order, so results match the sequential path
+            resolved = self._get_executor().map(resolve_one, underlyings)
+        else:
+            resolved = map(resolve_one, underlyings)
 
-        for underlying in underlyings:
-            instruments: List[TradableInstrument] = []
-
-            for inst_type in self._enabled_types:
-                strategy = self._strategies.get(inst_type)
-                if not strategy:
-                    continue
-
-                # Skip if type not in filter
-                if filter_criteria.instrument_types:
-                    if inst_type not in filter_criteria.instrument_types:
-                        continue
-
-                # Resolve for each broker
-                for broker in brokers:
-                    try:
-                        resolved = strategy.resolve(
-                            underlying, broker, leverage_range
-                        )
-                        instruments.extend(resolved)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to resolve {inst_type.value} for "
-                            f"{underlying.symbol} at {broker}: {e}"
-                        )
-
-            # Apply filter
-            filtered = [i for i in instruments if filter_criteria.matches(i)]
-            
+        for underlying, filtered in zip(underlyings, resolved):
             if filtered:
                 result[underlying.symbol] = filtered
 
@@ -243,24 +318,84 @@ class DerivativeResolver:
         if not instruments:
             return None
 
-        # Sort by preference
+        # Pick by preference in one O(N) pass; max keeps the first of equal
+        # scores, as the previous stable descending sort did
+        preferred_bonus = 100.0 if prefer_type else 0.0
+        # Normalize once so the per-instrument check is an identity test
+        preferred = InstrumentType(prefer_type) if prefer_type else None
+
         def score(inst: TradableInstrument) -> float:
-            score = 0.0
-            
-            # Prefer requested type
-            if prefer_type and inst.instrument_type == prefer_type:
-                score += 100.0
-            
-            # Lower costs are better
-            score -= inst.trading_costs * 10
-            
-            # Higher leverage (within limits) is often preferred
-            score += min(inst.leverage, 10.0)
-            
-            return score
-
-        instruments.sort(key=score, reverse=True)
-        return instruments[0]
+            leverage = inst.leverage
+            return (
+                # Prefer requested type
+                (preferred_bonus if inst.instrument_type is preferred else 0.0)
+                # Lower costs are better
+                - inst.trading_costs * 10
+                # Higher leverage (within limits) is often preferred
+                + (leverage if leverage < 10.0 else 10.0)
+            )
+
+        return max(instruments, key=score)
+
+    def close(self) -> None:
+        """Shut down the worker threads, if any were started."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def clear_cache(self) -> None:
+        """
+        Forget results memoized by the strategies.
+
+        Call when a backtest advances in time, so clock-dependent details
+        (Turbo and Future expiries) are rebuilt. Strategies without a
+        clear_cache() are skipped.
+        """
+        for strategy in self._strategies.values():
+            clear = getattr(strategy, "clear_cache", None)
+            if clear is not None:
+                clear()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it on first parallel resolve."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="derivative-resolver",
+                )
+            return self._executor
+
+    def _build_plan(
+        self,
+        filter_criteria: InstrumentFilter,
+        brokers: Sequence[str],
+    ) -> List[Tuple[Callable[..., List[TradableInstrument]], str, InstrumentType]]:
+        """
+        Flatten enabled types and brokers into (resolve, broker, type) steps.
+
+        Built once per call so the per-underlying loop does no strategy
+        lookups or type-filter checks. Strategies that accept the optional
+        pruning criteria get them bound into their resolve callable.
+        """
+        wanted = filter_criteria.instrument_types
+        expiry_cutoff = filter_criteria.expiry_cutoff()
+        plan: List[Tuple[Callable[..., List[TradableInstrument]], str, InstrumentType]] = []
+        for inst_type in self._enabled_types:
+            strategy = self._strategies.get(inst_type)
+            if strategy is None or (wanted and inst_type not in wanted):
+                continue
+            resolve: Callable[..., List[TradableInstrument]] = strategy.resolve
+            if _accepts_pruning(resolve):
+                resolve = functools.partial(
+                    strategy.resolve,
+                    max_trading_costs=filter_criteria.max_trading_costs,
+                    require_short_selling=filter_criteria.require_short_selling,
+                    min_expiry_cutoff=expiry_cutoff,
+                )
+            plan.extend((resolve, broker, inst_type) for broker in brokers)
+        return plan
 
     def _build_filter_from_config(self) -> InstrumentFilter:
         """Build filter from configuration."""
@@ -268,17 +403,15 @@ class DerivativeResolver:
             return InstrumentFilter()
 
         return InstrumentFilter(
-            instrument_types=[InstrumentType(t) for t in self.config.instrument_types],
+            instrument_types=list(self._config_types),
             min_leverage=self.config.min_leverage,
             max_leverage=self.config.max_leverage,
             brokers=self.config.brokers,
         )
 
-    def _get_default_brokers(self) -> List[str]:
+    def _get_default_brokers(self) -> Tuple[str, ...]:
         """Get default broker list."""
-        if self.config and self.config.brokers:
-            return self.config.brokers
-        return ["Interactive Brokers"]
+        return self._default_brokers
 
     def register_strategy(
         self,
@@ -6,13 +6,17 @@ This module defines the core entities for derivative instruments.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from universe_screener.domain.entities import Asset
 
+# Shared by every instrument built without metadata; read-only so it cannot leak
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
 
 class InstrumentType(str, Enum):
     """Type of derivative instrument."""
@@ -26,7 +30,11 @@ class InstrumentType(str, Enum):
     ETF = "ETF"  # Leveraged ETF (not strictly derivative)
 
 
-@dataclass(frozen=True)
+# Plain dict lookup instead of the Enum .value descriptor in to_dict()
+_TYPE_VALUES: Dict[InstrumentType, str] = {t: t.value for t in InstrumentType}
+
+
+@dataclass(frozen=True, slots=True)
 class TradableInstrument:
     """
     Represents a tradable derivative instrument.
@@ -64,10 +72,14 @@ class TradableInstrument:
     expiry_date: Optional[datetime] = None
     knockout_level: Optional[float] = None
     strike_price: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # None means no metadata; replaced by the shared empty mapping below so
+    # construction runs no default_factory
+    metadata: Mapping[str, Any] = None  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
         """Validate instrument parameters."""
+        if self.metadata is None:
+            object.__setattr__(self, "metadata", _EMPTY_METADATA)
         if self.leverage < 1.0:
             raise ValueError(f"Leverage must be >= 1.0, got {self.leverage}")
         if self.trading_costs < 0:
@@ -104,7 +116,7 @@ class TradableInstrument:
         return {
             "underlying_symbol": self.underlying.symbol,
             "underlying_name": self.underlying.name,
-            "instrument_type": self.instrument_type.value,
+            "instrument_type": _TYPE_VALUES[self.instrument_type],
             "leverage": self.leverage,
             "broker": self.broker,
             "trading_costs": self.trading_costs,
@@ -116,6 +128,6 @@ class TradableInstrument:
             "expiry_date": self.expiry_date.isoformat() if self.expiry_date else None,
             "knockout_level": self.knockout_level,
             "strike_price": self.strike_price,
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
         }
 
@@ -11,18 +11,64 @@ Real implementations would connect to broker APIs.
 
 from __future__ import annotations
 
-import hashlib
+import functools
 import logging
+import sys
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional, Protocol
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 from universe_screener.derivatives.entities import InstrumentType, TradableInstrument
-from universe_screener.domain.entities import Asset
+from universe_screener.domain.entities import Asset, AssetClass
 
 logger = logging.getLogger(__name__)
 
+# Crypto bases with CFDs, matched against the token before "-" (e.g. "BTC-USD")
+_MAJOR_CRYPTO: frozenset[str] = frozenset({"BTC", "ETH", "SOL", "XRP", "ADA"})
+
+# Turbo directions, built once rather than as a list per resolve()
+_DIRECTIONS = ("LONG", "SHORT")
+
+# Read-only metadata shared by every instrument of a kind, instead of a
+# fresh dict literal per instrument
+_CFD_METADATA = MappingProxyType(
+    {"product_type": "CFD", "tradable_hours": "24/5", "short_selling": True}
+)
+_TURBO_METADATA = {
+    direction: MappingProxyType(
+        {"direction": direction, "issuer": "Mock Issuer", "barrier_type": "KNOCKOUT"}
+    )
+    for direction in _DIRECTIONS
+}
+
+# Mock CFD leverage by asset class; others get 5x
+_BASE_LEVERAGE: dict[AssetClass, float] = {
+    AssetClass.STOCK: 5.0,
+    AssetClass.CRYPTO: 2.0,  # Lower leverage for volatile crypto
+    AssetClass.FOREX: 30.0,  # High leverage for forex
+}
+
+# Mock CFD spreads by asset class; others use CFDConfig.default_spread_pct
+_SPREAD: dict[AssetClass, float] = {
+    AssetClass.FOREX: 0.01,  # Tight spreads for forex
+    AssetClass.CRYPTO: 0.15,  # Wider spreads for crypto
+}
+
 
 class InstrumentResolverStrategy(Protocol):
     """Protocol for instrument resolution strategies."""
@@ -37,14 +83,26 @@ class InstrumentResolverStrategy(Protocol):
         underlying: Asset,
         broker: str,
         leverage_range: tuple[float, float],
+        *,
+        max_trading_costs: Optional[float] = None,
+        require_short_selling: bool = False,
+        min_expiry_cutoff: Optional[datetime] = None,
     ) -> List[TradableInstrument]:
         """
         Resolve tradable instruments for an underlying asset.
 
+        The keyword-only criteria let a strategy skip building instruments
+        the resolver's filter would reject. They are optional: the resolver
+        only passes them to strategies whose resolve() accepts them, and
+        still filters the results.
+
         Args:
             underlying: The underlying asset
             broker: Broker name
             leverage_range: (min_leverage, max_leverage) tuple
+            max_trading_costs: Skip instruments costing more than this
+            require_short_selling: Skip instruments that cannot be shorted
+            min_expiry_cutoff: Skip instruments expiring before this
 
         Returns:
             List of available tradable instruments
@@ -52,7 +110,93 @@ class InstrumentResolverStrategy(Protocol):
         ...
 
 
-@dataclass
+class _ResultCache:
+    """
+    Bounded memo of resolve() results for one resolver.
+
+    Reads are lock-free dict lookups; writes take a lock so concurrent
+    resolves (DerivativeResolver with max_workers) evict safely. When
+    full, the oldest entry is dropped.
+    """
+
+    __slots__ = ("_entries", "_lock", "_maxsize")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._entries: Dict[Tuple[Any, ...], Tuple[TradableInstrument, ...]] = {}
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[TradableInstrument, ...]]:
+        return self._entries.get(key)
+
+    def put(
+        self, key: Tuple[Any, ...], instruments: Tuple[TradableInstrument, ...]
+    ) -> Tuple[TradableInstrument, ...]:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = instruments
+        return instruments
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _memoize_resolve(
+    resolve: Callable[..., Iterable[TradableInstrument]],
+) -> Callable[..., List[TradableInstrument]]:
+    """
+    Memoize a strategy's resolve() on its arguments in self._results.
+
+    The decorated body may return any iterable, typically a generator,
+    which is drained once straight into the cached tuple. Instruments
+    are frozen, so hits return the cached instruments themselves, in a
+    fresh list the caller may modify. Results that depend on the clock
+    (expiry dates) stay as first computed until the strategy's
+    clear_cache() is called.
+
+    min_expiry_cutoff is not part of the key: callers derive it from
+    datetime.now(), so it differs on every call. The body is resolved
+    without it and the cutoff is applied to the cached instruments.
+    """
+
+    # Keep the wrapper's own annotations: callers always get a list
+    @functools.wraps(resolve, assigned=("__module__", "__name__", "__qualname__", "__doc__"))
+    def wrapper(
+        self: Any,
+        underlying: Asset,
+        broker: str,
+        leverage_range: tuple[float, float],
+        *,
+        max_trading_costs: Optional[float] = None,
+        require_short_selling: bool = False,
+        min_expiry_cutoff: Optional[datetime] = None,
+    ) -> List[TradableInstrument]:
+        key = (underlying.symbol, broker, leverage_range, max_trading_costs, require_short_selling)
+        cached = self._results.get(key)
+        if cached is None:
+            instruments = resolve(
+                self,
+                underlying,
+                broker,
+                leverage_range,
+                max_trading_costs=max_trading_costs,
+                require_short_selling=require_short_selling,
+            )
+            cached = self._results.put(key, tuple(instruments))
+        if min_expiry_cutoff is None:
+            return list(cached)
+        return [
+            instrument
+            for instrument in cached
+            if instrument.expiry_date is None or instrument.expiry_date >= min_expiry_cutoff
+        ]
+
+    return wrapper
+
+
+@dataclass(slots=True)
 class CFDConfig:
     """Configuration for CFD resolution."""
 
@@ -74,18 +218,36 @@ class CFDResolver:
     connect to broker APIs (e.g., Interactive Brokers, IG, CMC Markets).
     """
 
+    # Asset classes resolve() can return instruments for; the resolver
+    # skips this strategy for any other underlying without calling it
+    supported_asset_classes: ClassVar[frozenset[AssetClass]] = frozenset(
+        {AssetClass.STOCK, AssetClass.CRYPTO, AssetClass.FOREX}
+    )
+
+    __slots__ = ("config", "_results")
+
     def __init__(self, config: Optional[CFDConfig] = None) -> None:
         self.config = config or CFDConfig()
+        self._results = _ResultCache()
 
     @property
     def instrument_type(self) -> InstrumentType:
         return InstrumentType.CFD
 
+    def clear_cache(self) -> None:
+        """Forget memoized results, e.g. when a backtest advances in time."""
+        self._results.clear()
+
+    @_memoize_resolve
     def resolve(
         self,
         underlying: Asset,
         broker: str,
         leverage_range: tuple[float, float],
+        *,
+        max_trading_costs: Optional[float] = None,
+        require_short_selling: bool = False,
+        min_expiry_cutoff: Optional[datetime] = None,
     ) -> List[TradableInstrument]:
         """
         Resolve CFD instruments for an underlying.
@@ -104,23 +266,23 @@ class CFDResolver:
         if leverage < min_leverage or leverage > max_leverage:
             return []
 
-        # Generate CFD instrument
+        spread = self._calculate_spread(underlying)
+        if max_trading_costs is not None and spread > max_trading_costs:
+            return []
+
+        # Generate CFD instrument (always shortable, no expiry)
         cfd = TradableInstrument(
             underlying=underlying,
             instrument_type=InstrumentType.CFD,
             leverage=leverage,
-            broker=broker,
-            trading_costs=self._calculate_spread(underlying),
+            broker=sys.intern(broker),
+            trading_costs=spread,
             min_position_size=self.config.min_position_units,
-            symbol=f"{underlying.symbol}.CFD",
+            symbol=sys.intern(f"{underlying.symbol}.CFD"),
             currency="USD",
             margin_requirement=100.0 / leverage,
             overnight_fee=self.config.overnight_fee_pct,
-            metadata={
-                "product_type": "CFD",
-                "tradable_hours": "24/5",
-                "short_selling": True,
-            },
+            metadata=_CFD_METADATA,
         )
 
         logger.debug(f"Resolved CFD for {underlying.symbol}: {leverage}x leverage")
@@ -129,15 +291,12 @@ class CFDResolver:
     def _is_cfd_available(self, asset: Asset) -> bool:
         """Check if CFD is available for this asset (mock)."""
         # Simulate: CFDs available for stocks and major crypto
-        from universe_screener.domain.entities import AssetClass
-
         if asset.asset_class == AssetClass.STOCK:
             # Most stocks have CFDs
             return True
         if asset.asset_class == AssetClass.CRYPTO:
             # Only major crypto has CFDs
-            major_crypto = ["BTC", "ETH", "SOL", "XRP", "ADA"]
-            return any(c in asset.symbol for c in major_crypto)
+            return asset.symbol.partition("-")[0] in _MAJOR_CRYPTO
         if asset.asset_class == AssetClass.FOREX:
             # All forex pairs have CFDs
             return True
@@ -150,33 +309,17 @@ class CFDResolver:
         max_lev: float,
     ) -> float:
         """Calculate available leverage for asset (mock)."""
-        from universe_screener.domain.entities import AssetClass
-
-        # Simulate: Different leverage by asset class
-        if asset.asset_class == AssetClass.STOCK:
-            base_leverage = 5.0
-        elif asset.asset_class == AssetClass.CRYPTO:
-            base_leverage = 2.0  # Lower leverage for volatile crypto
-        elif asset.asset_class == AssetClass.FOREX:
-            base_leverage = 30.0  # High leverage for forex
-        else:
-            base_leverage = 5.0
+        base_leverage = _BASE_LEVERAGE.get(asset.asset_class, 5.0)
 
         # Clamp to range
         return max(min_lev, min(max_lev, base_leverage))
 
     def _calculate_spread(self, asset: Asset) -> float:
         """Calculate spread/trading cost (mock)."""
-        from universe_screener.domain.entities import AssetClass
+        return _SPREAD.get(asset.asset_class, self.config.default_spread_pct)
 
-        if asset.asset_class == AssetClass.FOREX:
-            return 0.01  # Tight spreads for forex
-        if asset.asset_class == AssetClass.CRYPTO:
-            return 0.15  # Wider spreads for crypto
-        return self.config.default_spread_pct
 
-
-@dataclass
+@dataclass(slots=True)
 class TurboConfig:
     """Configuration for Turbo certificate resolution."""
 
@@ -198,95 +341,101 @@ class TurboResolver:
     (e.g., Société Générale, BNP Paribas, Vontobel).
     """
 
+    # Turbos mainly for stocks on European exchanges
+    supported_asset_classes: ClassVar[frozenset[AssetClass]] = frozenset({AssetClass.STOCK})
+
+    __slots__ = ("config", "_results")
+
     def __init__(self, config: Optional[TurboConfig] = None) -> None:
         self.config = config or TurboConfig()
+        self._results = _ResultCache()
 
     @property
     def instrument_type(self) -> InstrumentType:
         return InstrumentType.TURBO
 
+    def clear_cache(self) -> None:
+        """Forget memoized results, e.g. when a backtest advances in time."""
+        self._results.clear()
+
+    @_memoize_resolve
     def resolve(
         self,
         underlying: Asset,
         broker: str,
         leverage_range: tuple[float, float],
-    ) -> List[TradableInstrument]:
+        *,
+        max_trading_costs: Optional[float] = None,
+        require_short_selling: bool = False,
+        min_expiry_cutoff: Optional[datetime] = None,
+    ) -> Iterator[TradableInstrument]:
         """
         Resolve Turbo instruments for an underlying.
         
-        Generates multiple Turbo products with different knockout levels.
+        Generates multiple Turbo products with different knockout levels,
+        yielding them one at a time.
         """
         min_leverage, max_leverage = leverage_range
 
         # Turbos mainly for stocks and indices
         if not self._is_turbo_available(underlying):
-            return []
+            return
+
+        if max_trading_costs is not None and self.config.trading_cost_pct > max_trading_costs:
+            return
 
-        # Generate multiple Turbo products
-        instruments = []
+        expiry = datetime.now() + timedelta(days=self.config.default_expiry_days)
+        if min_expiry_cutoff is not None and expiry < min_expiry_cutoff:
+            return
+
+        leverage_steps = self._get_leverage_steps(min_leverage, max_leverage)
+        logger.debug(
+            f"Resolving {len(_DIRECTIONS) * len(leverage_steps)} Turbos for {underlying.symbol}"
+        )
 
         # Simulate current price (in real implementation, fetch from market data)
         current_price = self._get_simulated_price(underlying)
 
+        # One shared string object per broker name across all instruments
+        broker = sys.intern(broker)
+
         # Generate Turbo Long and Turbo Short
-        for direction in ["LONG", "SHORT"]:
-            for leverage in self._get_leverage_steps(min_leverage, max_leverage):
-                knockout = self._calculate_knockout(
-                    current_price, leverage, direction
-                )
-                expiry = datetime.now() + timedelta(days=self.config.default_expiry_days)
+        for direction in _DIRECTIONS:
+            metadata = _TURBO_METADATA[direction]
+            for leverage in leverage_steps:
+                knockout = self._calculate_knockout(current_price, leverage, direction)
 
-                turbo = TradableInstrument(
+                yield TradableInstrument(
                     underlying=underlying,
                     instrument_type=InstrumentType.TURBO,
                     leverage=leverage,
                     broker=broker,
                     trading_costs=self.config.trading_cost_pct,
                     min_position_size=self.config.min_position_euros,
-                    symbol=f"{underlying.symbol}.TURBO.{direction[0]}{int(leverage)}",
+                    symbol=sys.intern(f"{underlying.symbol}.TURBO.{direction[0]}{int(leverage)}"),
                     currency="EUR",
                     margin_requirement=0.0,  # Turbos are fully paid
                     overnight_fee=0.0,  # No overnight (built into knockout)
                     expiry_date=expiry,
                     knockout_level=knockout,
-                    metadata={
-                        "direction": direction,
-                        "issuer": "Mock Issuer",
-                        "barrier_type": "KNOCKOUT",
-                    },
+                    metadata=metadata,
                 )
-                instruments.append(turbo)
-
-        logger.debug(
-            f"Resolved {len(instruments)} Turbos for {underlying.symbol}"
-        )
-        return instruments
 
     def _is_turbo_available(self, asset: Asset) -> bool:
         """Check if Turbos are available (mock)."""
-        from universe_screener.domain.entities import AssetClass
-
-        # Turbos mainly for stocks on European exchanges
-        return asset.asset_class == AssetClass.STOCK
+        return asset.asset_class in self.supported_asset_classes
 
     def _get_simulated_price(self, asset: Asset) -> float:
         """Get simulated current price (mock)."""
-        # Generate deterministic price from symbol hash
-        hash_val = int(hashlib.md5(asset.symbol.encode()).hexdigest()[:8], 16)
-        return 50.0 + (hash_val % 200)  # Price between 50 and 250
+        return _simulated_price(asset.symbol)
 
     def _get_leverage_steps(
         self,
         min_lev: float,
         max_lev: float,
-    ) -> List[float]:
+    ) -> tuple[float, ...]:
         """Generate leverage steps within range."""
-        steps = []
-        current = max(min_lev, 5.0)
-        while current <= max_lev:
-            steps.append(current)
-            current += 5.0  # Step by 5
-        return steps or [min_lev]
+        return _leverage_steps(min_lev, max_lev)
 
     def _calculate_knockout(
         self,
@@ -295,16 +444,10 @@ class TurboResolver:
         direction: str,
     ) -> float:
         """Calculate knockout level based on leverage."""
-        # Higher leverage = closer knockout
-        distance_pct = 100.0 / leverage
-        
-        if direction == "LONG":
-            return price * (1 - distance_pct / 100)
-        else:  # SHORT
-            return price * (1 + distance_pct / 100)
+        return _knockout(price, leverage, direction == "LONG")
 
 
-@dataclass
+@dataclass(slots=True)
 class FutureConfig:
     """Configuration for futures resolution."""
 
@@ -324,43 +467,77 @@ class FutureResolver:
     or data providers (e.g., CME, Interactive Brokers).
     """
 
+    # Futures for stocks (single stock futures) and forex
+    supported_asset_classes: ClassVar[frozenset[AssetClass]] = frozenset(
+        {AssetClass.STOCK, AssetClass.FOREX}
+    )
+
+    __slots__ = ("config", "_results")
+
     def __init__(self, config: Optional[FutureConfig] = None) -> None:
         self.config = config or FutureConfig()
+        self._results = _ResultCache()
 
     @property
     def instrument_type(self) -> InstrumentType:
         return InstrumentType.FUTURE
 
+    def clear_cache(self) -> None:
+        """Forget memoized results, e.g. when a backtest advances in time."""
+        self._results.clear()
+
+    @_memoize_resolve
     def resolve(
         self,
         underlying: Asset,
         broker: str,
         leverage_range: tuple[float, float],
-    ) -> List[TradableInstrument]:
+        *,
+        max_trading_costs: Optional[float] = None,
+        require_short_selling: bool = False,
+        min_expiry_cutoff: Optional[datetime] = None,
+    ) -> Iterator[TradableInstrument]:
         """
         Resolve futures contracts for an underlying.
         
-        Generates futures with different expiry months.
+        Generates futures with different expiry months, yielding them
+        one at a time.
         """
         min_leverage, max_leverage = leverage_range
 
         # Futures mainly for indices, commodities, major stocks
         if not self._is_future_available(underlying):
-            return []
-
-        instruments = []
+            return
 
         # Calculate leverage from margin
         leverage = 100.0 / self.config.margin_pct
         if leverage < min_leverage or leverage > max_leverage:
-            return []
+            return
+
+        if max_trading_costs is not None and self.config.trading_cost_pct > max_trading_costs:
+            return
+
+        logger.debug(f"Resolving futures for {underlying.symbol}")
+
+        broker = sys.intern(broker)
+        # Same for every contract on this underlying
+        metadata = MappingProxyType(
+            {
+                "contract_size": self._get_contract_size(underlying),
+                "tick_size": 0.01,
+                "exchange": self._get_exchange(underlying),
+            }
+        )
 
         # Generate front-month and next-month contracts
+        now = datetime.now()
         for months_ahead in [1, 2, 3]:
-            expiry = self._get_expiry_date(months_ahead)
+            expiry = self._get_expiry_date(months_ahead, now)
+            if min_expiry_cutoff is not None and expiry < min_expiry_cutoff:
+                continue
             contract_code = self._get_contract_code(underlying, expiry)
 
-            future = TradableInstrument(
+            yield TradableInstrument(
                 underlying=underlying,
                 instrument_type=InstrumentType.FUTURE,
                 leverage=leverage,
@@ -372,52 +549,25 @@ class FutureResolver:
                 margin_requirement=self.config.margin_pct,
                 overnight_fee=0.0,  # No overnight for futures
                 expiry_date=expiry,
-                metadata={
-                    "contract_size": self._get_contract_size(underlying),
-                    "tick_size": 0.01,
-                    "exchange": self._get_exchange(underlying),
-                },
+                metadata=metadata,
             )
-            instruments.append(future)
-
-        logger.debug(
-            f"Resolved {len(instruments)} futures for {underlying.symbol}"
-        )
-        return instruments
 
     def _is_future_available(self, asset: Asset) -> bool:
         """Check if futures are available (mock)."""
-        from universe_screener.domain.entities import AssetClass
+        return asset.asset_class in self.supported_asset_classes
 
-        # Futures for stocks (single stock futures) and forex
-        return asset.asset_class in (AssetClass.STOCK, AssetClass.FOREX)
-
-    def _get_expiry_date(self, months_ahead: int) -> datetime:
+    def _get_expiry_date(self, months_ahead: int, now: Optional[datetime] = None) -> datetime:
         """Get expiry date for contract (third Friday of month)."""
-        now = datetime.now()
-        target_month = now.month + months_ahead
-        target_year = now.year
-
-        while target_month > 12:
-            target_month -= 12
-            target_year += 1
-
-        # Third Friday of the month
-        first_day = datetime(target_year, target_month, 1)
-        # Find first Friday
-        days_to_friday = (4 - first_day.weekday()) % 7
-        first_friday = first_day + timedelta(days=days_to_friday)
-        # Third Friday
-        third_friday = first_friday + timedelta(weeks=2)
-        
-        return third_friday
+        if now is None:
+            now = datetime.now()
+        return datetime(*_third_friday(now.year, now.month, months_ahead))
 
     def _get_contract_code(self, asset: Asset, expiry: datetime) -> str:
         """Generate contract code."""
         month_codes = "FGHJKMNQUVXZ"
         month_code = month_codes[expiry.month - 1]
         year_code = str(expiry.year)[-1]
-        return f"{asset.symbol}{month_code}{year_code}"
+        return sys.intern(f"{asset.symbol}{month_code}{year_code}")
 
     def _get_contract_size(self, asset: Asset) -> int:
         """Get contract size (mock)."""
@@ -427,3 +577,39 @@ class FutureResolver:
         """Get exchange for futures (mock)."""
         return "CME"  # Simplified
 
+
+@functools.lru_cache(maxsize=4096)
+def _simulated_price(symbol: str) -> float:
+    """Deterministic mock price from a symbol checksum, between 50 and 250."""
+    # CRC32 is a single C call; a cryptographic hash is not needed here
+    return 50.0 + (zlib.crc32(symbol.encode()) % 200)
+
+
+@functools.lru_cache(maxsize=64)
+def _leverage_steps(min_lev: float, max_lev: float) -> tuple[float, ...]:
+    """Turbo leverages in steps of 5 from max(min_lev, 5) up to max_lev."""
+    # Leverage ranges rarely change within a run, so this loop runs once per range
+    steps = []
+    current = max(min_lev, 5.0)
+    while current <= max_lev:
+        steps.append(current)
+        current += 5.0  # Step by 5
+    return tuple(steps) or (min_lev,)
+
+
+def _knockout(price: float, leverage: float, is_long: bool) -> float:
+    """Knockout barrier 1/leverage away from price (below for long, above for short)."""
+    # Higher leverage = closer knockout
+    distance = 1.0 / leverage
+    return price * (1.0 - distance) if is_long else price * (1.0 + distance)
+
+
+@functools.lru_cache(maxsize=256)
+def _third_friday(year: int, month: int, months_ahead: int) -> tuple[int, int, int]:
+    """(year, month, day) of the third Friday months_ahead after year/month."""
+    target_year, target_month = divmod(month - 1 + months_ahead, 12)
+    target_year += year
+    target_month += 1
+    # weekday() of the 1st: 0 = Monday, so Friday is 4
+    first_weekday = datetime(target_year, target_month, 1).weekday()
+    return target_year, target_month, 1 + (4 - first_weekday) % 7 + 14
@@ -3,15 +3,23 @@ Core Domain Entities.
 
 This module defines the fundamental entities of the Universe Screener domain.
 These entities represent the core concepts that the business logic operates on.
+
+Entities built in bulk inside the pipeline (Asset, StageResult) are slotted
+frozen dataclasses without per-instance validation; pydantic models remain
+for request/result objects at the API boundary. Raw external records are
+validated once on ingest via Asset.from_raw.
 """
 
 from __future__ import annotations
 
+import functools
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer, TypeAdapter
 
 
 class AssetClass(str, Enum):
@@ -40,33 +48,69 @@ class AssetType(str, Enum):
     FOREX_CROSS = "FOREX_CROSS"
 
 
-class Asset(BaseModel):
-    """Represents a tradable financial instrument."""
-
-    symbol: str = Field(..., description="Ticker symbol")
-    name: str = Field(..., description="Full company/asset name")
-    asset_class: AssetClass = Field(..., description="Asset classification")
-    asset_type: AssetType = Field(
-        default=AssetType.COMMON_STOCK, description="Specific asset type"
-    )
-    exchange: str = Field(..., description="Trading exchange")
-    listing_date: date = Field(..., description="Date when asset was listed")
-    delisting_date: Optional[date] = Field(
-        default=None, description="Date when asset was delisted"
-    )
-    isin: Optional[str] = Field(default=None, description="ISIN identifier")
-    sector: Optional[str] = Field(default=None, description="Industry sector")
-    country: Optional[str] = Field(default=None, description="Country of domicile")
-
-    model_config = {"frozen": True}
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class Asset:
+    """
+    Represents a tradable financial instrument.
+
+    A slotted frozen dataclass rather than a pydantic model: universes hold
+    many assets and are rebuilt per screening. Identity is the symbol; it
+    is interned and its hash computed once, since assets are hashed and
+    compared constantly in set/dict based filter stages.
+    """
+
+    symbol: str  # Ticker symbol
+    name: str  # Full company/asset name
+    asset_class: AssetClass
+    asset_type: AssetType = AssetType.COMMON_STOCK
+    exchange: str  # Trading exchange
+    listing_date: date
+    delisting_date: Optional[date] = None
+    isin: Optional[str] = None
+    sector: Optional[str] = None
+    country: Optional[str] = None  # Country of domicile
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        symbol = sys.intern(self.symbol)
+        object.__setattr__(self, "symbol", symbol)
+        object.__setattr__(self, "_hash", hash(symbol))
+
+    @classmethod
+    def from_raw(cls, raw: Mapping[str, Any]) -> Asset:
+        """
+        Build an asset from an external record, with validation.
+
+        Use at I/O boundaries (database rows, CSV, API payloads): strings
+        are coerced to enums and dates, and missing or malformed fields
+        raise. Code holding already-typed values should call Asset(...)
+        directly.
+
+        Args:
+            raw: Field name -> value mapping
+
+        Returns:
+            Validated Asset
+
+        Raises:
+            pydantic.ValidationError: If the record is invalid
+        """
+        return _asset_adapter().validate_python(raw)
 
     def __hash__(self) -> int:
-        return hash(self.symbol)
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Asset):
             return NotImplemented
-        return self.symbol == other.symbol
+        # Interned symbols make the string compare an identity check
+        return self._hash == other._hash and self.symbol == other.symbol
+
+    def __reduce__(self) -> Any:
+        # Rebuild via __init__: str hashes differ between processes, so the
+        # cached hash must not travel with a pickle
+        init = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        return functools.partial(Asset, **init), ()
 
 
 class ScreeningRequest(BaseModel):
@@ -82,19 +126,22 @@ class ScreeningRequest(BaseModel):
     model_config = {"frozen": True}
 
 
-class StageResult(BaseModel):
+# Reason mappings may be lazily formatted (RejectionReasons); serialize as dicts
+ReasonMapping = Annotated[Mapping[str, str], PlainSerializer(dict)]
+
+
+@dataclass(frozen=True, slots=True)
+class StageResult:
     """Result of a single filter stage for audit trail."""
 
     stage_name: str
     input_count: int
     output_count: int
     duration_seconds: float
-    filtered_assets: List[str] = Field(
-        default_factory=list, description="Symbols of filtered assets"
-    )
-    filter_reasons: Dict[str, str] = Field(
-        default_factory=dict, description="Symbol -> rejection reason"
-    )
+    # Symbols of filtered assets
+    filtered_assets: List[str] = field(default_factory=list)
+    # Symbol -> rejection reason (may format lazily on read)
+    filter_reasons: ReasonMapping = field(default_factory=dict)
 
     @property
     def reduction_ratio(self) -> float:
@@ -136,3 +183,9 @@ class ScreeningResult(BaseModel):
         if not self.tradable_instruments:
             return 0
         return sum(len(v) for v in self.tradable_instruments.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _asset_adapter() -> TypeAdapter[Asset]:
+    """Pydantic validator for Asset, built on first use."""
+    return TypeAdapter(Asset)
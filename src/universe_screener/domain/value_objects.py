@@ -3,14 +3,22 @@ Value Objects for Domain Layer.
 
 Value objects are immutable objects that describe characteristics of entities
 but have no conceptual identity.
+
+Value objects are slotted frozen dataclasses: providers and filters create
+them by the million and pydantic validation plus a per-instance __dict__
+would dominate. Providers are responsible for passing correctly typed values.
 """
 
 from __future__ import annotations
 
+import bisect
+import sys
+from array import array
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from pydantic import BaseModel, Field, computed_field
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 # =============================================================================
@@ -20,6 +28,9 @@ from pydantic import BaseModel, Field, computed_field
 # Market data indexed by asset symbol
 MarketDataDict = Dict[str, List["MarketData"]]
 
+# Columnar market data indexed by asset symbol
+MarketDataColumnsDict = Dict[str, "MarketDataColumns"]
+
 # Asset metadata indexed by symbol
 MetadataDict = Dict[str, Dict[str, Any]]
 
@@ -30,7 +41,8 @@ QualityMetricsDict = Dict[str, "QualityMetrics"]
 RejectionReasonsDict = Dict[str, str]
 
 
-class MarketData(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MarketData:
     """OHLCV market data point."""
 
     date: datetime
@@ -39,40 +51,209 @@ class MarketData(BaseModel):
     low: float
     close: float
     volume: int
+    # close * volume, computed once here; liquidity filters read it per bar
+    dollar_volume: float = field(init=False, repr=False, compare=False)
 
-    model_config = {"frozen": True}
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "dollar_volume", self.close * self.volume)
 
-    @computed_field
-    @property
-    def dollar_volume(self) -> float:
-        """Calculate dollar volume (close * volume)."""
-        return self.close * self.volume
 
+@dataclass(frozen=True)
+class MarketDataColumns:
+    """
+    Column-oriented OHLCV series, sorted by date.
+
+    Prices and volumes are packed C arrays ('d' / 'q'), so a series costs
+    8 bytes per value instead of one MarketData object per bar.
+    """
+
+    dates: Tuple[datetime, ...]
+    open: array
+    high: array
+    low: array
+    close: array
+    volume: array
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[MarketData]) -> MarketDataColumns:
+        """Build columns from date-sorted MarketData rows."""
+        rows = list(rows)
+        return cls(
+            dates=tuple(r.date for r in rows),
+            open=array("d", [r.open for r in rows]),
+            high=array("d", [r.high for r in rows]),
+            low=array("d", [r.low for r in rows]),
+            close=array("d", [r.close for r in rows]),
+            volume=array("q", [r.volume for r in rows]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __sizeof__(self) -> int:
+        """Deep size, so sys.getsizeof accounts for the column buffers."""
+        size = object.__sizeof__(self) + sys.getsizeof(self.dates)
+        if self.dates:
+            size += len(self.dates) * sys.getsizeof(self.dates[0])
+        for column in (self.open, self.high, self.low, self.close, self.volume):
+            size += sys.getsizeof(column)
+        return size
+
+    def between(self, start_date: datetime, end_date: datetime) -> MarketDataColumns:
+        """Bars with start_date <= date <= end_date (binary search on dates)."""
+        lo = bisect.bisect_left(self.dates, start_date)
+        hi = bisect.bisect_right(self.dates, end_date, lo)
+        return MarketDataColumns(
+            dates=self.dates[lo:hi],
+            open=self.open[lo:hi],
+            high=self.high[lo:hi],
+            low=self.low[lo:hi],
+            close=self.close[lo:hi],
+            volume=self.volume[lo:hi],
+        )
 
-class QualityMetrics(BaseModel):
+    def iter_rows(self) -> Iterator[MarketData]:
+        """Materialize MarketData rows for row-wise consumers."""
+        for d, o, h, lo, c, v in zip(
+            self.dates, self.open, self.high, self.low, self.close, self.volume
+        ):
+            yield MarketData(date=d, open=o, high=h, low=lo, close=c, volume=v)
+
+
+@dataclass(frozen=True, slots=True)
+class QualityMetrics:
     """Data quality indicators for an asset."""
 
-    missing_days: int = Field(ge=0)
+    missing_days: int
     last_available_date: datetime
-    news_article_count: Optional[int] = Field(default=None, ge=0)
+    news_article_count: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.missing_days < 0:
+            raise ValueError(f"missing_days must be >= 0, got {self.missing_days}")
+        if self.news_article_count is not None and self.news_article_count < 0:
+            raise ValueError(
+                f"news_article_count must be >= 0, got {self.news_article_count}"
+            )
+
+
+class ReasonCode(str, Enum):
+    """
+    Machine-readable rejection reason; the value is its message template.
+
+    Filters record a code with its numbers and the message is only
+    formatted when someone reads it (see RejectionReasons).
+    """
+
+    # Structural
+    ASSET_TYPE_NOT_ALLOWED = "asset_type={} not in allowed list"
+    EXCHANGE_NOT_ALLOWED = "exchange={} not in allowed list"
+    LISTING_TOO_RECENT = "listing_age={}d < min={}d"
+    DELISTED = "delisted on {}"
+
+    # Data quality
+    NO_QUALITY_METRICS = "no quality metrics available"
+    MISSING_DAYS_HIGH = "missing_days={} > max={}"
+    NEWS_COUNT_LOW = "news_count={} < min={}"
+
+    # Liquidity
+    NO_MARKET_DATA = "no market data available"
+    DOLLAR_VOLUME_LOW = "avg_dollar_volume=${:,.0f} < min=${:,.0f}"
+    TRADING_DAYS_PCT_LOW = "trading_days_pct={:.2%} < min={:.2%}"
+    ORDER_BOOK_DEPTH_LOW = "estimated_order_book_depth=${:,.0f} < min=${:,.0f}"
+    SLIPPAGE_HIGH = "estimated_slippage={:.2f}% > max={:.2f}%"
+    SPREAD_UNAVAILABLE = "cannot calculate spread from market data"
+    SPREAD_HIGH = "avg_spread={:.2f}pips > max={:.2f}pips"
+    TRADING_DAYS_LOW = "insufficient_trading_days={} < min={}"
+
+
+# A formatted message, or a code with its template arguments
+Reason = Union[str, Tuple[ReasonCode, Tuple[Any, ...]]]
+
+
+def format_reason(reason: Reason) -> str:
+    """Render a reason as its human-readable message."""
+    if isinstance(reason, str):
+        return reason
+    code, args = reason
+    return code.value.format(*args)
+
+
+class RejectionReasons(Mapping):
+    """
+    Symbol -> rejection reason, formatted on first read.
+
+    Reads behave like Dict[str, str]; writes accept either a message or a
+    (ReasonCode, args) pair, so rejected assets whose reasons are never
+    read cost no string formatting.
+    """
+
+    __slots__ = ("_reasons", "_messages")
+
+    def __init__(self) -> None:
+        self._reasons: Dict[str, Reason] = {}
+        # Formatted messages, filled as reasons are read
+        self._messages: Dict[str, str] = {}
+
+    @classmethod
+    def from_pairs(cls, symbols: Iterable[str], reasons: Iterable[Reason]) -> RejectionReasons:
+        """
+        Build from parallel symbol and reason sequences in one pass.
+
+        Filters append to plain lists while checking and call this once,
+        instead of a Python-level __setitem__ per rejected asset.
+
+        Args:
+            symbols: Rejected symbols
+            reasons: Reason for each symbol, in the same order
+
+        Returns:
+            RejectionReasons holding the pairs (later duplicates win)
+        """
+        rejection_reasons = cls()
+        rejection_reasons._reasons = dict(zip(symbols, reasons))
+        return rejection_reasons
+
+    def __setitem__(self, symbol: str, reason: Reason) -> None:
+        self._reasons[symbol] = reason
+        self._messages.pop(symbol, None)
+
+    def __getitem__(self, symbol: str) -> str:
+        message = self._messages.get(symbol)
+        if message is None:
+            message = self._messages[symbol] = format_reason(self._reasons[symbol])
+        return message
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._reasons)
+
+    def __len__(self) -> int:
+        return len(self._reasons)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._reasons
+
+    def __repr__(self) -> str:
+        return f"RejectionReasons({dict(self)!r})"
 
-    model_config = {"frozen": True}
+    def code(self, symbol: str) -> Optional[ReasonCode]:
+        """Reason code for a symbol; None if unknown or recorded as a message."""
+        reason = self._reasons.get(symbol)
+        return reason[0] if isinstance(reason, tuple) else None
 
 
-class FilterResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FilterResult:
     """Result of applying a single filter stage."""
 
-    passed_assets: List[str] = Field(
-        default_factory=list, description="Symbols of passed assets"
-    )
-    rejected_assets: List[str] = Field(
-        default_factory=list, description="Symbols of rejected assets"
-    )
-    rejection_reasons: Dict[str, str] = Field(
-        default_factory=dict, description="Symbol -> rejection reason"
-    )
-
-    model_config = {"frozen": True}
+    # Symbols of passed assets
+    passed_assets: List[str] = field(default_factory=list)
+    # Symbols of rejected assets
+    rejected_assets: List[str] = field(default_factory=list)
+    # Symbol -> rejection reason (filters pass a lazily formatted RejectionReasons)
+    rejection_reasons: Mapping[str, str] = field(default_factory=dict)
+    # Stage name -> rejected count, for filters that run several stages
+    stage_rejections: Dict[str, int] = field(default_factory=dict)
 
     @property
     def passed_count(self) -> int:
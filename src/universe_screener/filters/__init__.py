@@ -9,6 +9,7 @@ Filters:
     - StructuralFilter: Filters by asset properties (type, exchange, age)
     - LiquidityFilter: Filters by tradability (volume, spread)
     - DataQualityFilter: Filters by data availability
+    - FusedEarlyRejectFilter: Runs several filters in one pass over assets
 
 Liquidity Strategies:
     - StockLiquidityStrategy: Dollar volume, trading days
@@ -25,7 +26,9 @@ Design Principles:
 from universe_screener.filters.structural import StructuralFilter
 from universe_screener.filters.liquidity import LiquidityFilter
 from universe_screener.filters.data_quality import DataQualityFilter
+from universe_screener.filters.fused import FusedEarlyRejectFilter
 from universe_screener.filters.liquidity_strategies import (
+    BatchLiquidityStrategy,
     CryptoLiquidityStrategy,
     ForexLiquidityStrategy,
     LiquidityStrategy,
@@ -37,10 +40,12 @@ __all__ = [
     "StructuralFilter",
     "LiquidityFilter",
     "DataQualityFilter",
+    "FusedEarlyRejectFilter",
     "StockLiquidityStrategy",
     "CryptoLiquidityStrategy",
     "ForexLiquidityStrategy",
     "LiquidityStrategy",
+    "BatchLiquidityStrategy",
     "create_liquidity_strategies",
 ]
 
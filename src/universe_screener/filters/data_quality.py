@@ -9,11 +9,18 @@ Filters assets based on data availability and quality:
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
 from universe_screener.domain.entities import Asset
-from universe_screener.domain.value_objects import FilterResult, QualityMetrics
+from universe_screener.domain.value_objects import (
+    FilterResult,
+    QualityMetrics,
+    Reason,
+    ReasonCode,
+    RejectionReasons,
+)
 from universe_screener.config.models import DataQualityFilterConfig
+from universe_screener.filters.parallel import ShardedExecutor
 
 if TYPE_CHECKING:
     from universe_screener.pipeline.data_context import DataContext
@@ -22,14 +29,22 @@ if TYPE_CHECKING:
 class DataQualityFilter:
     """Filter assets by data availability."""
 
-    def __init__(self, config: DataQualityFilterConfig) -> None:
+    def __init__(
+        self,
+        config: DataQualityFilterConfig,
+        max_workers: Optional[int] = None,
+    ) -> None:
         """
         Initialize with configuration.
 
         Args:
             config: Data quality filter configuration
+            max_workers: Check asset shards on this many threads; worth it
+                when quality metrics are lazily loaded. None checks
+                sequentially
         """
         self.config = config
+        self._executor = ShardedExecutor(max_workers, thread_name_prefix="data-quality-filter")
 
     @property
     def name(self) -> str:
@@ -66,38 +81,74 @@ class DataQualityFilter:
 
         passed: List[str] = []
         rejected: List[str] = []
-        reasons: Dict[str, str] = {}
+        reasons: List[Reason] = []
 
-        for asset in assets:
-            quality = context.get_quality_metrics(asset.symbol)
-            if quality is None:
-                rejected.append(asset.symbol)
-                reasons[asset.symbol] = "no quality metrics available"
-                continue
+        # One bulk fetch, then plain dict lookups per asset
+        batch = context.bulk_get_quality_metrics([a.symbol for a in assets])
+        check_one = self._bind_check(batch.get)
+        outcomes = self._executor.map(check_one, assets)
 
-            is_valid, reason = self._check_quality(quality)
+        for asset, (is_valid, reason) in zip(assets, outcomes):
             if is_valid:
                 passed.append(asset.symbol)
             else:
                 rejected.append(asset.symbol)
-                reasons[asset.symbol] = reason
+                reasons.append(reason)
 
         return FilterResult(
             passed_assets=passed,
             rejected_assets=rejected,
-            rejection_reasons=reasons,
+            rejection_reasons=RejectionReasons.from_pairs(rejected, reasons),
         )
 
+    def asset_check(
+        self,
+        date: datetime,
+        context: "DataContext",
+    ) -> Optional[Callable[[Asset], Tuple[bool, Reason]]]:
+        """
+        Build the per-asset check for one screening run.
+
+        Args:
+            date: Reference date
+            context: Data context with quality metrics
+
+        Returns:
+            Check returning (is_valid, reason), or None if disabled
+        """
+        if not self.config.enabled:
+            return None
+        return self._bind_check(context.get_quality_metrics)
+
+    def close(self) -> None:
+        """Shut down the worker threads, if any were started."""
+        self._executor.close()
+
+    def _bind_check(
+        self,
+        get_quality_metrics: Callable[[str], Optional[QualityMetrics]],
+    ) -> Callable[[Asset], Tuple[bool, Reason]]:
+        """Build the per-asset check over a symbol -> metrics lookup."""
+        check_quality = self._check_quality
+
+        def check_one(asset: Asset) -> Tuple[bool, Reason]:
+            quality = get_quality_metrics(asset.symbol)
+            if quality is None:
+                return False, (ReasonCode.NO_QUALITY_METRICS, ())
+            return check_quality(quality)
+
+        return check_one
+
     def _check_quality(
         self,
         quality: QualityMetrics,
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, Reason]:
         """Check if quality metrics meet requirements."""
         # Check missing days
         if quality.missing_days > self.config.max_missing_days:
-            return (
-                False,
-                f"missing_days={quality.missing_days} > max={self.config.max_missing_days}",
+            return False, (
+                ReasonCode.MISSING_DAYS_HIGH,
+                (quality.missing_days, self.config.max_missing_days),
             )
 
         # Check news coverage (if configured)
@@ -107,9 +158,9 @@ class DataQualityFilter:
                 or quality.news_article_count < self.config.min_news_articles
             ):
                 news_count = quality.news_article_count or 0
-                return (
-                    False,
-                    f"news_count={news_count} < min={self.config.min_news_articles}",
+                return False, (
+                    ReasonCode.NEWS_COUNT_LOW,
+                    (news_count, self.config.min_news_articles),
                 )
 
         return True, ""
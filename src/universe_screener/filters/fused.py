@@ -0,0 +1,123 @@
+"""
+Fused Early-Reject Filter Implementation.
+
+Runs several filter stages in one pass over the assets. Each asset goes
+through the stages' per-asset checks in order and stops at the first
+rejection, so later (costlier) checks never run for rejected assets.
+
+Design Notes:
+    - Stages expose asset_check(date, context); None means the stage is
+      disabled and is skipped
+    - Order stages cheapest first (structural, data quality, liquidity);
+      the passed set does not depend on order, only the reason reported
+      for assets failing several stages does
+    - Per-stage rejection counts are returned in
+      FilterResult.stage_rejections, so metrics match the staged pipeline
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from universe_screener.domain.entities import Asset
+from universe_screener.domain.value_objects import FilterResult, Reason, RejectionReasons
+
+if TYPE_CHECKING:
+    from universe_screener.pipeline.data_context import DataContext
+
+
+class FusableStage(Protocol):
+    """Filter stage that can hand out its per-asset check."""
+
+    @property
+    def name(self) -> str:
+        """Unique name of this filter stage."""
+        ...
+
+    def asset_check(
+        self,
+        date: datetime,
+        context: "DataContext",
+    ) -> Optional[Callable[[Asset], Tuple[bool, Reason]]]:
+        """Build the per-asset check for one run, or None if disabled."""
+        ...
+
+
+class FusedEarlyRejectFilter:
+    """
+    Apply several filter stages in a single pass over the assets.
+
+    Usage:
+        fused = FusedEarlyRejectFilter([
+            StructuralFilter(config.structural_filter),
+            DataQualityFilter(config.data_quality_filter),
+            LiquidityFilter(config.liquidity_filter),
+        ])
+        pipeline = ScreeningPipeline(provider=provider, filters=[fused], ...)
+    """
+
+    def __init__(self, stages: Sequence[FusableStage]) -> None:
+        """
+        Initialize with the stages to fuse.
+
+        Args:
+            stages: Stages in evaluation order
+        """
+        self._stages = tuple(stages)
+
+    @property
+    def name(self) -> str:
+        """Unique name of this filter stage."""
+        return "fused_filter"
+
+    @property
+    def stage_names(self) -> List[str]:
+        """Names of the fused stages in evaluation order."""
+        return [stage.name for stage in self._stages]
+
+    def apply(
+        self,
+        assets: List[Asset],
+        date: datetime,
+        context: "DataContext",
+    ) -> FilterResult:
+        """
+        Apply all stages, rejecting each asset at its first failing stage.
+
+        Args:
+            assets: Assets to filter
+            date: Reference date
+            context: Data context shared by all stages
+
+        Returns:
+            FilterResult with passed/rejected assets and per-stage counts
+        """
+        checks = []
+        for stage in self._stages:
+            check = stage.asset_check(date, context)
+            if check is not None:
+                checks.append((stage.name, check))
+
+        passed: List[str] = []
+        rejected: List[str] = []
+        reasons: List[Reason] = []
+        stage_rejections: Dict[str, int] = dict.fromkeys(self.stage_names, 0)
+
+        for asset in assets:
+            for stage_name, check in checks:
+                is_valid, reason = check(asset)
+                if not is_valid:
+                    rejected.append(asset.symbol)
+                    reasons.append(reason)
+                    stage_rejections[stage_name] += 1
+                    break
+            else:
+                passed.append(asset.symbol)
+
+        return FilterResult(
+            passed_assets=passed,
+            rejected_assets=rejected,
+            rejection_reasons=RejectionReasons.from_pairs(rejected, reasons),
+            stage_rejections=stage_rejections,
+        )
@@ -14,45 +14,97 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Protocol, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
 
 from universe_screener.domain.entities import Asset, AssetClass
-from universe_screener.domain.value_objects import FilterResult, MarketData
+from universe_screener.domain.value_objects import (
+    FilterResult,
+    MarketData,
+    Reason,
+    RejectionReasons,
+)
 from universe_screener.config.models import LiquidityFilterConfig
 from universe_screener.filters.liquidity_strategies import (
+    BatchResult,
     StockLiquidityStrategy,
     CryptoLiquidityStrategy,
     ForexLiquidityStrategy,
     LiquidityStrategy,
 )
+from universe_screener.filters.parallel import ShardedExecutor
 
 if TYPE_CHECKING:
     from universe_screener.pipeline.data_context import DataContext
 
 logger = logging.getLogger(__name__)
 
+# Outcome for asset classes without a strategy
+_UNCHECKED: Tuple[bool, Reason] = (True, "")
+
+# Strategy check methods paired with the DataContext accessor feeding them,
+# cheapest data first (see LiquidityFilter.register_strategy for precedence)
+_CHECK_METHODS = (
+    ("check_dollar_volumes", "get_dollar_volumes"),
+    ("check_columns", "get_market_columns"),
+    ("check_liquidity", "get_market_data"),
+)
+
+CheckFn = Callable[[Asset], Tuple[bool, Reason]]
+DataCheckFn = Callable[[Asset, Any], Tuple[bool, Reason]]
+BatchFn = Callable[[Sequence[Asset], "DataContext"], BatchResult]
+
+
+def _override_depth(strategy: object, name: str) -> Optional[int]:
+    """
+    How far up the strategy's MRO the attribute name is defined.
+
+    Returns:
+        -1 for instance attributes, the MRO index of the defining class,
+        len(MRO) for attributes only resolved dynamically, None if absent
+    """
+    if getattr(strategy, name, None) is None:
+        return None
+    if name in getattr(strategy, "__dict__", ()):
+        return -1
+    mro = type(strategy).__mro__
+    for depth, klass in enumerate(mro):
+        if name in vars(klass):
+            return depth
+    return len(mro)
+
 
 class LiquidityFilter:
     """
     Filter assets by liquidity metrics.
     
     Uses Strategy Pattern to apply asset-class specific liquidity checks.
-    Strategies are injected via config and can be extended for new asset classes.
+    Strategies are injected via config and can be extended for new asset
+    classes with register_strategy(). Their check methods are looked up
+    once at registration into per-class function tables.
     """
 
-    def __init__(self, config: LiquidityFilterConfig) -> None:
+    def __init__(
+        self,
+        config: LiquidityFilterConfig,
+        max_workers: Optional[int] = None,
+    ) -> None:
         """
         Initialize with configuration.
 
         Args:
             config: Liquidity filter configuration
+            max_workers: Check asset shards on this many threads; worth it
+                when market data is lazily loaded or strategies call out.
+                None checks sequentially
         """
         self.config = config
-        self._strategies: Dict[AssetClass, LiquidityStrategy] = {
-            AssetClass.STOCK: StockLiquidityStrategy(config.stock),
-            AssetClass.CRYPTO: CryptoLiquidityStrategy(config.crypto),
-            AssetClass.FOREX: ForexLiquidityStrategy(config.forex),
-        }
+        self._executor = ShardedExecutor(max_workers, thread_name_prefix="liquidity-filter")
+        # Bound check method and the context accessor feeding it, per class
+        self._check_fns: Dict[AssetClass, Tuple[DataCheckFn, str]] = {}
+        self._batch_fns: Dict[AssetClass, BatchFn] = {}
+        self.register_strategy(AssetClass.STOCK, StockLiquidityStrategy(config.stock))
+        self.register_strategy(AssetClass.CRYPTO, CryptoLiquidityStrategy(config.crypto))
+        self.register_strategy(AssetClass.FOREX, ForexLiquidityStrategy(config.forex))
 
     @property
     def name(self) -> str:
@@ -77,34 +129,139 @@ class LiquidityFilter:
             FilterResult with passed/rejected assets
         """
         if not self.config.enabled:
-            return FilterResult(
-                passed_assets=[a.symbol for a in assets],
-                rejected_assets=[],
-                rejection_reasons={},
-            )
+            return self._pass_all(assets)
+
+        asset_classes = {asset.asset_class for asset in assets}
+        if len(asset_classes) == 1:
+            # Homogeneous universe (the pipeline screens one class per run):
+            # dispatch straight to that class's check, no per-asset lookup
+            asset_class = asset_classes.pop()
+            check_batch = self._batch_fns.get(asset_class)
+            if check_batch is not None:
+                outcomes = self._executor.map_batches(
+                    lambda shard: check_batch(shard, context), assets
+                )
+            elif asset_class in self._check_fns:
+                outcomes = self._executor.map(self._bind_check(asset_class, context), assets)
+            else:
+                return self._pass_all(assets)
+        else:
+            outcomes = self._executor.map(self._mixed_check(context), assets)
 
         passed: List[str] = []
         rejected: List[str] = []
-        reasons: Dict[str, str] = {}
-
-        for asset in assets:
-            strategy = self._strategies.get(asset.asset_class)
-            if strategy is None:
-                # No strategy for this asset class, skip filtering
-                passed.append(asset.symbol)
-                continue
-
-            market_data = context.get_market_data(asset.symbol)
-            is_valid, reason = strategy.check_liquidity(asset, market_data)
+        reasons: List[Reason] = []
 
+        for asset, (is_valid, reason) in zip(assets, outcomes):
             if is_valid:
                 passed.append(asset.symbol)
             else:
                 rejected.append(asset.symbol)
-                reasons[asset.symbol] = reason
+                reasons.append(reason)
 
         return FilterResult(
             passed_assets=passed,
             rejected_assets=rejected,
-            rejection_reasons=reasons,
+            rejection_reasons=RejectionReasons.from_pairs(rejected, reasons),
+        )
+
+    def asset_check(
+        self,
+        date: datetime,
+        context: "DataContext",
+    ) -> Optional[Callable[[Asset], Tuple[bool, Reason]]]:
+        """
+        Build the per-asset check for one screening run.
+
+        Args:
+            date: Reference date
+            context: Data context with market data
+
+        Returns:
+            Check returning (is_valid, reason), or None if disabled
+        """
+        if not self.config.enabled:
+            return None
+        return self._mixed_check(context)
+
+    def _mixed_check(self, context: "DataContext") -> Callable[[Asset], Tuple[bool, Reason]]:
+        """Build a check dispatching each asset to its class's strategy."""
+        # Bind each asset class's check to this context once, not per asset
+        checks = {
+            asset_class: self._bind_check(asset_class, context) for asset_class in self._check_fns
+        }
+
+        def check_one(asset: Asset) -> Tuple[bool, Reason]:
+            check = checks.get(asset.asset_class)
+            if check is None:
+                # No strategy for this asset class, skip filtering
+                return _UNCHECKED
+            return check(asset)
+
+        return check_one
+
+    def register_strategy(self, asset_class: AssetClass, strategy: LiquidityStrategy) -> None:
+        """
+        Register or replace the strategy for an asset class.
+
+        Precedence: of the check methods in _CHECK_METHODS, the one
+        defined in the most-derived class wins, so a subclass overriding
+        only check_liquidity is not bypassed by inherited column checks;
+        among methods defined by the same class the cheapest wins.
+        check_liquidity_batch is used only if it is defined at least as
+        far down as that method.
+
+        Args:
+            asset_class: Asset class the strategy checks
+            strategy: Strategy instance
+
+        Raises:
+            TypeError: If the strategy implements none of the check methods
+        """
+        candidates = []
+        for order, (method_name, accessor) in enumerate(_CHECK_METHODS):
+            depth = _override_depth(strategy, method_name)
+            if depth is not None:
+                candidates.append((depth, order, method_name, accessor))
+        if not candidates:
+            raise TypeError(
+                f"{type(strategy).__name__} implements none of "
+                f"{', '.join(name for name, _ in _CHECK_METHODS)}"
+            )
+        depth, _, method_name, accessor = min(candidates)
+        self._check_fns[asset_class] = (getattr(strategy, method_name), accessor)
+
+        batch_depth = _override_depth(strategy, "check_liquidity_batch")
+        if batch_depth is not None and batch_depth <= depth:
+            self._batch_fns[asset_class] = getattr(strategy, "check_liquidity_batch")
+        else:
+            self._batch_fns.pop(asset_class, None)
+
+    def unregister_strategy(self, asset_class: AssetClass) -> None:
+        """
+        Remove the strategy for an asset class; its assets pass unchecked.
+
+        Args:
+            asset_class: Asset class to stop checking
+        """
+        self._check_fns.pop(asset_class, None)
+        self._batch_fns.pop(asset_class, None)
+
+    def close(self) -> None:
+        """Shut down the worker threads, if any were started."""
+        self._executor.close()
+
+    @staticmethod
+    def _pass_all(assets: List[Asset]) -> FilterResult:
+        """Pass every asset unchecked."""
+        return FilterResult(
+            passed_assets=[a.symbol for a in assets],
+            rejected_assets=[],
+            rejection_reasons={},
         )
+
+    def _bind_check(self, asset_class: AssetClass, context: "DataContext") -> CheckFn:
+        """Pair an asset class's check method with the context data it consumes."""
+        check_fn, accessor = self._check_fns[asset_class]
+        get_data = getattr(context, accessor)
+        return lambda asset: check_fn(asset, get_data(asset.symbol))
@@ -0,0 +1,84 @@
+"""
+Liquidity Kernels - Numeric Reductions for Liquidity Strategies.
+
+Pure functions over packed columns (array('d') or any float sequence)
+that hold the arithmetic of the liquidity strategies. Strategies call a
+kernel and only build strings when rejecting.
+
+Design Notes:
+    - No asset, config or logging dependencies; inputs in, numbers out
+    - Reductions run as chains of C-level builtins (sum, map, min) so
+      no bytecode executes per bar
+"""
+
+from __future__ import annotations
+
+from operator import sub, truediv
+from typing import Sequence, Tuple
+
+# Order size used for the simulated crypto slippage estimate
+SLIPPAGE_ORDER_SIZE_USD = 100_000
+
+# Simulated order book depth as a share of daily dollar volume
+ORDER_BOOK_DEPTH_RATIO = 0.05
+
+
+def mean(values: Sequence[float]) -> float:
+    """
+    Arithmetic mean of a non-empty sequence.
+
+    Args:
+        values: Values to average
+
+    Returns:
+        Mean of the values
+    """
+    return sum(values) / len(values)
+
+
+def crypto_depth_slippage(dollar_volumes: Sequence[float]) -> Tuple[float, float]:
+    """
+    Simulated order book depth and slippage from daily dollar volumes.
+
+    Depth is ORDER_BOOK_DEPTH_RATIO of the average dollar volume; slippage
+    for a SLIPPAGE_ORDER_SIZE_USD order is order_size / (depth * 2).
+
+    Args:
+        dollar_volumes: One non-empty dollar volume per trading day
+
+    Returns:
+        Tuple of (depth in USD, slippage in percent); slippage is inf
+        when the depth is zero
+    """
+    depth = mean(dollar_volumes) * ORDER_BOOK_DEPTH_RATIO
+    if depth <= 0:
+        return depth, float("inf")
+    return depth, (SLIPPAGE_ORDER_SIZE_USD / (depth * 2)) * 100
+
+
+def relative_range_sum(
+    high: Sequence[float],
+    low: Sequence[float],
+    close: Sequence[float],
+) -> Tuple[float, int]:
+    """
+    Sum (high - low) / close over bars with positive high and low.
+
+    When every bar qualifies (the usual case) the sum is one chain of
+    map() calls over the columns.
+
+    Args:
+        high: Daily highs
+        low: Daily lows
+        close: Daily closes
+
+    Returns:
+        Tuple of (sum of relative ranges, number of bars summed)
+    """
+    if not close:
+        return 0.0, 0
+    if min(high) > 0 and min(low) > 0:
+        return sum(map(truediv, map(sub, high, low), close)), len(close)
+
+    ranges = [(h - l) / c for h, l, c in zip(high, low, close) if h > 0 and l > 0]
+    return sum(ranges), len(ranges)
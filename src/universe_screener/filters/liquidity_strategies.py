@@ -10,23 +10,58 @@ Design Notes:
     - Each strategy checks liquidity using asset-class specific metrics
     - Strategies are mock-based for now (real data integration later)
     - Thresholds come from config (DI via constructor)
+    - Strategies that only need dollar volumes also expose
+      check_dollar_volumes(), so callers holding a precomputed column
+      (DataContext.get_dollar_volumes) skip reading MarketData rows;
+      strategies needing prices expose check_columns() for the same reason
+    - Numeric reductions live in liquidity_kernels
+    - Per-config constants (thresholds, expected trading days, pip value)
+      are computed once in __init__, not on every check; strategies are
+      rebuilt, not reconfigured, when thresholds change
+    - StockLiquidityStrategy can memoize outcomes per (symbol, data window)
+      (opt-in via cache_size), so backtests re-screening the same
+      point-in-time window skip the reduction
+    - check_dollar_volumes()/check_columns() return rejection reasons as
+      (ReasonCode, args) pairs that are formatted only when read;
+      check_liquidity() keeps returning formatted messages
+    - Strategies may also implement check_liquidity_batch(assets, context)
+      (BatchLiquidityStrategy) to check a whole shard in one call;
+      LiquidityFilter prefers it and otherwise checks asset by asset
 """
 
 from __future__ import annotations
 
 import logging
-from typing import List, Protocol, Tuple
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Protocol, Sequence, Tuple
 
 from universe_screener.domain.entities import Asset
-from universe_screener.domain.value_objects import MarketData
+from universe_screener.domain.value_objects import (
+    MarketData,
+    MarketDataColumns,
+    Reason,
+    ReasonCode,
+    format_reason,
+)
+from universe_screener.filters import liquidity_kernels as kernels
 from universe_screener.config.models import (
     CryptoLiquidityConfig,
     ForexLiquidityConfig,
     StockLiquidityConfig,
 )
 
+if TYPE_CHECKING:
+    from universe_screener.pipeline.data_context import DataContext
+
 logger = logging.getLogger(__name__)
 
+# One (is_liquid, reason) outcome per asset, in input order
+BatchResult = List[Tuple[bool, Reason]]
+
+# Identifies the bars a check saw: (symbol, first date, last date, bar count)
+WindowKey = Tuple[str, datetime, datetime, int]
+
 
 class LiquidityStrategy(Protocol):
     """Strategy protocol for asset-class specific liquidity checks."""
@@ -49,11 +84,89 @@ class LiquidityStrategy(Protocol):
         ...
 
 
+class BatchLiquidityStrategy(LiquidityStrategy, Protocol):
+    """Liquidity strategy that can also check many assets in one call."""
+
+    def check_liquidity_batch(
+        self,
+        assets: Sequence[Asset],
+        context: "DataContext",
+    ) -> BatchResult:
+        """
+        Check liquidity for several assets of this strategy's class.
+
+        Args:
+            assets: Assets to check
+            context: Data context with market data
+
+        Returns:
+            (is_liquid, rejection_reason) per asset, in asset order
+        """
+        ...
+
+
+class _WindowMemo:
+    """
+    Bounded memo of check outcomes per data window.
+
+    Reads are lock-free dict lookups; writes take a lock so sharded
+    checks on worker threads evict safely. When full, the oldest entry
+    is dropped.
+    """
+
+    __slots__ = ("_entries", "_lock", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: Dict[WindowKey, Tuple[bool, Reason]] = {}
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: WindowKey) -> Optional[Tuple[bool, Reason]]:
+        return self._entries.get(key)
+
+    def put(self, key: WindowKey, outcome: Tuple[bool, Reason]) -> Tuple[bool, Reason]:
+        if self._maxsize:
+            with self._lock:
+                if key not in self._entries and len(self._entries) >= self._maxsize:
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = outcome
+        return outcome
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _window_key(symbol: str, market_data: Sequence[MarketData]) -> WindowKey:
+    """Key a non-empty market data window by its symbol, ends and length."""
+    return (symbol, market_data[0].date, market_data[-1].date, len(market_data))
+
+
 class StockLiquidityStrategy:
     """Liquidity strategy for stocks."""
 
-    def __init__(self, config: StockLiquidityConfig) -> None:
+    def __init__(self, config: StockLiquidityConfig, cache_size: int = 0) -> None:
+        """
+        Initialize with configuration.
+
+        Args:
+            config: Stock liquidity thresholds, read once here
+            cache_size: Outcomes memoized per (symbol, first date, last date,
+                bar count), so backtests re-checking a window skip the
+                reduction; 0 (default) disables. The key does not cover bar
+                values, so only enable it for point-in-time (snapshot) data
+                and call clear_cache() whenever bars may have changed
+        """
         self.config = config
+        self._min_avg_dollar_volume = config.min_avg_dollar_volume_usd
+        self._min_trading_days_pct = config.min_trading_days_pct
+        # Assume 252 trading days per year, proportional for lookback
+        self._expected_days = int(config.lookback_days * (252 / 365))
+        self._results = _WindowMemo(cache_size)
+
+    def clear_cache(self) -> None:
+        """Forget memoized outcomes, e.g. after market data was corrected."""
+        self._results.clear()
 
     def check_liquidity(
         self,
@@ -68,29 +181,84 @@ class StockLiquidityStrategy:
             - Percentage of trading days with data
         """
         if not market_data:
-            return False, "no market data available"
+            return False, format_reason((ReasonCode.NO_MARKET_DATA, ()))
+
+        key = _window_key(asset.symbol, market_data)
+        outcome = self._results.get(key)
+        if outcome is None:
+            outcome = self._results.put(
+                key,
+                self.check_dollar_volumes(asset, [d.dollar_volume for d in market_data]),
+            )
+        is_liquid, reason = outcome
+        return is_liquid, format_reason(reason)
 
-        # Calculate average dollar volume
-        dollar_volumes = [d.dollar_volume for d in market_data]
-        avg_dollar_volume = sum(dollar_volumes) / len(dollar_volumes)
+    def check_liquidity_batch(
+        self,
+        assets: Sequence[Asset],
+        context: "DataContext",
+    ) -> BatchResult:
+        """Check stocks from memoized outcomes or the context's cached averages."""
+        check = self.check_average_dollar_volume
+        memo_get = self._results.get
+        memo_put = self._results.put
+        get_avg_dollar_volume = context.get_avg_dollar_volume
+        get_market_data = context.get_market_data
+        results: BatchResult = []
+        no_data: Tuple[bool, Reason] = (False, (ReasonCode.NO_MARKET_DATA, ()))
+        for asset in assets:
+            symbol = asset.symbol
+            market_data = get_market_data(symbol)
+            if not market_data:
+                results.append(no_data)
+                continue
+            key = _window_key(symbol, market_data)
+            outcome = memo_get(key)
+            if outcome is None:
+                avg_dollar_volume = get_avg_dollar_volume(symbol)
+                if avg_dollar_volume is None:
+                    # Not expected: the context averages any non-empty rows
+                    outcome = no_data
+                else:
+                    outcome = memo_put(key, check(asset, avg_dollar_volume, len(market_data)))
+            results.append(outcome)
+        return results
+
+    def check_dollar_volumes(
+        self,
+        asset: Asset,
+        dollar_volumes: Sequence[float],
+    ) -> Tuple[bool, Reason]:
+        """Check stock liquidity from one dollar volume per trading day."""
+        if not dollar_volumes:
+            return False, (ReasonCode.NO_MARKET_DATA, ())
+
+        return self.check_average_dollar_volume(
+            asset, kernels.mean(dollar_volumes), len(dollar_volumes)
+        )
 
+    def check_average_dollar_volume(
+        self,
+        asset: Asset,
+        avg_dollar_volume: float,
+        actual_days: int,
+    ) -> Tuple[bool, Reason]:
+        """Check stock liquidity from precomputed average and day count."""
         # Calculate trading days percentage
-        # Assume 252 trading days per year, proportional for lookback
-        expected_days = int(self.config.lookback_days * (252 / 365))
-        actual_days = len(market_data)
+        expected_days = self._expected_days
         trading_days_pct = actual_days / expected_days if expected_days > 0 else 0
 
         # Check thresholds
-        if avg_dollar_volume < self.config.min_avg_dollar_volume_usd:
-            return (
-                False,
-                f"avg_dollar_volume=${avg_dollar_volume:,.0f} < min=${self.config.min_avg_dollar_volume_usd:,.0f}",
+        if avg_dollar_volume < self._min_avg_dollar_volume:
+            return False, (
+                ReasonCode.DOLLAR_VOLUME_LOW,
+                (avg_dollar_volume, self._min_avg_dollar_volume),
             )
 
-        if trading_days_pct < self.config.min_trading_days_pct:
-            return (
-                False,
-                f"trading_days_pct={trading_days_pct:.2%} < min={self.config.min_trading_days_pct:.2%}",
+        if trading_days_pct < self._min_trading_days_pct:
+            return False, (
+                ReasonCode.TRADING_DAYS_PCT_LOW,
+                (trading_days_pct, self._min_trading_days_pct),
             )
 
         return True, ""
@@ -121,37 +289,43 @@ class CryptoLiquidityStrategy:
         
         Simulates order book depth and slippage from volume data.
         """
-        if not market_data:
-            return False, "no market data available"
-
-        # Calculate average daily volume
-        dollar_volumes = [d.dollar_volume for d in market_data]
-        avg_dollar_volume = sum(dollar_volumes) / len(dollar_volumes)
+        is_liquid, reason = self.check_dollar_volumes(
+            asset, [d.dollar_volume for d in market_data]
+        )
+        return is_liquid, format_reason(reason)
 
-        # Simulate order book depth from volume
-        # Assumption: order book depth ≈ 5% of daily volume
-        estimated_depth_usd = avg_dollar_volume * 0.05
+    def check_dollar_volumes(
+        self,
+        asset: Asset,
+        dollar_volumes: Sequence[float],
+    ) -> Tuple[bool, Reason]:
+        """Check crypto liquidity from one dollar volume per trading day."""
+        if not dollar_volumes:
+            return False, (ReasonCode.NO_MARKET_DATA, ())
+
+        # Simulate order book depth from average daily volume (≈ 5%) and
+        # slippage for a $100k order: slippage = order_size / (depth * 2)
+        estimated_depth_usd, estimated_slippage_pct = kernels.crypto_depth_slippage(
+            dollar_volumes
+        )
 
         if estimated_depth_usd < self.config.min_order_book_depth_usd:
-            return (
-                False,
-                f"estimated_order_book_depth=${estimated_depth_usd:,.0f} < min=${self.config.min_order_book_depth_usd:,.0f}",
+            return False, (
+                ReasonCode.ORDER_BOOK_DEPTH_LOW,
+                (estimated_depth_usd, self.config.min_order_book_depth_usd),
             )
 
-        # Estimate slippage for $100k order
-        # Simple model: slippage = order_size / (depth * 2)
-        order_size_usd = 100_000
-        estimated_slippage_pct = (order_size_usd / (estimated_depth_usd * 2)) * 100
-
         if estimated_slippage_pct > self.config.max_slippage_pct:
-            return (
-                False,
-                f"estimated_slippage={estimated_slippage_pct:.2f}% > max={self.config.max_slippage_pct:.2f}%",
+            return False, (
+                ReasonCode.SLIPPAGE_HIGH,
+                (estimated_slippage_pct, self.config.max_slippage_pct),
             )
 
         logger.debug(
-            f"Crypto {asset.symbol}: depth=${estimated_depth_usd:,.0f}, "
-            f"slippage={estimated_slippage_pct:.2f}%"
+            "Crypto %s: depth=$%.0f, slippage=%.2f%%",
+            asset.symbol,
+            estimated_depth_usd,
+            estimated_slippage_pct,
         )
 
         return True, ""
@@ -171,6 +345,10 @@ class ForexLiquidityStrategy:
 
     def __init__(self, config: ForexLiquidityConfig) -> None:
         self.config = config
+        # 1 pip = 0.0001 for most pairs (0.01 for JPY pairs, ignored for now)
+        self._pip_value = 0.0001
+        # 24/5 availability: roughly 6 weeks of 5-day weeks
+        self._min_trading_days = 30
 
     def check_liquidity(
         self,
@@ -182,47 +360,54 @@ class ForexLiquidityStrategy:
         
         Simulates spread from high-low range.
         """
-        if not market_data:
-            return False, "no market data available"
+        is_liquid, reason = self.check_columns(asset, MarketDataColumns.from_rows(market_data))
+        return is_liquid, format_reason(reason)
+
+    def check_columns(
+        self,
+        asset: Asset,
+        columns: MarketDataColumns,
+    ) -> Tuple[bool, Reason]:
+        """Check forex liquidity from columnar market data."""
+        if not len(columns):
+            return False, (ReasonCode.NO_MARKET_DATA, ())
 
         # Calculate average spread from high-low (simulated)
         # Assumption: spread ≈ 1% of average (high - low)
-        spreads_pct = []
-        for d in market_data:
-            if d.high > 0 and d.low > 0:
-                spread_pct = ((d.high - d.low) / d.close) * 0.01  # 1% of range
-                spreads_pct.append(spread_pct)
+        range_total, count = kernels.relative_range_sum(
+            columns.high, columns.low, columns.close
+        )
 
-        if not spreads_pct:
-            return False, "cannot calculate spread from market data"
+        if not count:
+            return False, (ReasonCode.SPREAD_UNAVAILABLE, ())
 
-        avg_spread_pct = sum(spreads_pct) / len(spreads_pct)
+        avg_spread_pct = range_total / count * 0.01  # 1% of range
 
-        # Convert to pips (1 pip = 0.0001 for most pairs, 0.01 for JPY pairs)
-        # For simplicity, assume 1 pip = 0.0001
-        pip_value = 0.0001
-        avg_spread_pips = avg_spread_pct / pip_value
+        # Convert to pips
+        avg_spread_pips = avg_spread_pct / self._pip_value
 
         if avg_spread_pips > self.config.max_spread_pips:
-            return (
-                False,
-                f"avg_spread={avg_spread_pips:.2f}pips > max={self.config.max_spread_pips:.2f}pips",
+            return False, (
+                ReasonCode.SPREAD_HIGH,
+                (avg_spread_pips, self.config.max_spread_pips),
             )
 
         # Check 24/5 availability (simulated)
         # Requirement: Forex should have data for most trading days
-        # Minimum: 30 trading days (roughly 6 weeks of 5-day weeks)
-        min_trading_days = 30
-        
-        if len(market_data) < min_trading_days:
-            return (
-                False,
-                f"insufficient_trading_days={len(market_data)} < min={min_trading_days}",
+        min_trading_days = self._min_trading_days
+        trading_days = len(columns)
+
+        if trading_days < min_trading_days:
+            return False, (
+                ReasonCode.TRADING_DAYS_LOW,
+                (trading_days, min_trading_days),
             )
 
         logger.debug(
-            f"Forex {asset.symbol}: avg_spread={avg_spread_pips:.2f}pips, "
-            f"trading_days={len(market_data)}"
+            "Forex %s: avg_spread=%.2fpips, trading_days=%d",
+            asset.symbol,
+            avg_spread_pips,
+            trading_days,
         )
 
         return True, ""
@@ -6,20 +6,35 @@ Filters assets based on structural properties:
     - Exchange (e.g., NYSE, NASDAQ, XETRA)
     - Listing age (e.g., min 252 trading days)
     - Delisting status (exclude delisted assets)
+
+Design Notes:
+    - Each run first evaluates one combined pass predicate per asset, with
+      the listing age turned into a precomputed cutoff date; rejection
+      reasons are worked out only for assets that fail it
+    - Allowed types and exchanges are frozensets built once per filter;
+      types are held as AssetType members so no .value lookup is needed
 """
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Tuple
-
-from universe_screener.domain.entities import Asset
-from universe_screener.domain.value_objects import FilterResult
+from datetime import date as date_type
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, FrozenSet, List, Optional, Tuple
+
+from universe_screener.domain.entities import Asset, AssetType
+from universe_screener.domain.value_objects import (
+    FilterResult,
+    Reason,
+    ReasonCode,
+    RejectionReasons,
+)
 from universe_screener.config.models import StructuralFilterConfig
 
 if TYPE_CHECKING:
     from universe_screener.pipeline.data_context import DataContext
 
+_PASSED: Tuple[bool, Reason] = (True, "")
+
 
 class StructuralFilter:
     """Filter assets by structural properties."""
@@ -32,6 +47,11 @@ class StructuralFilter:
             config: Structural filter configuration
         """
         self.config = config
+        # O(1) membership; unknown type names could never match anyway
+        self._allowed_types: FrozenSet[AssetType] = frozenset(
+            t for t in AssetType if t.value in config.allowed_asset_types
+        )
+        self._allowed_exchanges: FrozenSet[str] = frozenset(config.allowed_exchanges)
 
     @property
     def name(self) -> str:
@@ -61,7 +81,8 @@ class StructuralFilter:
         Returns:
             FilterResult with passed/rejected assets
         """
-        if not self.config.enabled:
+        check_one = self.asset_check(date, context)
+        if check_one is None:
             return FilterResult(
                 passed_assets=[a.symbol for a in assets],
                 rejected_assets=[],
@@ -70,45 +91,85 @@ class StructuralFilter:
 
         passed: List[str] = []
         rejected: List[str] = []
-        reasons: Dict[str, str] = {}
-
-        # Convert datetime to date for comparison with Asset.listing_date
-        ref_date = date.date()
+        reasons: List[Reason] = []
 
         for asset in assets:
-            is_valid, reason = self._check_asset(asset, ref_date)
+            is_valid, reason = check_one(asset)
             if is_valid:
                 passed.append(asset.symbol)
             else:
                 rejected.append(asset.symbol)
-                reasons[asset.symbol] = reason
+                reasons.append(reason)
 
         return FilterResult(
             passed_assets=passed,
             rejected_assets=rejected,
-            rejection_reasons=reasons,
+            rejection_reasons=RejectionReasons.from_pairs(rejected, reasons),
         )
 
-    def _check_asset(self, asset: Asset, ref_date) -> Tuple[bool, str]:
+    def asset_check(
+        self,
+        date: datetime,
+        context: "DataContext",
+    ) -> Optional[Callable[[Asset], Tuple[bool, Reason]]]:
+        """
+        Build the per-asset check for one screening run.
+
+        Args:
+            date: Reference date
+            context: Data context (unused for structural filter)
+
+        Returns:
+            Check returning (is_valid, reason), or None if disabled
+        """
+        if not self.config.enabled:
+            return None
+
+        # Convert datetime to date for comparison with Asset.listing_date
+        ref_date = date.date()
+        # listing age >= min days  <=>  listing date <= ref_date - min days
+        try:
+            listing_cutoff = ref_date - timedelta(days=self.config.min_listing_age_days)
+        except OverflowError:
+            listing_cutoff = date_type.min
+        allowed_types = self._allowed_types
+        allowed_exchanges = self._allowed_exchanges
+        check_asset = self._check_asset
+
+        def check_one(asset: Asset) -> Tuple[bool, Reason]:
+            delisting_date = asset.delisting_date
+            if (
+                asset.listing_date <= listing_cutoff
+                and (delisting_date is None or delisting_date > ref_date)
+                and asset.exchange in allowed_exchanges
+                and asset.asset_type in allowed_types
+            ):
+                return _PASSED
+            # Only failing assets pay for finding the failed check and reason
+            return check_asset(asset, ref_date)
+
+        return check_one
+
+    def _check_asset(self, asset: Asset, ref_date) -> Tuple[bool, Reason]:
         """Check if a single asset passes structural requirements."""
         # Check asset type
-        if asset.asset_type.value not in self.config.allowed_asset_types:
-            return False, f"asset_type={asset.asset_type.value} not in allowed list"
+        if asset.asset_type not in self._allowed_types:
+            return False, (ReasonCode.ASSET_TYPE_NOT_ALLOWED, (asset.asset_type.value,))
 
         # Check exchange
-        if asset.exchange not in self.config.allowed_exchanges:
-            return False, f"exchange={asset.exchange} not in allowed list"
+        if asset.exchange not in self._allowed_exchanges:
+            return False, (ReasonCode.EXCHANGE_NOT_ALLOWED, (asset.exchange,))
 
         # Check listing age
         listing_age_days = (ref_date - asset.listing_date).days
         if listing_age_days < self.config.min_listing_age_days:
-            return (
-                False,
-                f"listing_age={listing_age_days}d < min={self.config.min_listing_age_days}d",
+            return False, (
+                ReasonCode.LISTING_TOO_RECENT,
+                (listing_age_days, self.config.min_listing_age_days),
             )
 
         # Check delisting status
         if asset.delisting_date is not None and asset.delisting_date <= ref_date:
-            return False, f"delisted on {asset.delisting_date}"
+            return False, (ReasonCode.DELISTED, (asset.delisting_date,))
 
         return True, ""
@@ -7,16 +7,23 @@ Design Notes:
     - Supports eager (batch) and lazy loading modes
     - Tracks memory usage for health monitoring
     - Provides warning when data size exceeds threshold
+    - Market data is also exposed column-wise (MarketDataColumns); columns
+      and derived dollar volumes are built once per symbol and cached
 """
 
 from __future__ import annotations
 
 import logging
 import sys
-from typing import Any, Callable, Dict, List, Optional
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from universe_screener.domain.entities import Asset
-from universe_screener.domain.value_objects import MarketData, QualityMetrics
+from universe_screener.domain.value_objects import (
+    MarketData,
+    MarketDataColumns,
+    QualityMetrics,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +84,11 @@ class DataContext:
         # Track which symbols have been lazily loaded
         self._loaded_market_data: set = set()
         self._loaded_metadata: set = set()
+
+        # Columnar views per symbol, derived on first use
+        self._market_columns: Dict[str, MarketDataColumns] = {}
+        self._dollar_volumes: Dict[str, array] = {}
+        self._avg_dollar_volumes: Dict[str, float] = {}
         
         # Check size and warn if needed (only for eager loading)
         if not lazy_loading:
@@ -128,6 +140,75 @@ class DataContext:
         
         return self._market_data.get(symbol, [])
 
+    def get_market_columns(self, symbol: str) -> MarketDataColumns:
+        """
+        Get market data for an asset as packed columns.
+
+        Built from the MarketData rows on first access and cached, so
+        column-wise checks (spreads, volumes) scan contiguous float arrays.
+
+        Args:
+            symbol: Asset symbol
+
+        Returns:
+            MarketDataColumns in market data order, empty if not found
+        """
+        columns = self._market_columns.get(symbol)
+        if columns is None:
+            columns = MarketDataColumns.from_rows(self.get_market_data(symbol))
+            # Do not pin an empty result a later lazy load could fill
+            if symbol in self._market_data:
+                self._market_columns[symbol] = columns
+        return columns
+
+    def get_dollar_volumes(self, symbol: str) -> array:
+        """
+        Get daily dollar volumes (close * volume) for an asset.
+
+        Liquidity checks reduce over this column for every asset, so it
+        is packed into a float array once per symbol and reused, instead
+        of reading each MarketData row again.
+
+        Args:
+            symbol: Asset symbol
+
+        Returns:
+            array('d') of dollar volumes in market data order, empty if not found
+        """
+        column = self._dollar_volumes.get(symbol)
+        if column is None:
+            rows = self.get_market_data(symbol)
+            column = array("d", [d.dollar_volume for d in rows])
+            # Do not pin an empty result a later lazy load could fill
+            if symbol in self._market_data:
+                self._dollar_volumes[symbol] = column
+        return column
+
+    def get_avg_dollar_volume(self, symbol: str) -> Optional[float]:
+        """
+        Get the average daily dollar volume for an asset.
+
+        Computed once per symbol for this context's screening date, from
+        the cached dollar volume column if one exists and otherwise
+        straight from the rows, without packing a column.
+
+        Args:
+            symbol: Asset symbol
+
+        Returns:
+            Mean dollar volume, or None if there is no market data
+        """
+        avg = self._avg_dollar_volumes.get(symbol)
+        if avg is None:
+            column: Optional[Sequence[float]] = self._dollar_volumes.get(symbol)
+            if column is None:
+                column = [d.dollar_volume for d in self.get_market_data(symbol)]
+            if not column:
+                return None
+            avg = sum(column) / len(column)
+            self._avg_dollar_volumes[symbol] = avg
+        return avg
+
     def get_metadata(self, symbol: str) -> Dict[str, Any]:
         """
         Get metadata for an asset.
@@ -169,6 +250,22 @@ class DataContext:
         """
         return self._quality_metrics.get(symbol)
 
+    def bulk_get_quality_metrics(self, symbols: Iterable[str]) -> Dict[str, QualityMetrics]:
+        """
+        Get quality metrics for many assets at once.
+
+        Lets filters fetch a whole batch up front and then look symbols up
+        in a local dict instead of calling get_quality_metrics per asset.
+
+        Args:
+            symbols: Asset symbols
+
+        Returns:
+            Symbol -> QualityMetrics for the symbols that have metrics
+        """
+        quality_metrics = self._quality_metrics
+        return {s: quality_metrics[s] for s in symbols if s in quality_metrics}
+
     @property
     def size_bytes(self) -> int:
         """Estimate memory size of the context in bytes."""
@@ -478,11 +478,13 @@ class ScreeningPipeline:
 
         stage_duration = time.perf_counter() - stage_start
 
-        # Log filtered assets
-        for symbol, reason in filter_result.rejection_reasons.items():
-            asset = context.get_asset(symbol)
-            if asset:
-                self.audit_logger.log_asset_filtered(asset, stage.name, reason)
+        # Log filtered assets; loggers that drop these events opt out, which
+        # leaves lazily formatted reasons unformatted
+        if getattr(self.audit_logger, "logs_filtered_assets", True):
+            for symbol, reason in filter_result.rejection_reasons.items():
+                asset = context.get_asset(symbol)
+                if asset:
+                    self.audit_logger.log_asset_filtered(asset, stage.name, reason)
 
         self.audit_logger.log_stage_end(
             stage.name, filter_result.passed_count, stage_duration
@@ -494,11 +496,20 @@ class ScreeningPipeline:
             stage_duration,
             {"stage": stage.name},
         )
-        self.metrics_collector.record_count(
-            "assets_filtered_total",
-            filter_result.rejected_count,
-            {"stage": stage.name},
-        )
+        if filter_result.stage_rejections:
+            # Fused stages report per inner stage, as if run one by one
+            for inner_name, rejected_count in filter_result.stage_rejections.items():
+                self.metrics_collector.record_count(
+                    "assets_filtered_total",
+                    rejected_count,
+                    {"stage": inner_name},
+                )
+        else:
+            self.metrics_collector.record_count(
+                "assets_filtered_total",
+                filter_result.rejected_count,
+                {"stage": stage.name},
+            )
 
         # Create stage result
         stage_result = StageResult(
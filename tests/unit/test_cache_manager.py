@@ -6,15 +6,17 @@ Tests for:
     - TTL-based expiration
     - LRU eviction policy
     - Thread safety
+    - Lock-striped shards
     - Statistics tracking
 """
 
 from __future__ import annotations
 
+import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from typing import Any, Optional
 
 import pytest
 
@@ -27,22 +29,28 @@ from universe_screener.caching.cache_manager import (
 
 
 class TestCacheEntry:
-    """Tests for CacheEntry dataclass."""
+    """Tests for CacheEntry."""
 
     def test_entry_not_expired_when_no_expires_at(self) -> None:
         """Entry without expiration time is never expired."""
         entry = CacheEntry(value="test", expires_at=None)
-        assert not entry.is_expired
+        assert not entry.is_expired()
 
     def test_entry_not_expired_when_future(self) -> None:
         """Entry with future expiration is not expired."""
-        entry = CacheEntry(value="test", expires_at=time.time() + 3600)
-        assert not entry.is_expired
+        entry = CacheEntry(value="test", expires_at=time.monotonic_ns() + 3600 * 10**9)
+        assert not entry.is_expired()
 
     def test_entry_expired_when_past(self) -> None:
         """Entry with past expiration is expired."""
-        entry = CacheEntry(value="test", expires_at=time.time() - 1)
-        assert entry.is_expired
+        entry = CacheEntry(value="test", expires_at=time.monotonic_ns() - 10**9)
+        assert entry.is_expired()
+
+    def test_entry_expiry_against_given_time(self) -> None:
+        """A caller-supplied timestamp is used instead of reading the clock."""
+        entry = CacheEntry(value="test", expires_at=1_000)
+        assert not entry.is_expired(now_ns=999)
+        assert entry.is_expired(now_ns=1_001)
 
 
 class TestCacheManagerBasic:
@@ -124,6 +132,32 @@ class TestCacheManagerTTL:
         # Should be expired
         assert cache.get("key1") is None
 
+    def test_expired_entries_dropped_before_lru_eviction(self) -> None:
+        """Unread expired entries are reclaimed before live ones are evicted."""
+        # Room for two small ints
+        cache = CacheManager(CacheConfig(max_size_bytes=60, num_shards=1))
+        cache.set("live", 1, ttl_seconds=3600)
+        cache.set("stale", 2, ttl_seconds=0.01)
+        time.sleep(0.02)
+        
+        cache.set("new", 3, ttl_seconds=3600)
+        
+        stats = cache.get_stats()
+        assert stats.expirations == 1
+        assert stats.evictions == 0
+        assert cache.get("live") == 1
+
+    def test_overwrite_leaves_no_stale_expiry(self) -> None:
+        """An overwritten key keeps the expiry of its latest value."""
+        cache = CacheManager(CacheConfig(max_size_bytes=100, num_shards=1))
+        cache.set("key", 1, ttl_seconds=0.01)
+        cache.set("key", 2, ttl_seconds=3600)
+        time.sleep(0.02)
+        
+        cache._evict_if_needed(cache.config.max_size_bytes, first=0)
+        
+        assert cache.get_stats().expirations == 0
+
     def test_default_ttl_used_when_not_specified(self) -> None:
         """Default TTL from config is used when not specified."""
         config = CacheConfig(default_ttl_seconds=0.1)
@@ -182,6 +216,60 @@ class TestCacheManagerLRU:
         assert stats.evictions >= 0  # At least some evictions
 
 
+class TestCacheManagerClock:
+    """Tests for CLOCK eviction."""
+
+    def test_read_entry_gets_second_chance(self) -> None:
+        """A read entry outlives older unread ones."""
+        # Room for two small ints
+        cache = CacheManager(CacheConfig(max_size_bytes=60, num_shards=1))
+        cache.set("key1", 1)
+        cache.set("key2", 2)
+        
+        cache.get("key1")
+        cache.set("key3", 3)
+        
+        assert cache.get("key1") == 1
+        assert cache.get("key2") is None
+
+    def test_hits_do_not_reorder_entries(self) -> None:
+        """Reads only set the reference bit."""
+        cache = CacheManager(CacheConfig(num_shards=1))
+        cache.set("key1", 1)
+        cache.set("key2", 2)
+        
+        cache.get("key1")
+        
+        shard = cache._shards[0]
+        assert list(shard.entries) == ["key1", "key2"]
+        assert shard.referenced == {"key1"}
+
+    def test_evicts_when_all_entries_referenced(self) -> None:
+        """Eviction terminates after clearing every reference bit."""
+        cache = CacheManager(CacheConfig(max_size_bytes=60, num_shards=1))
+        cache.set("key1", 1)
+        cache.set("key2", 2)
+        cache.get("key1")
+        cache.get("key2")
+        
+        cache.set("key3", 3)
+        
+        assert cache.get_stats().evictions == 1
+        assert cache.get("key1") is None
+
+    def test_stale_reference_bits_are_dropped(self) -> None:
+        """Bits left by hits racing a removal do not outlive their keys."""
+        cache = CacheManager(CacheConfig(num_shards=1))
+        shard = cache._shards[0]
+        # As if a lock-free hit marked keys after they were invalidated
+        shard.referenced.update({"gone1", "gone2", "key1"})
+        
+        cache.set("key1", 1)
+        cache.set("key2", 2)
+        
+        assert shard.referenced == set()
+
+
 class TestCacheManagerStats:
     """Statistics tracking tests."""
 
@@ -234,6 +322,22 @@ class TestCacheManagerStats:
         stats = cache.get_stats()
         assert stats.current_entries == 1
 
+    def test_counts_from_all_threads_are_summed(self) -> None:
+        """Per-thread hit/miss counters add up without lost updates."""
+        cache = CacheManager()
+        cache.set("key1", "value1")
+        
+        def read(_: int) -> None:
+            for _ in range(1000):
+                cache.get("key1")
+                cache.get("missing")
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(read, range(8)))
+        
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses) == (8000, 8000)
+
 
 class TestCacheManagerThreadSafety:
     """Thread safety tests."""
@@ -309,9 +413,148 @@ class TestCacheManagerThreadSafety:
         # All results should be the same
         assert all(r == "computed_value" for r in results)
         
-        # Compute should be called more than once due to race conditions
-        # but all results are still correct
-        assert compute_count[0] >= 1
+        # Concurrent misses are coalesced into one computation
+        assert compute_count[0] == 1
+
+    def test_get_or_compute_propagates_errors_to_waiters(self) -> None:
+        """Callers waiting on a failed computation see its exception."""
+        cache = CacheManager()
+        started = threading.Event()
+        joined = threading.Event()
+        release = threading.Event()
+        
+        class JoinSignal(threading.Event):
+            """Flight event that reports when a waiter starts waiting on it."""
+            
+            def wait(self, timeout: Optional[float] = None) -> bool:
+                joined.set()
+                return super().wait(timeout)
+        
+        def failing() -> str:
+            started.set()
+            release.wait()
+            raise RuntimeError("load failed")
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(cache.get_or_compute, "key", failing)
+            started.wait()
+            cache._in_flight["key"].done = JoinSignal()
+            waiter = executor.submit(cache.get_or_compute, "key", lambda: "unused")
+            assert joined.wait(timeout=5)
+            release.set()
+            
+            with pytest.raises(RuntimeError, match="load failed"):
+                leader.result()
+            with pytest.raises(RuntimeError, match="load failed"):
+                waiter.result()
+        
+        assert cache._in_flight == {}
+
+
+class TestCacheManagerPrefixIndex:
+    """Tests for prefix-indexed pattern invalidation."""
+
+    @pytest.fixture
+    def cache(self) -> CacheManager:
+        cache = CacheManager(CacheConfig(num_shards=4))
+        for key in ("market:a1", "market:a2", "market:b1", "market_meta:x", "plain"):
+            cache.set(key, 1)
+        return cache
+
+    def test_operation_prefix(self, cache: CacheManager) -> None:
+        """'op:' matches exactly that operation's keys."""
+        assert cache.invalidate_pattern("market:") == 3
+        assert cache.get("market_meta:x") == 1
+
+    def test_pattern_without_colon(self, cache: CacheManager) -> None:
+        """Colon-free patterns match every prefix they start."""
+        assert cache.invalidate_pattern("market") == 4
+        assert cache.get("plain") == 1
+
+    def test_pattern_inside_hash(self, cache: CacheManager) -> None:
+        """Patterns past the colon are matched within their prefix."""
+        assert cache.invalidate_pattern("market:a") == 2
+        assert cache.get("market:b1") == 1
+
+    def test_index_follows_removals(self, cache: CacheManager) -> None:
+        """Invalidated and cleared keys leave the index."""
+        cache.invalidate("plain")
+        cache.invalidate_pattern("market")
+        
+        assert all(not shard.prefixes for shard in cache._shards)
+
+
+class TestCacheManagerSharding:
+    """Lock-striped shard tests."""
+
+    def test_rejects_non_power_of_two_shards(self) -> None:
+        """Shard count must be a power of two."""
+        with pytest.raises(ValueError, match="power of two"):
+            CacheManager(CacheConfig(num_shards=12))
+
+    def test_stats_sum_over_shards(self) -> None:
+        """Entries spread over shards are all counted."""
+        cache = CacheManager(CacheConfig(num_shards=4))
+        
+        for i in range(50):
+            cache.set(f"key_{i}", i)
+        
+        stats = cache.get_stats()
+        assert stats.current_entries == 50
+        assert sum(len(shard.entries) for shard in cache._shards) == 50
+
+    def test_eviction_keeps_total_size_within_limit(self) -> None:
+        """Eviction frees space across shards, not just the written one."""
+        cache = CacheManager(CacheConfig(max_size_bytes=4096, num_shards=8))
+        
+        for i in range(100):
+            cache.set(f"key_{i}", "x" * 300)
+        
+        stats = cache.get_stats()
+        assert stats.evictions > 0
+        assert stats.current_size_bytes <= 4096
+        assert cache.get("key_99") is not None
+
+    def test_invalidate_pattern_spans_shards(self) -> None:
+        """Pattern invalidation visits every shard."""
+        cache = CacheManager(CacheConfig(num_shards=8))
+        for i in range(20):
+            cache.set(f"market:{i}", i)
+        cache.set("meta:1", 1)
+        
+        assert cache.invalidate_pattern("market:") == 20
+        assert cache.get_stats().current_entries == 1
+
+
+class TestCacheManagerSizeEstimate:
+    """Tests for entry size estimation."""
+
+    def test_list_scaled_from_first_item(self) -> None:
+        """Homogeneous lists are sized from one element."""
+        cache = CacheManager()
+        value = ["x" * 100] * 1000
+        
+        size = cache._estimate_size(value)
+        
+        assert size == sys.getsizeof(value) + 1000 * sys.getsizeof("x" * 100)
+
+    def test_nested_dict_counts_inner_lists(self) -> None:
+        """Dict values that are lists are sized by their contents."""
+        cache = CacheManager()
+        
+        shallow = cache._estimate_size({"AAPL": []})
+        nested = cache._estimate_size({"AAPL": [1.0] * 500})
+        
+        assert nested - shallow >= 500 * sys.getsizeof(1.0)
+
+    def test_uses_deep_sizeof(self) -> None:
+        """Objects defining __sizeof__ are measured by it."""
+        
+        class Blob:
+            def __sizeof__(self) -> int:
+                return 10_000
+        
+        assert CacheManager()._estimate_size(Blob()) >= 10_000
 
 
 class TestCacheManagerDisabled:
@@ -361,3 +604,14 @@ class TestCacheManagerMakeKey:
         
         assert key1 != key2
 
+    def test_make_key_distinguishes_value_types(self) -> None:
+        """An int and its string form produce different keys."""
+        assert CacheManager.make_key("op", a=1) != CacheManager.make_key("op", a="1")
+
+    def test_make_key_accepts_unhashable_values(self) -> None:
+        """Unhashable parameters are hashed without memoization."""
+        key1 = CacheManager.make_key("op", symbols=["AAPL", "MSFT"])
+        key2 = CacheManager.make_key("op", symbols=["AAPL", "MSFT"])
+        
+        assert key1 == key2
+        assert len(key1.split(":", 1)[1]) == 16
@@ -176,6 +176,61 @@ class TestCachedProviderMarketData:
         # Provider should be called twice
         assert mock_provider.bulk_load_market_data.call_count == 2
 
+    def test_asset_order_does_not_affect_key(
+        self, mock_provider, sample_assets
+    ) -> None:
+        """Same assets in a different order hit the cache."""
+        cached = CachedUniverseProvider(mock_provider)
+
+        cached.bulk_load_market_data(
+            sample_assets,
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+        )
+        cached.bulk_load_market_data(
+            list(reversed(sample_assets)),
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+        )
+
+        assert mock_provider.bulk_load_market_data.call_count == 1
+
+    def test_different_assets_miss_cache(
+        self, mock_provider, sample_assets
+    ) -> None:
+        """A different asset set results in cache miss."""
+        cached = CachedUniverseProvider(mock_provider)
+
+        cached.bulk_load_market_data(
+            sample_assets,
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+        )
+        cached.bulk_load_market_data(
+            sample_assets[:1],
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+        )
+
+        assert mock_provider.bulk_load_market_data.call_count == 2
+
+    def test_resized_list_is_rekeyed(
+        self, mock_provider, sample_assets
+    ) -> None:
+        """Memoized symbol digest is not reused after the list shrinks."""
+        cached = CachedUniverseProvider(mock_provider)
+        assets = list(sample_assets)
+
+        cached.bulk_load_market_data(
+            assets, datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+        assets.pop()
+        cached.bulk_load_market_data(
+            assets, datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        assert mock_provider.bulk_load_market_data.call_count == 2
+
 
 class TestCachedProviderMetadata:
     """Tests for bulk_load_metadata caching."""
@@ -10,6 +10,7 @@ Tests:
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from typing import List
 
@@ -88,6 +89,21 @@ class TestCFDAvailability:
         # Minor crypto should not have CFD (based on mock logic)
         assert len(instruments) == 0
 
+    def test_crypto_matches_base_token(self, default_resolver: CFDResolver) -> None:
+        """Only the base before the dash counts, not substrings of it."""
+        wrapped = Asset(
+            symbol="WBTC-USD",
+            name="Wrapped Bitcoin",
+            asset_class=AssetClass.CRYPTO,
+            asset_type=AssetType.CRYPTO,
+            exchange="COINBASE",
+            listing_date=datetime(2019, 1, 1).date(),
+        )
+        bare = replace(wrapped, symbol="ETH", name="Ethereum")
+
+        assert default_resolver.resolve(wrapped, "Test Broker", (1.0, 100.0)) == []
+        assert len(default_resolver.resolve(bare, "Test Broker", (1.0, 100.0))) == 1
+
     def test_forex_has_cfd(self, default_resolver: CFDResolver) -> None:
         """Forex pairs have CFDs."""
         eurusd = Asset(
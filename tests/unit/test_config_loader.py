@@ -3,11 +3,13 @@ Unit Tests for ConfigLoader.
 
 Test Aspects Covered:
     ✅ Business Logic: Config loading and merging
+    ✅ State: Parse cache invalidated by file changes
     ✅ Error Handling: Invalid YAML, missing files
 """
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import tempfile
 
@@ -128,6 +130,65 @@ global:
         assert merged["structural_filter"]["enabled"] is True  # From base
         assert merged["structural_filter"]["min_listing_age_days"] == 200  # From overlay
 
+    def test_merge_leaves_inputs_unchanged(self) -> None:
+        """
+        SCENARIO: Nested overlay merged into a base config
+        EXPECTED: Neither input dict is modified
+        """
+        # Arrange
+        loader = ConfigLoader()
+        base = {"cache": {"limits": {"max_size_mb": 512, "ttl": 60}}}
+        overlay = {"cache": {"limits": {"ttl": 120}, "enabled": False}}
+
+        # Act
+        merged = loader._merge_configs(base, overlay)
+
+        # Assert
+        assert merged == {"cache": {"limits": {"max_size_mb": 512, "ttl": 120}, "enabled": False}}
+        assert base == {"cache": {"limits": {"max_size_mb": 512, "ttl": 60}}}
+
+    def test_reload_sees_file_changes(self, tmp_path: Path) -> None:
+        """
+        SCENARIO: Config file edited between two loads
+        EXPECTED: Second load reflects the edit despite parse caching
+        """
+        # Arrange
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("global:\n  default_lookback_days: 30\n")
+        loader = ConfigLoader(base_path=tmp_path)
+        first = loader.load("config.yaml")
+        stat = config_file.stat()
+
+        # Act
+        config_file.write_text("global:\n  default_lookback_days: 45\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = loader.load("config.yaml")
+
+        # Assert
+        assert first.global_settings.default_lookback_days == 30
+        assert second.global_settings.default_lookback_days == 45
+
+    def test_unchanged_files_reuse_validated_config(self, tmp_path: Path) -> None:
+        """
+        SCENARIO: Same config and profile loaded twice without edits
+        EXPECTED: Merged config is validated once and shared
+        """
+        # Arrange
+        (tmp_path / "config.yaml").write_text("global:\n  default_lookback_days: 30\n")
+        profile_dir = tmp_path / "config" / "profiles"
+        profile_dir.mkdir(parents=True)
+        (profile_dir / "fast.yaml").write_text("global:\n  timezone: Europe/Berlin\n")
+        loader = ConfigLoader(base_path=tmp_path)
+
+        # Act
+        first = loader.load("config.yaml", profile="fast")
+        second = ConfigLoader(base_path=tmp_path).load("config.yaml", profile="fast")
+
+        # Assert
+        assert first is second
+        assert first.global_settings.default_lookback_days == 30
+        assert first.global_settings.timezone == "Europe/Berlin"
+
     def test_load_from_dict(self) -> None:
         """
         SCENARIO: Load config from dictionary
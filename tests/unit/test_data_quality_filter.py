@@ -4,11 +4,14 @@ Unit Tests for DataQualityFilter.
 Test Aspects Covered:
     ✅ Business Logic: Correct quality assessment
     ✅ Edge Cases: Missing metrics, boundary values
+    ✅ Concurrency: Sharded checks on worker threads keep sequential order
+    ✅ Performance: Quality metrics fetched in one bulk lookup per batch
 """
 
 from __future__ import annotations
 
 from datetime import date, datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -236,3 +239,92 @@ class TestDataQualityFilter:
 
         # Assert
         assert "NOMETRICS" in result.rejected_assets
+
+
+class TestParallelChecks:
+    """Test cases for the optional worker threads."""
+
+    def test_parallel_matches_sequential(
+        self,
+        filter_config: DataQualityFilterConfig,
+    ) -> None:
+        """
+        SCENARIO: Mixed-quality assets checked on 3 threads
+        EXPECTED: Same passed/rejected order and reasons as sequential
+        """
+        ref_date = datetime(2024, 12, 15)
+        assets = [
+            Asset(
+                symbol=f"A{i}",
+                name=f"Asset {i}",
+                asset_class=AssetClass.STOCK,
+                asset_type=AssetType.COMMON_STOCK,
+                exchange="NYSE",
+                listing_date=date(2000, 1, 1),
+            )
+            for i in range(10)
+        ]
+        context = DataContext(
+            assets=assets,
+            market_data={},
+            quality_metrics={
+                a.symbol: QualityMetrics(missing_days=i, last_available_date=ref_date)
+                for i, a in enumerate(assets)
+                if i != 4
+            },
+        )
+        parallel = DataQualityFilter(filter_config, max_workers=3)
+
+        try:
+            result = parallel.apply(assets, ref_date, context)
+        finally:
+            parallel.close()
+
+        assert result == DataQualityFilter(filter_config).apply(assets, ref_date, context)
+        assert result.passed_assets == ["A0", "A1", "A2", "A3"]
+        assert result.rejection_reasons["A4"] == "no quality metrics available"
+
+
+class TestBulkQualityLookup:
+    """Test cases for the batched quality metrics lookup."""
+
+    def test_apply_fetches_metrics_once(
+        self,
+        filter_config: DataQualityFilterConfig,
+    ) -> None:
+        """
+        SCENARIO: Several assets filtered in one apply call
+        EXPECTED: One bulk fetch for the batch, no per-asset context calls
+        """
+        ref_date = datetime(2024, 12, 15)
+        assets = [
+            Asset(
+                symbol=symbol,
+                name=symbol,
+                asset_class=AssetClass.STOCK,
+                asset_type=AssetType.COMMON_STOCK,
+                exchange="NYSE",
+                listing_date=date(2000, 1, 1),
+            )
+            for symbol in ("A", "B", "C")
+        ]
+        context = DataContext(
+            assets=assets,
+            quality_metrics={
+                "A": QualityMetrics(missing_days=0, last_available_date=ref_date),
+                "B": QualityMetrics(missing_days=9, last_available_date=ref_date),
+            },
+        )
+
+        with patch.object(
+            context, "bulk_get_quality_metrics", wraps=context.bulk_get_quality_metrics
+        ) as bulk, patch.object(context, "get_quality_metrics") as single:
+            result = DataQualityFilter(filter_config).apply(assets, ref_date, context)
+
+        bulk.assert_called_once_with(["A", "B", "C"])
+        single.assert_not_called()
+        assert result.passed_assets == ["A"]
+        assert result.rejected_assets == ["B", "C"]
+        assert context.bulk_get_quality_metrics(["C", "A"]) == {
+            "A": QualityMetrics(missing_days=0, last_available_date=ref_date)
+        }
@@ -0,0 +1,302 @@
+"""
+Unit Tests for DatabaseUniverseProvider.
+
+Test Aspects Covered:
+    ✅ Business Logic: Query execution on pooled connections, batched row/column loads
+    ✅ Error Handling: Missing pool, connection release on failure
+    ✅ State: Snapshot cache tiers, per-run memo
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from universe_screener.adapters.database_provider import DatabaseUniverseProvider
+from universe_screener.domain.entities import Asset, AssetClass, AssetType
+
+
+def _asset(symbol: str) -> Asset:
+    """Create a minimal stock asset."""
+    return Asset(
+        symbol=symbol,
+        name=symbol,
+        asset_class=AssetClass.STOCK,
+        asset_type=AssetType.COMMON_STOCK,
+        exchange="NASDAQ",
+        listing_date=date(2000, 1, 1),
+    )
+
+
+@pytest.fixture
+def pool() -> MagicMock:
+    """Create a mock connection pool returning two rows."""
+    cursor = MagicMock()
+    cursor.description = [("symbol",), ("close",)]
+    cursor.fetchall.return_value = [("AAPL", 101.5), ("MSFT", 320.0)]
+
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    pool = MagicMock()
+    pool.get_connection.return_value = conn
+    return pool
+
+
+class TestExecuteQuery:
+    """Tests for _execute_query."""
+
+    def test_returns_rows_as_dicts(self, pool) -> None:
+        """Rows are mapped to column names."""
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+
+        rows = provider._execute_query("SELECT symbol, close FROM t WHERE x = %s", (1,))
+
+        assert rows == [
+            {"symbol": "AAPL", "close": 101.5},
+            {"symbol": "MSFT", "close": 320.0},
+        ]
+        cursor = pool.get_connection.return_value.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with("SELECT symbol, close FROM t WHERE x = %s", (1,))
+
+    def test_releases_connection_on_error(self, pool) -> None:
+        """Connection goes back to the pool even if the query fails."""
+        conn = pool.get_connection.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = RuntimeError("boom")
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            provider._execute_query("SELECT 1")
+
+        pool.release_connection.assert_called_once_with(conn)
+
+    def test_requires_pool(self) -> None:
+        """Executing without a pool raises."""
+        provider = DatabaseUniverseProvider()
+
+        with pytest.raises(RuntimeError, match="no connection pool"):
+            provider._execute_query("SELECT 1")
+
+
+class TestBulkLoadMarketData:
+    """Tests for bulk_load_market_data."""
+
+    def test_binds_symbol_batches_as_array(self, pool) -> None:
+        """Each batch is passed as one list parameter and rows are merged."""
+        cursor = pool.get_connection.return_value.cursor.return_value.__enter__.return_value
+        cursor.description = [
+            ("symbol",), ("date",), ("open",), ("high",), ("low",), ("close",), ("volume",)
+        ]
+        table = {
+            symbol: [(symbol, datetime(2024, 1, 2), 100.0, 102.0, 99.0, close, 1000)]
+            for symbol, close in (("AAPL", 101.0), ("MSFT", 320.0), ("NVDA", 480.0))
+        }
+
+        def execute(query, params):
+            cursor.__iter__.side_effect = lambda: iter(
+                [row for symbol in params[0] for row in table[symbol]]
+            )
+
+        cursor.execute.side_effect = execute
+        assets = [_asset("AAPL"), _asset("MSFT"), _asset("NVDA")]
+        provider = DatabaseUniverseProvider(connection_pool=pool, batch_size=2)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+
+        result = provider.bulk_load_market_data(assets, start, end)
+
+        calls = cursor.execute.call_args_list
+        assert [c.args[1] for c in calls] == [
+            (["AAPL", "MSFT"], start, end),
+            (["NVDA"], start, end),
+        ]
+        assert all("= ANY(%s)" in c.args[0] for c in calls)
+        assert sorted(result) == ["AAPL", "MSFT", "NVDA"]
+        assert [[bar.close for bar in result[s]] for s in ("AAPL", "MSFT", "NVDA")] == [
+            [101.0],
+            [320.0],
+            [480.0],
+        ]
+
+
+class TestSnapshotCache:
+    """Tests for read-aside caching of snapshot-pinned queries."""
+
+    def test_snapshot_query_runs_once(self, pool) -> None:
+        """Repeated snapshot-pinned loads hit the in-process cache."""
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+        provider._query_market_data = MagicMock(return_value={"AAPL": []})
+        assets = [_asset("AAPL")]
+
+        for _ in range(2):
+            result = provider.bulk_load_market_data(
+                assets, datetime(2024, 1, 1), datetime(2024, 1, 31), snapshot_id="s1"
+            )
+
+        assert result == {"AAPL": []}
+        provider._query_market_data.assert_called_once()
+
+    def test_live_query_is_not_cached(self, pool) -> None:
+        """Without a snapshot_id every call goes to the database."""
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+        provider._query_market_data = MagicMock(return_value={"AAPL": []})
+        assets = [_asset("AAPL")]
+
+        for _ in range(2):
+            provider.bulk_load_market_data(assets, datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+        assert provider._query_market_data.call_count == 2
+
+    def test_shared_tier_hit_skips_query(self, pool) -> None:
+        """A hit in the shared tier is returned without querying."""
+        shared = MagicMock()
+        shared.get.return_value = {"AAPL": []}
+        provider = DatabaseUniverseProvider(connection_pool=pool, shared_cache=shared)
+        provider._query_market_data = MagicMock()
+
+        result = provider.bulk_load_market_data(
+            [_asset("AAPL")], datetime(2024, 1, 1), datetime(2024, 1, 31), snapshot_id="s1"
+        )
+
+        assert result == {"AAPL": []}
+        provider._query_market_data.assert_not_called()
+
+
+class TestCheckDataAvailability:
+    """Tests for check_data_availability."""
+
+    @pytest.fixture
+    def availability_pool(self, pool) -> MagicMock:
+        """Pool returning one availability row for AAPL."""
+        cursor = pool.get_connection.return_value.cursor.return_value.__enter__.return_value
+        cursor.description = [("symbol",), ("available_days",), ("last_date",)]
+        cursor.fetchall.return_value = [("AAPL", 18, date(2024, 6, 7))]
+        return pool
+
+    def _query(self, pool) -> str:
+        """SQL of the last executed query."""
+        cursor = pool.get_connection.return_value.cursor.return_value.__enter__.return_value
+        return cursor.execute.call_args.args[0]
+
+    def _params(self, pool) -> tuple:
+        """Parameters bound to the last executed query."""
+        cursor = pool.get_connection.return_value.cursor.return_value.__enter__.return_value
+        return cursor.execute.call_args.args[1]
+
+    def test_standard_lookback_uses_view(self, availability_pool) -> None:
+        """Precomputed lookbacks read the materialized view."""
+        provider = DatabaseUniverseProvider(connection_pool=availability_pool)
+
+        result = provider.check_data_availability(
+            [_asset("AAPL"), _asset("MSFT")], datetime(2024, 6, 7), 30
+        )
+
+        assert "mv_availability" in self._query(availability_pool)
+        assert "days_30" in self._query(availability_pool)
+        # 30 calendar days ending Fri 2024-06-07 hold 22 weekdays
+        assert result["AAPL"].missing_days == 4
+        assert "MSFT" not in result
+
+    def test_view_counts_same_window_as_fallback(self, availability_pool) -> None:
+        """
+        SCENARIO: Stale symbol whose latest bar is before the reference date
+        EXPECTED: View path subtracts bars before the window start, binding
+            the window start first; the fallback binds the same window
+        """
+        provider = DatabaseUniverseProvider(connection_pool=availability_pool)
+        ref_date = datetime(2024, 6, 7)
+        window_start = datetime(2024, 5, 8)
+
+        provider.check_data_availability([_asset("AAPL")], ref_date, 30)
+        view_query, view_params = self._query(availability_pool), self._params(availability_pool)
+        provider.check_data_availability([_asset("AAPL")], ref_date, 45)
+        fallback_params = self._params(availability_pool)
+
+        assert "days_30 - (SELECT COUNT(*)" in view_query
+        assert "m.date > v.date - INTERVAL '30 days' AND m.date <= %s" in view_query
+        assert view_params == (window_start, ["AAPL"], window_start, ref_date)
+        assert fallback_params == (["AAPL"], datetime(2024, 4, 23), ref_date)
+
+    def test_other_lookback_aggregates_market_data(self, availability_pool) -> None:
+        """Lookbacks without a view column fall back to COUNT(*)."""
+        provider = DatabaseUniverseProvider(connection_pool=availability_pool)
+
+        provider.check_data_availability([_asset("AAPL")], datetime(2024, 6, 7), 45)
+
+        assert "GROUP BY symbol" in self._query(availability_pool)
+
+
+class TestBulkLoadMarketColumns:
+    """Tests for bulk_load_market_columns."""
+
+    def test_rows_are_transposed_per_symbol(self, pool) -> None:
+        """Ordered rows become one columnar series per symbol."""
+        cursor = pool.get_connection.return_value.cursor.return_value.__enter__.return_value
+        cursor.description = [
+            ("symbol",), ("date",), ("open",), ("high",), ("low",), ("close",), ("volume",)
+        ]
+        rows = [
+            ("AAPL", date(2024, 1, 2), 100.0, 102.0, 99.0, 101.0, 1000),
+            ("AAPL", date(2024, 1, 3), 101.0, 103.0, 100.0, 102.0, 1100),
+            ("MSFT", date(2024, 1, 2), 300.0, 305.0, 299.0, 304.0, 500),
+        ]
+        cursor.__iter__.side_effect = lambda: iter(rows)
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+
+        result = provider.bulk_load_market_columns(
+            [_asset("AAPL"), _asset("MSFT"), _asset("NVDA")],
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+        )
+
+        assert result["AAPL"].dates == (datetime(2024, 1, 2), datetime(2024, 1, 3))
+        assert list(result["AAPL"].close) == [101.0, 102.0]
+        assert list(result["MSFT"].volume) == [500]
+        assert len(result["NVDA"]) == 0
+
+    def test_streams_on_named_cursor(self, pool) -> None:
+        """Market data is read through a server-side cursor in chunks."""
+        conn = pool.get_connection.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.__iter__.side_effect = lambda: iter([])
+        provider = DatabaseUniverseProvider(connection_pool=pool, stream_prefetch_rows=500)
+
+        provider.bulk_load_market_columns(
+            [_asset("AAPL")], datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        assert "name" in conn.cursor.call_args.kwargs
+        assert cursor.itersize == 500
+        conn.rollback.assert_called_once()
+        pool.release_connection.assert_called_once_with(conn)
+
+
+class TestRequestScope:
+    """Tests for per-run memoization."""
+
+    def test_identical_calls_run_once_in_scope(self, pool) -> None:
+        """Repeated live calls inside a scope hit the database once."""
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+        provider._query_availability = MagicMock(return_value={})
+        assets = [_asset("AAPL")]
+
+        with provider.request_scope():
+            provider.check_data_availability(assets, datetime(2024, 6, 7), 30)
+            provider.check_data_availability(assets, datetime(2024, 6, 7), 30)
+            provider.check_data_availability(assets, datetime(2024, 6, 7), 60)
+
+        assert provider._query_availability.call_count == 2
+
+    def test_memo_is_dropped_after_scope(self, pool) -> None:
+        """Live results are not reused once the scope exits."""
+        provider = DatabaseUniverseProvider(connection_pool=pool)
+        provider._query_availability = MagicMock(return_value={})
+        assets = [_asset("AAPL")]
+
+        with provider.request_scope():
+            provider.check_data_availability(assets, datetime(2024, 6, 7), 30)
+        provider.check_data_availability(assets, datetime(2024, 6, 7), 30)
+
+        assert provider._query_availability.call_count == 2
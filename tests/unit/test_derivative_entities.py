@@ -0,0 +1,67 @@
+"""
+Unit Tests for Derivative Entities.
+
+Test Aspects Covered:
+    ✅ Business Logic: Instrument serialization
+    ✅ Error Handling: Invalid leverage
+    ✅ State: Shared read-only default metadata
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from universe_screener.derivatives.entities import InstrumentType, TradableInstrument
+from universe_screener.domain.entities import Asset, AssetClass, AssetType
+
+
+def _instrument(**overrides) -> TradableInstrument:
+    """Create a CFD on a minimal stock."""
+    asset = Asset(
+        symbol="AAPL",
+        name="Apple Inc",
+        asset_class=AssetClass.STOCK,
+        asset_type=AssetType.COMMON_STOCK,
+        exchange="NASDAQ",
+        listing_date=date(2000, 1, 1),
+    )
+    params = dict(
+        underlying=asset,
+        instrument_type=InstrumentType.CFD,
+        leverage=5.0,
+        broker="Test Broker",
+        trading_costs=0.05,
+        min_position_size=1.0,
+    )
+    params.update(overrides)
+    return TradableInstrument(**params)
+
+
+class TestTradableInstrument:
+    """Tests for TradableInstrument."""
+
+    def test_default_metadata_is_shared_and_read_only(self) -> None:
+        """Instruments without metadata share one immutable mapping."""
+        first, second = _instrument(), _instrument()
+
+        assert first.metadata is second.metadata
+        assert _instrument(metadata=None).metadata is first.metadata
+        with pytest.raises(TypeError):
+            first.metadata["direction"] = "LONG"  # type: ignore[index]
+
+    def test_to_dict_returns_plain_values(self) -> None:
+        """Serialized type is a plain string and metadata a regular dict."""
+        data = _instrument(metadata={"short_selling": True}).to_dict()
+
+        assert data["instrument_type"] == "CFD"
+        assert type(data["instrument_type"]) is str
+        assert data["metadata"] == {"short_selling": True}
+        assert type(data["metadata"]) is dict
+        assert type(_instrument().to_dict()["metadata"]) is dict
+
+    def test_rejects_leverage_below_one(self) -> None:
+        """Leverage under 1x is invalid."""
+        with pytest.raises(ValueError, match="Leverage"):
+            _instrument(leverage=0.5)
@@ -6,11 +6,12 @@ Tests:
     - Filter criteria application
     - Best instrument selection
     - Strategy registration
+    - Clearing memoized strategy results
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 from unittest.mock import Mock
 
@@ -128,6 +129,22 @@ class TestDerivativeResolverBasic:
         assert stock_asset.symbol in instruments
         assert forex_asset.symbol in instruments
 
+    def test_parallel_matches_sequential(
+        self, stock_asset: Asset, forex_asset: Asset, default_config: DerivativeConfig
+    ) -> None:
+        """Threaded resolution returns the same instruments in the same order."""
+        underlyings = [stock_asset, forex_asset]
+        sequential = DerivativeResolver(config=default_config)
+        parallel = DerivativeResolver(config=default_config, max_workers=4)
+
+        try:
+            result = parallel.get_tradable_instruments(underlyings)
+        finally:
+            parallel.close()
+
+        assert list(result) == list(sequential.get_tradable_instruments(underlyings))
+        assert parallel._executor is None
+
 
 class TestInstrumentFilter:
     """Tests for InstrumentFilter criteria."""
@@ -215,6 +232,30 @@ class TestInstrumentFilter:
         lev_filter = InstrumentFilter(min_leverage=15.0)
         assert lev_filter.matches(instrument) is False
 
+    def test_compiled_filter_excludes_expiring(self) -> None:
+        """Compiled predicate applies the expiry cutoff and short-selling flag."""
+        asset = Mock(spec=Asset)
+
+        def turbo(days: int, short_selling: bool = True) -> TradableInstrument:
+            return TradableInstrument(
+                underlying=asset,
+                instrument_type=InstrumentType.TURBO,
+                leverage=5.0,
+                broker="Test Broker",
+                trading_costs=0.05,
+                min_position_size=1.0,
+                expiry_date=datetime.now() + timedelta(days=days),
+                metadata={"short_selling": short_selling},
+            )
+
+        predicate = InstrumentFilter(
+            exclude_expiring_within_days=30, require_short_selling=True
+        ).compile()
+
+        assert predicate(turbo(90)) is True
+        assert predicate(turbo(10)) is False
+        assert predicate(turbo(90, short_selling=False)) is False
+
 
 class TestBestInstrumentSelection:
     """Tests for best instrument selection."""
@@ -269,6 +310,21 @@ class TestBestInstrumentSelection:
 class TestDerivativeResolverStrategies:
     """Tests for custom strategy registration."""
 
+    def test_clear_cache_reaches_strategies(self, stock_asset: Asset) -> None:
+        """clear_cache clears each strategy's memo and skips those without one."""
+        turbo = TurboResolver()
+        plain = Mock(spec=["instrument_type", "resolve"])
+        plain.instrument_type = InstrumentType.OPTION
+        plain.resolve.return_value = []
+        resolver = DerivativeResolver(strategies=[turbo, plain])
+        first = resolver.get_tradable_instruments([stock_asset])
+
+        resolver.clear_cache()
+        second = resolver.get_tradable_instruments([stock_asset])
+
+        assert [i.symbol for i in second["AAPL"]] == [i.symbol for i in first["AAPL"]]
+        assert second["AAPL"][0] is not first["AAPL"][0]
+
     def test_register_custom_strategy(self, stock_asset: Asset) -> None:
         """Register and use custom strategy."""
         resolver = DerivativeResolver()
@@ -304,6 +360,89 @@ class TestDerivativeResolverStrategies:
         assert InstrumentType.FUTURE in types
 
 
+    def test_plan_covers_wanted_types_per_broker(self) -> None:
+        """Resolution plan pairs each wanted type with each broker."""
+        resolver = DerivativeResolver()
+
+        plan = resolver._build_plan(
+            InstrumentFilter(instrument_types=[InstrumentType.CFD, InstrumentType.OPTION]),
+            ["Broker A", "Broker B"],
+        )
+
+        # OPTION has no registered strategy and is skipped
+        assert [(broker, t) for _, broker, t in plan] == [
+            ("Broker A", InstrumentType.CFD),
+            ("Broker B", InstrumentType.CFD),
+        ]
+
+
+    def test_legacy_strategy_gets_no_pruning_criteria(self, stock_asset: Asset) -> None:
+        """Strategies without the keyword criteria are called as before."""
+        calls = []
+
+        class LegacyStrategy:
+            instrument_type = InstrumentType.OPTION
+
+            def resolve(self, underlying, broker, leverage_range):
+                calls.append((underlying.symbol, broker))
+                return []
+
+        resolver = DerivativeResolver(strategies=[LegacyStrategy()])
+
+        resolver.get_tradable_instruments(
+            [stock_asset], InstrumentFilter(brokers=["Broker A"], max_trading_costs=0.5)
+        )
+
+        assert calls == [(stock_asset.symbol, "Broker A")]
+
+    def test_streamed_results_are_filtered(self, stock_asset: Asset) -> None:
+        """A strategy may yield instruments; rejected ones are dropped."""
+
+        class StreamingStrategy:
+            instrument_type = InstrumentType.OPTION
+
+            def resolve(self, underlying, broker, leverage_range):
+                for leverage in (2.0, 50.0):
+                    yield TradableInstrument(
+                        underlying=underlying,
+                        instrument_type=InstrumentType.OPTION,
+                        leverage=leverage,
+                        broker=broker,
+                        trading_costs=0.1,
+                        min_position_size=1.0,
+                    )
+
+        resolver = DerivativeResolver(strategies=[StreamingStrategy()])
+
+        result = resolver.get_tradable_instruments(
+            [stock_asset], InstrumentFilter(brokers=["Broker A"], max_leverage=10.0)
+        )
+
+        assert [i.leverage for i in result[stock_asset.symbol]] == [2.0]
+
+    def test_strategy_skipped_for_unsupported_asset_class(
+        self, stock_asset: Asset, crypto_asset: Asset
+    ) -> None:
+        """Strategies are only called for the asset classes they declare."""
+        calls = []
+
+        class CryptoOnlyStrategy:
+            instrument_type = InstrumentType.OPTION
+            supported_asset_classes = frozenset({AssetClass.CRYPTO})
+
+            def resolve(self, underlying, broker, leverage_range):
+                calls.append(underlying.symbol)
+                return []
+
+        resolver = DerivativeResolver(strategies=[CryptoOnlyStrategy()])
+
+        resolver.get_tradable_instruments(
+            [stock_asset, crypto_asset], InstrumentFilter(brokers=["Broker A"])
+        )
+
+        assert calls == [crypto_asset.symbol]
+
+
 class TestDerivativeResolverConfig:
     """Tests for configuration-driven behavior."""
 
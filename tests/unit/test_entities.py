@@ -0,0 +1,83 @@
+"""
+Unit Tests for Domain Entities.
+
+Test Aspects Covered:
+    ✅ Business Logic: Asset ingestion with coercion, symbol identity, cached hash
+    ✅ Error Handling: Invalid raw records
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from universe_screener.domain.entities import Asset, AssetClass, AssetType, StageResult
+
+
+class TestAssetFromRaw:
+    """Tests for validated asset ingestion."""
+
+    def test_coerces_raw_strings(self) -> None:
+        """Enum and date fields are parsed from strings."""
+        asset = Asset.from_raw(
+            {
+                "symbol": "AAPL",
+                "name": "Apple Inc",
+                "asset_class": "STOCK",
+                "asset_type": "COMMON_STOCK",
+                "exchange": "NASDAQ",
+                "listing_date": "1980-12-12",
+            }
+        )
+
+        assert asset.asset_class is AssetClass.STOCK
+        assert asset.asset_type is AssetType.COMMON_STOCK
+        assert asset.listing_date == date(1980, 12, 12)
+
+    def test_rejects_missing_fields(self) -> None:
+        """Incomplete records raise a validation error."""
+        with pytest.raises(ValidationError):
+            Asset.from_raw({"symbol": "AAPL"})
+
+    def test_identity_is_symbol(self) -> None:
+        """Assets with the same symbol are equal and hash alike."""
+        raw = {
+            "symbol": "AAPL",
+            "name": "Apple Inc",
+            "asset_class": "STOCK",
+            "exchange": "NASDAQ",
+            "listing_date": "1980-12-12",
+        }
+
+        assert Asset.from_raw(raw) == Asset.from_raw({**raw, "name": "Apple"})
+        assert len({Asset.from_raw(raw), Asset.from_raw(raw)}) == 1
+
+    def test_pickle_round_trip_keeps_identity(self) -> None:
+        """Unpickled assets are rebuilt, so the cached hash stays valid."""
+        asset = Asset(
+            symbol="".join(["AA", "PL"]),
+            name="Apple Inc",
+            asset_class=AssetClass.STOCK,
+            exchange="NASDAQ",
+            listing_date=date(1980, 12, 12),
+        )
+
+        restored = pickle.loads(pickle.dumps(asset))
+
+        assert asset.symbol is sys.intern("AAPL")
+        assert restored == asset
+        assert hash(restored) == hash("AAPL")
+        assert "_hash" not in repr(asset)
+
+
+class TestStageResult:
+    """Tests for the stage audit record."""
+
+    def test_reduction_ratio(self) -> None:
+        """Ratio reflects filtered share; empty input gives zero."""
+        assert StageResult("liquidity", 10, 4, 0.1).reduction_ratio == pytest.approx(0.6)
+        assert StageResult("liquidity", 0, 0, 0.1).reduction_ratio == 0.0
@@ -5,6 +5,7 @@ Tests for:
     - Spread calculation in pips
     - 24/5 trading availability
     - Threshold enforcement
+    - Column-wise check parity
 """
 
 from __future__ import annotations
@@ -15,7 +16,11 @@ import pytest
 
 from universe_screener.config.models import ForexLiquidityConfig
 from universe_screener.domain.entities import Asset, AssetClass, AssetType
-from universe_screener.domain.value_objects import MarketData
+from universe_screener.domain.value_objects import (
+    MarketData,
+    MarketDataColumns,
+    format_reason,
+)
 from universe_screener.filters.liquidity_strategies import ForexLiquidityStrategy
 
 
@@ -105,6 +110,22 @@ class TestForexLiquidityStrategyBasic:
         assert is_liquid is False
         assert "no market data" in reason
 
+    def test_columns_match_rows(
+        self, default_config, eurusd_asset
+    ) -> None:
+        """check_columns gives the same verdict as check_liquidity."""
+        strategy = ForexLiquidityStrategy(default_config)
+
+        for spread_pct in (0.00001, 0.05):
+            market_data = create_market_data(spread_pct=spread_pct)
+            columns = MarketDataColumns.from_rows(market_data)
+
+            is_liquid, reason = strategy.check_columns(eurusd_asset, columns)
+
+            assert (is_liquid, format_reason(reason)) == (
+                strategy.check_liquidity(eurusd_asset, market_data)
+            )
+
 
 class TestForexLiquidityStrategyThresholds:
     """Threshold configuration tests."""
@@ -0,0 +1,148 @@
+"""
+Unit Tests for FusedEarlyRejectFilter.
+
+Test Aspects Covered:
+    ✅ Business Logic: Same passed set as the staged filters, per-stage counts
+    ✅ Edge Cases: Early reject skips later stages, disabled stages
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import List
+
+import pytest
+
+from universe_screener.config.models import (
+    DataQualityFilterConfig,
+    LiquidityFilterConfig,
+    StockLiquidityConfig,
+    StructuralFilterConfig,
+)
+from universe_screener.domain.entities import Asset, AssetClass, AssetType
+from universe_screener.domain.value_objects import MarketData, QualityMetrics
+from universe_screener.filters import (
+    DataQualityFilter,
+    FusedEarlyRejectFilter,
+    LiquidityFilter,
+    StructuralFilter,
+)
+from universe_screener.pipeline.data_context import DataContext
+
+REF_DATE = datetime(2024, 12, 15)
+
+
+def _asset(symbol: str, exchange: str = "NYSE") -> Asset:
+    """Create a long-listed common stock."""
+    return Asset(
+        symbol=symbol,
+        name=symbol,
+        asset_class=AssetClass.STOCK,
+        asset_type=AssetType.COMMON_STOCK,
+        exchange=exchange,
+        listing_date=date(2000, 1, 1),
+    )
+
+
+def _bars(volume: int) -> List[MarketData]:
+    """Sixty daily bars at price 100."""
+    return [
+        MarketData(
+            date=REF_DATE - timedelta(days=i),
+            open=100.0,
+            high=101.0,
+            low=99.0,
+            close=100.0,
+            volume=volume,
+        )
+        for i in range(60)
+    ]
+
+
+@pytest.fixture
+def stages() -> list:
+    """Structural, data quality and liquidity filters, cheapest first."""
+    return [
+        StructuralFilter(StructuralFilterConfig(allowed_exchanges=["NYSE"])),
+        DataQualityFilter(DataQualityFilterConfig(max_missing_days=3)),
+        LiquidityFilter(
+            LiquidityFilterConfig(
+                stock=StockLiquidityConfig(
+                    min_avg_dollar_volume_usd=5_000_000,
+                    min_trading_days_pct=0.9,
+                    lookback_days=60,
+                )
+            )
+        ),
+    ]
+
+
+@pytest.fixture
+def assets() -> List[Asset]:
+    """One passing asset and one failing each stage."""
+    return [_asset("GOOD"), _asset("OTC", exchange="OTC"), _asset("GAPS"), _asset("THIN")]
+
+
+@pytest.fixture
+def context(assets: List[Asset]) -> DataContext:
+    """Context where GAPS misses data and THIN trades too little."""
+    quality = {
+        a.symbol: QualityMetrics(missing_days=0, last_available_date=REF_DATE) for a in assets
+    }
+    quality["GAPS"] = QualityMetrics(missing_days=10, last_available_date=REF_DATE)
+    market_data = {a.symbol: _bars(100_000) for a in assets}
+    market_data["THIN"] = _bars(1_000)
+    return DataContext(assets=assets, market_data=market_data, quality_metrics=quality)
+
+
+class TestFusedEarlyRejectFilter:
+    """Test cases for FusedEarlyRejectFilter."""
+
+    def test_matches_staged_filters(self, stages, assets, context) -> None:
+        """
+        SCENARIO: Fused pass versus running the stages one after another
+        EXPECTED: Same passed assets and reasons; one rejection per stage
+        """
+        fused = FusedEarlyRejectFilter(stages).apply(assets, REF_DATE, context)
+
+        remaining = assets
+        staged_reasons = {}
+        for stage in stages:
+            result = stage.apply(remaining, REF_DATE, context)
+            staged_reasons.update(result.rejection_reasons)
+            remaining = context.get_assets_by_symbols(result.passed_assets)
+
+        assert fused.passed_assets == [a.symbol for a in remaining] == ["GOOD"]
+        assert fused.rejection_reasons == staged_reasons
+        assert fused.stage_rejections == {
+            "structural_filter": 1,
+            "data_quality_filter": 1,
+            "liquidity_filter": 1,
+        }
+
+    def test_rejected_assets_skip_later_stages(self, stages, assets, context) -> None:
+        """
+        SCENARIO: Asset rejected by the structural stage
+        EXPECTED: Its market data is never read by the liquidity stage
+        """
+        read = []
+        get_market_data = context.get_market_data
+        context.get_market_data = lambda symbol: read.append(symbol) or get_market_data(symbol)
+
+        FusedEarlyRejectFilter(stages).apply(assets, REF_DATE, context)
+
+        assert "OTC" not in read
+        assert "GAPS" not in read
+        assert "GOOD" in read
+
+    def test_disabled_stage_is_skipped(self, assets, context) -> None:
+        """
+        SCENARIO: Only a disabled stage is fused
+        EXPECTED: Every asset passes with a zero count for that stage
+        """
+        disabled = StructuralFilter(StructuralFilterConfig(enabled=False))
+
+        result = FusedEarlyRejectFilter([disabled]).apply(assets, REF_DATE, context)
+
+        assert result.passed_assets == [a.symbol for a in assets]
+        assert result.stage_rejections == {"structural_filter": 0}
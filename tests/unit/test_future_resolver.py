@@ -0,0 +1,71 @@
+"""
+Unit Tests for FutureResolver Strategy.
+
+Tests:
+    - Future availability
+    - Third-Friday expiry dates and contract codes
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from universe_screener.derivatives.strategies import FutureResolver, _third_friday
+from universe_screener.domain.entities import Asset, AssetClass, AssetType
+
+
+@pytest.fixture
+def stock() -> Asset:
+    """Create a stock underlying."""
+    return Asset(
+        symbol="AAPL",
+        name="Apple Inc",
+        asset_class=AssetClass.STOCK,
+        asset_type=AssetType.COMMON_STOCK,
+        exchange="NASDAQ",
+        listing_date=datetime(2000, 1, 1).date(),
+    )
+
+
+class TestFutureResolver:
+    """Tests for futures resolution."""
+
+    def test_three_monthly_contracts(self, stock: Asset) -> None:
+        """Stocks get three contracts expiring on Fridays."""
+        instruments = FutureResolver().resolve(stock, "Test Broker", (1.0, 100.0))
+
+        assert len(instruments) == 3
+        assert all(i.expiry_date.weekday() == 4 for i in instruments)
+        assert all(15 <= i.expiry_date.day <= 21 for i in instruments)
+
+    def test_crypto_has_no_futures(self, stock: Asset) -> None:
+        """Crypto underlyings are not supported."""
+        btc = Asset(
+            symbol="BTC-USD",
+            name="Bitcoin",
+            asset_class=AssetClass.CRYPTO,
+            asset_type=AssetType.CRYPTO,
+            exchange="COINBASE",
+            listing_date=datetime(2015, 1, 1).date(),
+        )
+
+        assert FutureResolver().resolve(btc, "Test Broker", (1.0, 100.0)) == []
+
+
+class TestThirdFriday:
+    """Tests for the third-Friday helper."""
+
+    @pytest.mark.parametrize(
+        ("year", "month", "ahead", "expected"),
+        [
+            (2024, 1, 1, (2024, 2, 16)),
+            (2024, 11, 2, (2025, 1, 17)),
+            (2024, 12, 13, (2026, 1, 16)),
+            (2024, 3, 0, (2024, 3, 15)),
+        ],
+    )
+    def test_rolls_over_years(self, year, month, ahead, expected) -> None:
+        """Month offsets past December roll into following years."""
+        assert _third_friday(year, month, ahead) == expected
@@ -2,14 +2,21 @@
 Unit Tests for LiquidityFilter.
 
 Test Aspects Covered:
-    ✅ Business Logic: Correct liquidity calculations
+    ✅ Business Logic: Correct liquidity calculations, cached volumes, averages, columns
+    ✅ Dispatch: Homogeneous universes use their class check directly, mixed ones fall back
+    ✅ Concurrency: Sharded checks on worker threads keep sequential order
+    ✅ Batch: check_liquidity_batch is preferred and matches per-asset checks
+    ✅ Registration: Most-derived check override wins, invalid strategies raise
+    ✅ State: Opt-in outcome memo per (symbol, data window), clearable; thresholds read once
     ✅ Edge Cases: Missing data, zero volume
 """
 
 from __future__ import annotations
 
+import threading
 from datetime import date, datetime, timedelta
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
@@ -269,3 +276,448 @@ class TestStockLiquidityStrategy:
         # Assert
         assert is_valid is False
         assert "dollar_volume" in reason.lower()
+
+
+class TestDollarVolumeColumn:
+    """Test cases for the cached dollar volume column path."""
+
+    @pytest.fixture
+    def asset(self) -> Asset:
+        """Create a stock asset."""
+        return Asset(
+            symbol="LIQUID",
+            name="Liquid Corp",
+            asset_class=AssetClass.STOCK,
+            asset_type=AssetType.COMMON_STOCK,
+            exchange="NYSE",
+            listing_date=date(2000, 1, 1),
+        )
+
+    def test_context_caches_column(self, asset: Asset) -> None:
+        """
+        SCENARIO: Dollar volumes requested twice for one symbol
+        EXPECTED: Same packed array, matching the rows
+        """
+        rows = create_market_data(days=5, avg_price=10.0, avg_volume=300)
+        context = DataContext(assets=[asset], market_data={"LIQUID": rows})
+
+        column = context.get_dollar_volumes("LIQUID")
+
+        assert context.get_dollar_volumes("LIQUID") is column
+        assert list(column) == [d.dollar_volume for d in rows]
+        assert len(context.get_dollar_volumes("MISSING")) == 0
+
+    def test_context_caches_market_columns(self, asset: Asset) -> None:
+        """
+        SCENARIO: Market columns requested twice for one symbol
+        EXPECTED: Same columnar series, matching the rows
+        """
+        rows = create_market_data(days=5, avg_price=10.0, avg_volume=300)
+        context = DataContext(assets=[asset], market_data={"LIQUID": rows})
+
+        columns = context.get_market_columns("LIQUID")
+
+        assert context.get_market_columns("LIQUID") is columns
+        assert list(columns.iter_rows()) == rows
+        assert len(context.get_market_columns("MISSING")) == 0
+
+    def test_context_caches_average_dollar_volume(self, asset: Asset) -> None:
+        """
+        SCENARIO: Average dollar volume requested twice for one symbol
+        EXPECTED: Mean of the rows, cached without packing a column
+        """
+        rows = create_market_data(days=5, avg_price=10.0, avg_volume=300)
+        context = DataContext(assets=[asset], market_data={"LIQUID": rows})
+
+        assert context.get_avg_dollar_volume("LIQUID") == pytest.approx(3_000.0)
+        assert context._avg_dollar_volumes == {"LIQUID": pytest.approx(3_000.0)}
+        assert context._dollar_volumes == {}
+        assert context.get_avg_dollar_volume("MISSING") is None
+
+    def test_row_only_strategy_still_supported(
+        self, filter_config: LiquidityFilterConfig, asset: Asset
+    ) -> None:
+        """
+        SCENARIO: Custom strategy without check_dollar_volumes
+        EXPECTED: Filter falls back to passing MarketData rows
+        """
+        seen = []
+
+        class RowStrategy:
+            def check_liquidity(self, asset, market_data):
+                seen.append(len(market_data))
+                return True, ""
+
+        filter_ = LiquidityFilter(filter_config)
+        filter_.register_strategy(AssetClass.STOCK, RowStrategy())
+        context = DataContext(
+            assets=[asset], market_data={"LIQUID": create_market_data(days=3)}
+        )
+
+        result = filter_.apply([asset], datetime(2024, 12, 15), context)
+
+        assert result.passed_assets == ["LIQUID"]
+        assert seen == [3]
+
+
+class TestParallelChecks:
+    """Test cases for the optional worker threads."""
+
+    def test_lazy_loads_run_on_workers_in_order(
+        self, filter_config: LiquidityFilterConfig
+    ) -> None:
+        """
+        SCENARIO: Lazily loaded market data checked on 3 threads
+        EXPECTED: Loads run on worker threads; result equals the sequential one
+        """
+        assets = [
+            Asset(
+                symbol=f"S{i}",
+                name=f"Stock {i}",
+                asset_class=AssetClass.STOCK,
+                asset_type=AssetType.COMMON_STOCK,
+                exchange="NYSE",
+                listing_date=date(2000, 1, 1),
+            )
+            for i in range(9)
+        ]
+        threads = set()
+
+        def loader(symbol: str) -> List[MarketData]:
+            threads.add(threading.current_thread().name)
+            # Odd symbols are too illiquid
+            volume = 10_000 if int(symbol[1:]) % 2 else 100_000
+            return create_market_data(avg_volume=volume)
+
+        def context() -> DataContext:
+            return DataContext(assets=assets, lazy_loading=True, market_data_loader=loader)
+
+        parallel = LiquidityFilter(filter_config, max_workers=3)
+        try:
+            result = parallel.apply(assets, datetime(2024, 12, 15), context())
+        finally:
+            parallel.close()
+
+        assert all(name.startswith("liquidity-filter") for name in threads)
+        assert result == LiquidityFilter(filter_config).apply(
+            assets, datetime(2024, 12, 15), context()
+        )
+        assert result.passed_assets == ["S0", "S2", "S4", "S6", "S8"]
+
+
+class TestAssetClassDispatch:
+    """Test cases for homogeneous versus mixed universes."""
+
+    @staticmethod
+    def _asset(symbol: str, asset_class: AssetClass) -> Asset:
+        """Create an asset of the given class."""
+        return Asset(
+            symbol=symbol,
+            name=symbol,
+            asset_class=asset_class,
+            asset_type=AssetType.COMMON_STOCK,
+            exchange="NYSE",
+            listing_date=date(2000, 1, 1),
+        )
+
+    def test_homogeneous_universe_skips_class_lookup(
+        self, filter_config: LiquidityFilterConfig
+    ) -> None:
+        """
+        SCENARIO: Only stocks, one liquid and one illiquid
+        EXPECTED: Stock check runs directly, polymorphic check is never built
+        """
+        assets = [self._asset("LIQ", AssetClass.STOCK), self._asset("ILL", AssetClass.STOCK)]
+        context = DataContext(
+            assets=assets,
+            market_data={
+                "LIQ": create_market_data(avg_volume=100_000),
+                "ILL": create_market_data(avg_volume=1_000),
+            },
+        )
+        filter_ = LiquidityFilter(filter_config)
+
+        with patch.object(filter_, "asset_check", wraps=filter_.asset_check) as spy:
+            result = filter_.apply(assets, datetime(2024, 12, 15), context)
+
+        spy.assert_not_called()
+        assert result.passed_assets == ["LIQ"]
+        assert result.rejected_assets == ["ILL"]
+
+    def test_class_without_strategy_passes(
+        self, filter_config: LiquidityFilterConfig
+    ) -> None:
+        """
+        SCENARIO: Crypto strategy removed, universe all crypto or mixed
+        EXPECTED: Crypto passes unchecked; stocks in a mix are still checked
+        """
+        filter_ = LiquidityFilter(filter_config)
+        filter_.unregister_strategy(AssetClass.CRYPTO)
+        crypto = self._asset("BTC", AssetClass.CRYPTO)
+        stock = self._asset("ILL", AssetClass.STOCK)
+        context = DataContext(
+            assets=[crypto, stock],
+            market_data={"ILL": create_market_data(avg_volume=1_000)},
+        )
+
+        only_crypto = filter_.apply([crypto], datetime(2024, 12, 15), context)
+        mixed = filter_.apply([crypto, stock], datetime(2024, 12, 15), context)
+
+        assert only_crypto.passed_assets == ["BTC"]
+        assert mixed.passed_assets == ["BTC"]
+        assert mixed.rejected_assets == ["ILL"]
+
+
+class TestBatchStrategy:
+    """Test cases for strategies implementing check_liquidity_batch."""
+
+    @pytest.fixture
+    def assets(self) -> List[Asset]:
+        """Create six stocks; odd ones are illiquid."""
+        return [
+            Asset(
+                symbol=f"S{i}",
+                name=f"Stock {i}",
+                asset_class=AssetClass.STOCK,
+                asset_type=AssetType.COMMON_STOCK,
+                exchange="NYSE",
+                listing_date=date(2000, 1, 1),
+            )
+            for i in range(6)
+        ]
+
+    @pytest.fixture
+    def context(self, assets: List[Asset]) -> DataContext:
+        """Create market data for the stocks."""
+        return DataContext(
+            assets=assets,
+            market_data={
+                a.symbol: create_market_data(avg_volume=1_000 if i % 2 else 100_000)
+                for i, a in enumerate(assets)
+            },
+        )
+
+    def test_batch_matches_per_asset_checks(
+        self, filter_config: LiquidityFilterConfig, assets, context
+    ) -> None:
+        """
+        SCENARIO: Stock batch check, sequential and sharded on 2 threads
+        EXPECTED: Same outcomes as checking each asset on its own
+        """
+        strategy = StockLiquidityStrategy(filter_config.stock)
+        per_asset = [
+            strategy.check_dollar_volumes(a, context.get_dollar_volumes(a.symbol))
+            for a in assets
+        ]
+
+        assert strategy.check_liquidity_batch(assets, context) == per_asset
+
+        parallel = LiquidityFilter(filter_config, max_workers=2)
+        try:
+            result = parallel.apply(assets, datetime(2024, 12, 15), context)
+        finally:
+            parallel.close()
+        assert result.passed_assets == ["S0", "S2", "S4"]
+
+    def test_filter_prefers_batch(
+        self, filter_config: LiquidityFilterConfig, assets, context
+    ) -> None:
+        """
+        SCENARIO: Custom strategy with both batch and per-asset checks
+        EXPECTED: Filter calls the batch check once for all assets
+        """
+        calls = []
+
+        class BatchOnly:
+            def check_liquidity(self, asset, market_data):
+                raise AssertionError("per-asset check should not run")
+
+            def check_liquidity_batch(self, shard, context):
+                calls.append(len(shard))
+                return [(asset.symbol != "S3", "too thin") for asset in shard]
+
+        filter_ = LiquidityFilter(filter_config)
+        filter_.register_strategy(AssetClass.STOCK, BatchOnly())
+
+        result = filter_.apply(assets, datetime(2024, 12, 15), context)
+
+        assert calls == [6]
+        assert result.rejected_assets == ["S3"]
+        assert result.rejection_reasons == {"S3": "too thin"}
+
+
+    def test_reregistering_drops_batch_check(
+        self, filter_config: LiquidityFilterConfig, assets, context
+    ) -> None:
+        """
+        SCENARIO: Stock strategy replaced by one without a batch check
+        EXPECTED: Filter dispatches to the new per-asset check only
+        """
+        seen = []
+
+        class RowStrategy:
+            def check_liquidity(self, asset, market_data):
+                seen.append(asset.symbol)
+                return True, ""
+
+        filter_ = LiquidityFilter(filter_config)
+        filter_.register_strategy(AssetClass.STOCK, RowStrategy())
+
+        result = filter_.apply(assets, datetime(2024, 12, 15), context)
+
+        assert seen == [a.symbol for a in assets]
+        assert result.rejected_assets == []
+
+
+    def test_subclass_override_is_not_bypassed(
+        self, filter_config: LiquidityFilterConfig, assets, context
+    ) -> None:
+        """
+        SCENARIO: Stock strategy subclass overriding only check_liquidity
+        EXPECTED: The override runs; inherited batch/column checks are skipped
+        """
+        seen = []
+
+        class Strict(StockLiquidityStrategy):
+            def check_liquidity(self, asset, market_data):
+                seen.append(asset.symbol)
+                return False, "strict"
+
+        filter_ = LiquidityFilter(filter_config)
+        filter_.register_strategy(AssetClass.STOCK, Strict(filter_config.stock))
+
+        result = filter_.apply(assets, datetime(2024, 12, 15), context)
+
+        assert seen == [a.symbol for a in assets]
+        assert result.passed_assets == []
+
+    def test_strategy_without_checks_is_rejected(
+        self, filter_config: LiquidityFilterConfig, assets, context
+    ) -> None:
+        """
+        SCENARIO: Registering an object with no check method
+        EXPECTED: TypeError, and the previous strategy stays registered
+        """
+        filter_ = LiquidityFilter(filter_config)
+
+        with pytest.raises(TypeError, match="check_liquidity"):
+            filter_.register_strategy(AssetClass.STOCK, object())
+
+        result = filter_.apply(assets, datetime(2024, 12, 15), context)
+        assert result.passed_assets == ["S0", "S2", "S4"]
+
+class TestOutcomeMemo:
+    """Test cases for StockLiquidityStrategy's per-window memo."""
+
+    @pytest.fixture
+    def asset(self) -> Asset:
+        """Create a stock asset."""
+        return Asset(
+            symbol="LIQUID",
+            name="Liquid Corp",
+            asset_class=AssetClass.STOCK,
+            asset_type=AssetType.COMMON_STOCK,
+            exchange="NYSE",
+            listing_date=date(2000, 1, 1),
+        )
+
+    def _screen(self, strategy: StockLiquidityStrategy, asset: Asset, rows: List[MarketData]):
+        """Check one asset on a fresh context, as each screening date does."""
+        context = DataContext(assets=[asset], market_data={asset.symbol: rows})
+        with patch.object(
+            context, "get_avg_dollar_volume", wraps=context.get_avg_dollar_volume
+        ) as spy:
+            outcome = strategy.check_liquidity_batch([asset], context)
+        return outcome, spy.call_count
+
+    def test_same_window_hits_memo(
+        self, filter_config: LiquidityFilterConfig, asset: Asset
+    ) -> None:
+        """
+        SCENARIO: Same window screened twice, then one more bar
+        EXPECTED: Second screen reuses the outcome; the new window recomputes
+        """
+        strategy = StockLiquidityStrategy(filter_config.stock, cache_size=100)
+        rows = create_market_data(avg_volume=1_000)
+
+        first, first_calls = self._screen(strategy, asset, rows)
+        second, second_calls = self._screen(strategy, asset, list(rows))
+        _, longer_calls = self._screen(strategy, asset, rows + create_market_data(days=1))
+
+        assert first == second
+        assert first[0][0] is False
+        assert (first_calls, second_calls, longer_calls) == (1, 0, 1)
+
+    def test_row_path_shares_memo(
+        self, filter_config: LiquidityFilterConfig, asset: Asset
+    ) -> None:
+        """
+        SCENARIO: Window checked by the batch path, then by check_liquidity
+        EXPECTED: Row check returns the memoized outcome, formatted
+        """
+        strategy = StockLiquidityStrategy(filter_config.stock, cache_size=100)
+        rows = create_market_data(avg_volume=1_000)
+        self._screen(strategy, asset, rows)
+
+        with patch.object(strategy, "check_dollar_volumes") as recompute:
+            is_liquid, reason = strategy.check_liquidity(asset, rows)
+
+        recompute.assert_not_called()
+        assert is_liquid is False
+        assert reason.startswith("avg_dollar_volume=$100,000 < min=")
+
+    def test_disabled_and_cleared_memo_recompute(
+        self, filter_config: LiquidityFilterConfig, asset: Asset
+    ) -> None:
+        """
+        SCENARIO: Default (no memo), and clear_cache() between screens
+        EXPECTED: Every screen recomputes the average
+        """
+        rows = create_market_data()
+        uncached = StockLiquidityStrategy(filter_config.stock)
+        cached = StockLiquidityStrategy(filter_config.stock, cache_size=100)
+
+        calls = [self._screen(uncached, asset, rows)[1] for _ in range(2)]
+        self._screen(cached, asset, rows)
+        cached.clear_cache()
+        calls.append(self._screen(cached, asset, rows)[1])
+
+        assert calls == [1, 1, 1]
+
+    def test_default_rechecks_changed_bars(
+        self, filter_config: LiquidityFilterConfig, asset: Asset
+    ) -> None:
+        """
+        SCENARIO: Liquid run, then an illiquid run over the same dates
+        EXPECTED: Without opting into the memo, the second run rejects
+        """
+        filter_ = LiquidityFilter(filter_config)
+
+        liquid = DataContext(assets=[asset], market_data={asset.symbol: create_market_data()})
+        illiquid = DataContext(
+            assets=[asset], market_data={asset.symbol: create_market_data(avg_volume=1_000)}
+        )
+
+        assert filter_.apply([asset], datetime(2024, 12, 15), liquid).passed_assets == ["LIQUID"]
+        assert filter_.apply([asset], datetime(2024, 12, 15), illiquid).passed_assets == []
+
+    def test_thresholds_are_read_once(
+        self, filter_config: LiquidityFilterConfig, asset: Asset
+    ) -> None:
+        """
+        SCENARIO: Config mutated after the strategy was built
+        EXPECTED: Memoized and unmemoized checks both keep the original thresholds
+        """
+        rows = create_market_data()
+        strategies = [
+            StockLiquidityStrategy(filter_config.stock),
+            StockLiquidityStrategy(filter_config.stock, cache_size=100),
+        ]
+        before = [self._screen(s, asset, rows)[0] for s in strategies]
+
+        filter_config.stock.min_avg_dollar_volume_usd = 1e12
+        after = [self._screen(s, asset, rows)[0] for s in strategies]
+        after.append(StockLiquidityStrategy(filter_config.stock).check_liquidity(asset, rows))
+
+        assert before == after[:2] == [[(True, "")]] * 2
+        assert after[2][0] is False
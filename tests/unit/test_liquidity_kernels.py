@@ -0,0 +1,55 @@
+"""
+Unit Tests for Liquidity Kernels.
+
+Test Aspects Covered:
+    ✅ Business Logic: Mean, crypto depth/slippage model, relative range sum
+    ✅ Edge Cases: Zero depth, non-positive bars, empty columns
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+
+from universe_screener.filters import liquidity_kernels as kernels
+
+
+class TestCryptoDepthSlippage:
+    """Tests for crypto_depth_slippage."""
+
+    def test_depth_and_slippage(self) -> None:
+        """Depth is 5% of mean volume; slippage follows the $100k model."""
+        depth, slippage = kernels.crypto_depth_slippage(array("d", [1e6, 3e6]))
+
+        assert depth == 100_000
+        assert slippage == 50.0
+
+    def test_zero_depth_has_infinite_slippage(self) -> None:
+        """No volume means no depth instead of a division error."""
+        depth, slippage = kernels.crypto_depth_slippage([0.0, 0.0])
+
+        assert depth == 0
+        assert math.isinf(slippage)
+
+
+class TestRelativeRangeSum:
+    """Tests for relative_range_sum."""
+
+    def test_all_bars_summed(self) -> None:
+        """Every positive bar contributes (high - low) / close."""
+        total, count = kernels.relative_range_sum(
+            array("d", [11.0, 22.0]), array("d", [9.0, 18.0]), array("d", [10.0, 20.0])
+        )
+
+        assert count == 2
+        assert total == 0.4
+
+    def test_non_positive_bars_skipped(self) -> None:
+        """Bars with a zero high or low are left out of sum and count."""
+        total, count = kernels.relative_range_sum([11.0, 0.0], [9.0, 0.0], [10.0, 10.0])
+
+        assert (total, count) == (0.2, 1)
+
+    def test_empty_columns(self) -> None:
+        """Empty input sums to zero bars."""
+        assert kernels.relative_range_sum([], [], []) == (0.0, 0)
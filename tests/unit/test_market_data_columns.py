@@ -0,0 +1,87 @@
+"""
+Unit Tests for MarketDataColumns.
+
+Test Aspects Covered:
+    ✅ Business Logic: Row/column round trip, date range slicing, deep size,
+        materialized dollar volume
+    ✅ Edge Cases: Empty series, range outside data
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+
+from universe_screener.domain.value_objects import MarketData, MarketDataColumns
+
+
+def _rows() -> list:
+    """Three daily bars in January 2024."""
+    return [
+        MarketData(
+            date=datetime(2024, 1, day),
+            open=100.0 + day,
+            high=101.0 + day,
+            low=99.0 + day,
+            close=100.5 + day,
+            volume=1000 * day,
+        )
+        for day in (2, 3, 4)
+    ]
+
+
+class TestMarketDataColumns:
+    """Tests for the columnar market data series."""
+
+    def test_round_trip(self) -> None:
+        """Rows rebuilt from columns equal the originals."""
+        rows = _rows()
+
+        columns = MarketDataColumns.from_rows(rows)
+
+        assert len(columns) == 3
+        assert list(columns.close) == [r.close for r in rows]
+        assert list(columns.iter_rows()) == rows
+
+    def test_between_is_inclusive(self) -> None:
+        """Both range bounds are included."""
+        columns = MarketDataColumns.from_rows(_rows())
+
+        sliced = columns.between(datetime(2024, 1, 3), datetime(2024, 1, 4))
+
+        assert sliced.dates == (datetime(2024, 1, 3), datetime(2024, 1, 4))
+        assert list(sliced.volume) == [3000, 4000]
+
+    def test_between_outside_data_is_empty(self) -> None:
+        """A range without bars yields an empty series."""
+        columns = MarketDataColumns.from_rows(_rows())
+
+        assert len(columns.between(datetime(2023, 1, 1), datetime(2023, 12, 31))) == 0
+        assert len(MarketDataColumns.from_rows([])) == 0
+
+    def test_sizeof_includes_columns(self) -> None:
+        """sys.getsizeof counts the packed column buffers."""
+        columns = MarketDataColumns.from_rows(_rows())
+
+        assert sys.getsizeof(columns) > sum(
+            sys.getsizeof(c) for c in (columns.open, columns.close, columns.volume)
+        )
+
+
+class TestMarketData:
+    """Tests for the row value object."""
+
+    def test_dollar_volume_is_materialized(self) -> None:
+        """dollar_volume is stored at construction and ignored by equality."""
+        bar = _rows()[0]
+
+        assert bar.dollar_volume == bar.close * bar.volume
+        assert "dollar_volume" not in repr(bar)
+        assert bar == MarketData(
+            date=bar.date,
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+        )
@@ -0,0 +1,88 @@
+"""
+Unit Tests for InMemoryMetricsCollector.
+
+Test Aspects Covered:
+    ✅ Business Logic: Running count/total/last per metric
+    ✅ Edge Cases: Non-numeric values, clear
+    ✅ State: Merging per-thread buckets
+"""
+
+from __future__ import annotations
+
+import threading
+
+from universe_screener.adapters.metrics_collector import InMemoryMetricsCollector
+
+
+class TestInMemoryMetricsCollector:
+    """Tests for metric aggregation."""
+
+    def test_aggregates_count_total_last(self) -> None:
+        """Repeated records update count, total and last value."""
+        collector = InMemoryMetricsCollector()
+
+        collector.record_timing("stage", 0.5)
+        collector.record_timing("stage", 1.5)
+        collector.record_count("rows", 3)
+
+        metrics = collector.get_metrics()
+
+        assert metrics["stage"] == {"count": 2, "total": 2.0, "last": 1.5}
+        assert metrics["rows"] == {"count": 1, "total": 3, "last": 3}
+
+    def test_non_numeric_values_have_no_total(self) -> None:
+        """Totals are None for non-numeric metrics."""
+        collector = InMemoryMetricsCollector()
+
+        collector.record_gauge("status", "ok")  # type: ignore[arg-type]
+
+        assert collector.get_metrics()["status"]["total"] is None
+
+    def test_clear_removes_metrics(self) -> None:
+        """Clear drops all recorded metrics."""
+        collector = InMemoryMetricsCollector()
+        collector.record_count("rows", 1)
+
+        collector.clear()
+
+        assert collector.get_metrics() == {}
+
+    def test_merges_metrics_from_threads(self) -> None:
+        """Metrics recorded on different threads are combined."""
+        collector = InMemoryMetricsCollector()
+
+        def worker() -> None:
+            for _ in range(100):
+                collector.record_count("rows", 1)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        collector.record_count("rows", 5)
+
+        metrics = collector.get_metrics()
+
+        assert metrics["rows"]["count"] == 401
+        assert metrics["rows"]["total"] == 405
+        assert metrics["rows"]["last"] == 5
+
+    def test_cached_summary_sees_new_records(self) -> None:
+        """A record after get_metrics invalidates the cached summary."""
+        collector = InMemoryMetricsCollector()
+        collector.record_count("rows", 1)
+        collector.get_metrics()
+
+        collector.record_count("rows", 2)
+
+        assert collector.get_metrics()["rows"]["total"] == 3
+
+    def test_returned_summary_is_a_copy(self) -> None:
+        """Mutating a returned summary does not affect later calls."""
+        collector = InMemoryMetricsCollector()
+        collector.record_count("rows", 1)
+
+        collector.get_metrics()["rows"]["count"] = 99
+
+        assert collector.get_metrics()["rows"]["count"] == 1
@@ -0,0 +1,109 @@
+"""
+Unit Tests for lazily formatted rejection reasons.
+
+Test Aspects Covered:
+    ✅ Business Logic: Reason codes format to the legacy messages, dict-like reads,
+        bulk construction from parallel lists
+    ✅ State: Formatting happens once and only on read
+    ✅ Serialization: StageResult dumps lazy reasons as a plain dict
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pydantic import TypeAdapter
+
+from universe_screener.adapters.console_logger import ConsoleAuditLogger
+from universe_screener.domain.entities import StageResult
+from universe_screener.domain.value_objects import (
+    ReasonCode,
+    RejectionReasons,
+    format_reason,
+)
+
+
+class TestFormatReason:
+    """Tests for format_reason."""
+
+    def test_code_formats_with_args(self) -> None:
+        """Templates keep the thousands separators and percentages."""
+        assert (
+            format_reason((ReasonCode.DOLLAR_VOLUME_LOW, (594_752.3, 1_000_000)))
+            == "avg_dollar_volume=$594,752 < min=$1,000,000"
+        )
+        assert (
+            format_reason((ReasonCode.TRADING_DAYS_PCT_LOW, (0.7561, 0.9)))
+            == "trading_days_pct=75.61% < min=90.00%"
+        )
+
+    def test_message_passes_through(self) -> None:
+        """Plain strings from custom strategies are returned unchanged."""
+        assert format_reason("custom reason") == "custom reason"
+
+
+class TestRejectionReasons:
+    """Tests for the RejectionReasons mapping."""
+
+    def test_reads_like_a_dict(self) -> None:
+        """Codes and messages read back as formatted strings."""
+        reasons = RejectionReasons()
+        reasons["A"] = (ReasonCode.MISSING_DAYS_HIGH, (10, 3))
+        reasons["B"] = "custom reason"
+
+        assert reasons == {"A": "missing_days=10 > max=3", "B": "custom reason"}
+        assert list(reasons) == ["A", "B"]
+        assert reasons.get("C") is None
+        assert reasons.code("A") is ReasonCode.MISSING_DAYS_HIGH
+        assert reasons.code("B") is None
+
+    def test_from_pairs_matches_item_writes(self) -> None:
+        """Building from parallel lists equals writing item by item."""
+        symbols = ["A", "B", "A"]
+        codes = [
+            (ReasonCode.NEWS_COUNT_LOW, (0, 1)),
+            "custom reason",
+            (ReasonCode.MISSING_DAYS_HIGH, (10, 3)),
+        ]
+        written = RejectionReasons()
+        for symbol, reason in zip(symbols, codes):
+            written[symbol] = reason
+
+        built = RejectionReasons.from_pairs(symbols, codes)
+
+        assert built == written == {"A": "missing_days=10 > max=3", "B": "custom reason"}
+        assert built.code("A") is ReasonCode.MISSING_DAYS_HIGH
+
+    def test_formats_once_on_read(self) -> None:
+        """Nothing is formatted until read, then the message is reused."""
+        reasons = RejectionReasons()
+        reasons["A"] = (ReasonCode.DELISTED, ("2023-06-01",))
+
+        with patch(
+            "universe_screener.domain.value_objects.format_reason", wraps=format_reason
+        ) as spy:
+            assert "A" in reasons and len(reasons) == 1
+            spy.assert_not_called()
+            assert reasons["A"] == reasons["A"] == "delisted on 2023-06-01"
+
+        spy.assert_called_once()
+
+    def test_stage_result_serializes_as_dict(self) -> None:
+        """Dumping a StageResult formats lazy reasons into a plain dict."""
+        reasons = RejectionReasons()
+        reasons["A"] = (ReasonCode.NO_MARKET_DATA, ())
+        stage = StageResult("liquidity_filter", 1, 0, 0.1, ["A"], reasons)
+
+        dumped = TypeAdapter(StageResult).dump_python(stage)
+
+        assert dumped["filter_reasons"] == {"A": "no market data available"}
+        assert type(dumped["filter_reasons"]) is dict
+
+
+class TestAuditOptOut:
+    """Tests for the audit logger's filtered-asset capability."""
+
+    def test_console_logger_reports_verbosity(self) -> None:
+        """Only verbose console loggers consume per-asset reasons."""
+        assert ConsoleAuditLogger(verbose=True).logs_filtered_assets is True
+        assert ConsoleAuditLogger(verbose=False).logs_filtered_assets is False
@@ -8,7 +8,7 @@ Test Aspects Covered:
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import List
 
 import pytest
@@ -264,3 +264,71 @@ class TestStructuralFilter:
         assert "GOOD1" in result.passed_assets
         assert "GOOD2" in result.passed_assets
         assert "BAD1" in result.rejected_assets
+
+    def test_listing_age_and_delisting_boundaries(
+        self,
+        filter_config: StructuralFilterConfig,
+        empty_context: DataContext,
+    ) -> None:
+        """
+        SCENARIO: Listed exactly min age / one day short; delisted on / after date
+        EXPECTED: Same boundaries as the per-check reasons (>= age, delisted <=)
+        """
+        # Arrange
+        filter_ = StructuralFilter(filter_config)
+        ref_date = datetime(2024, 12, 15)
+        cutoff = ref_date.date() - timedelta(days=filter_config.min_listing_age_days)
+
+        def stock(symbol: str, listing: date, delisting=None) -> Asset:
+            return Asset(
+                symbol=symbol,
+                name=symbol,
+                asset_class=AssetClass.STOCK,
+                asset_type=AssetType.COMMON_STOCK,
+                exchange="NYSE",
+                listing_date=listing,
+                delisting_date=delisting,
+            )
+
+        assets = [
+            stock("EXACT", cutoff),
+            stock("SHORT", cutoff + timedelta(days=1)),
+            stock("DELISTED_TODAY", cutoff, ref_date.date()),
+            stock("DELISTED_LATER", cutoff, ref_date.date() + timedelta(days=1)),
+        ]
+
+        # Act
+        result = filter_.apply(assets, ref_date, empty_context)
+
+        # Assert
+        assert result.passed_assets == ["EXACT", "DELISTED_LATER"]
+        assert result.rejection_reasons["SHORT"] == "listing_age=251d < min=252d"
+        assert "delisted" in result.rejection_reasons["DELISTED_TODAY"]
+
+    def test_filters_disallowed_asset_type(
+        self,
+        filter_config: StructuralFilterConfig,
+        empty_context: DataContext,
+    ) -> None:
+        """
+        SCENARIO: ETF when only COMMON_STOCK is allowed
+        EXPECTED: Rejected with the asset type's value in the reason
+        """
+        # Arrange
+        filter_ = StructuralFilter(filter_config)
+        assets = [
+            Asset(
+                symbol="SPY",
+                name="S&P 500 ETF",
+                asset_class=AssetClass.STOCK,
+                asset_type=AssetType.ETF,
+                exchange="NYSE",
+                listing_date=date(2000, 1, 1),
+            )
+        ]
+
+        # Act
+        result = filter_.apply(assets, datetime(2024, 12, 15), empty_context)
+
+        # Assert
+        assert result.rejection_reasons == {"SPY": "asset_type=ETF not in allowed list"}
@@ -6,6 +6,8 @@ Tests:
     - Knockout level calculation
     - Multiple leverage products
     - Long and short Turbos
+    - Pruning by cost and expiry criteria
+    - Memoized results
 """
 
 from __future__ import annotations
@@ -256,6 +258,44 @@ class TestTurboExpiry:
             assert 55 <= days_to_expiry <= 65
 
 
+class TestTurboPruning:
+    """Tests for filter criteria pushed into resolve."""
+
+    @pytest.fixture
+    def asset(self) -> Asset:
+        """Create a stock underlying."""
+        return Asset(
+            symbol="AAPL",
+            name="Apple Inc",
+            asset_class=AssetClass.STOCK,
+            asset_type=AssetType.COMMON_STOCK,
+            exchange="NASDAQ",
+            listing_date=datetime(2000, 1, 1).date(),
+        )
+
+    def test_skips_when_costs_exceed_limit(
+        self, default_resolver: TurboResolver, asset: Asset
+    ) -> None:
+        """No Turbos are built if their cost is above max_trading_costs."""
+        instruments = default_resolver.resolve(
+            asset, "Test Broker", (5.0, 20.0), max_trading_costs=0.05
+        )
+
+        assert instruments == []
+
+    def test_skips_when_expiring_before_cutoff(
+        self, default_resolver: TurboResolver, asset: Asset
+    ) -> None:
+        """No Turbos are built if they expire before the cutoff."""
+        cutoff = datetime.now() + timedelta(days=45)
+
+        instruments = default_resolver.resolve(
+            asset, "Test Broker", (5.0, 20.0), min_expiry_cutoff=cutoff
+        )
+
+        assert instruments == []
+
+
 class TestTurboInstrumentDetails:
     """Tests for Turbo instrument details."""
 
@@ -328,3 +368,88 @@ class TestTurboInstrumentDetails:
             assert "barrier_type" in turbo.metadata
             assert turbo.metadata["barrier_type"] == "KNOCKOUT"
 
+
+    def test_metadata_shared_per_direction(self, default_resolver: TurboResolver) -> None:
+        """Turbos of one direction share a single read-only metadata mapping."""
+        asset = Asset(
+            symbol="SAP",
+            name="SAP SE",
+            asset_class=AssetClass.STOCK,
+            asset_type=AssetType.COMMON_STOCK,
+            exchange="XETRA",
+            listing_date=datetime(2000, 1, 1).date(),
+        )
+
+        instruments = default_resolver.resolve(asset, "Test Broker", (5.0, 20.0))
+
+        longs = [i for i in instruments if i.metadata["direction"] == "LONG"]
+        assert len(longs) > 1
+        assert all(i.metadata is longs[0].metadata for i in longs)
+        with pytest.raises(TypeError):
+            longs[0].metadata["direction"] = "SHORT"
+
+
+class TestTurboResultCache:
+    """Tests for memoized resolution."""
+
+    @pytest.fixture
+    def asset(self) -> Asset:
+        """Create a stock underlying."""
+        return Asset(
+            symbol="SAP",
+            name="SAP SE",
+            asset_class=AssetClass.STOCK,
+            asset_type=AssetType.COMMON_STOCK,
+            exchange="XETRA",
+            listing_date=datetime(2000, 1, 1).date(),
+        )
+
+    def test_repeat_call_reuses_instruments(
+        self, default_resolver: TurboResolver, asset: Asset
+    ) -> None:
+        """Identical calls return the same instruments in a new list."""
+        first = default_resolver.resolve(asset, "Test Broker", (5.0, 20.0))
+        second = default_resolver.resolve(asset, "Test Broker", (5.0, 20.0))
+
+        assert second is not first
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_criteria_are_part_of_the_key(
+        self, default_resolver: TurboResolver, asset: Asset
+    ) -> None:
+        """A call with different pruning criteria is resolved afresh."""
+        assert default_resolver.resolve(asset, "Test Broker", (5.0, 20.0))
+
+        assert (
+            default_resolver.resolve(asset, "Test Broker", (5.0, 20.0), max_trading_costs=0.01)
+            == []
+        )
+
+    def test_expiry_cutoff_is_applied_to_cached_results(
+        self, default_resolver: TurboResolver, asset: Asset
+    ) -> None:
+        """Clock-derived cutoffs share one entry and still filter by expiry."""
+        near = [datetime.now() + timedelta(days=days) for days in (1, 2, 3)]
+        far = datetime.now() + timedelta(days=45)
+
+        kept = [
+            default_resolver.resolve(asset, "Test Broker", (5.0, 20.0), min_expiry_cutoff=cutoff)
+            for cutoff in near
+        ]
+        dropped = default_resolver.resolve(
+            asset, "Test Broker", (5.0, 20.0), min_expiry_cutoff=far
+        )
+
+        assert len(default_resolver._results._entries) == 1
+        assert kept[0] and kept[0] == kept[1] == kept[2]
+        assert dropped == []
+
+    def test_clear_cache_rebuilds(self, default_resolver: TurboResolver, asset: Asset) -> None:
+        """clear_cache drops memoized results."""
+        first = default_resolver.resolve(asset, "Test Broker", (5.0, 20.0))
+
+        default_resolver.clear_cache()
+        second = default_resolver.resolve(asset, "Test Broker", (5.0, 20.0))
+
+        assert second[0] is not first[0]
+        assert second[0].symbol == first[0].symbol